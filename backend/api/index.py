@@ -1,4 +1,5 @@
 import os
+import threading
 from flask import Flask, jsonify
 from flask_cors import CORS
 from dotenv import load_dotenv
@@ -33,9 +34,33 @@ CORS(app, resources={r"/*": {"origins": get_origins()}}, supports_credentials=Tr
 from .routes.auth import auth_bp  # noqa: E402
 from .routes.issues import issues_bp  # noqa: E402
 from .routes.whitelist import whitelist_bp  # noqa: E402
+from .routes.admin import admin_bp  # noqa: E402
+from .routes.webhooks import webhooks_bp  # noqa: E402
+from .routes.stats import stats_bp  # noqa: E402
 app.register_blueprint(auth_bp)
 app.register_blueprint(issues_bp)
 app.register_blueprint(whitelist_bp)
+app.register_blueprint(admin_bp)
+app.register_blueprint(webhooks_bp)
+app.register_blueprint(stats_bp)
+
+# Prefetch the default issue views when the first request arrives, so the
+# next dashboard loads hit the cache. Never at import: scripts, CLIs and
+# serverless cold starts that only load the app must not query Jira.
+if os.getenv("JIRA_CACHE_WARM_ON_START", "false").lower() == "true":
+    from .services.jira_service import schedule_cache_warmup  # noqa: E402
+
+    _warm_lock = threading.Lock()
+    _warm_started = False
+
+    @app.before_request
+    def warm_cache_on_first_request():
+        global _warm_started
+        with _warm_lock:
+            if _warm_started:
+                return
+            _warm_started = True
+        schedule_cache_warmup()
 
 
 @app.route("/api/health", methods=["GET"])
@@ -62,11 +87,13 @@ def root():
             },
             "issues": {
                 "list": "GET /api/issues",
+                "facets": "GET /api/issues/facets",
                 "get": "GET /api/issues/{key}",
                 "create": "POST /api/issues",
                 "update": "PUT /api/issues/{key}",
                 "delete": "DELETE /api/issues/{key}",
                 "comments": "POST /api/issues/{key}/comments",
+                "history": "GET /api/issues/{key}/history",
                 "attachments": "POST /api/issues/{key}/attachments",
                 "updates": "GET /api/issues/updates",
             },
@@ -76,11 +103,37 @@ def root():
                 "remove": "DELETE /api/whitelist/{id}",
                 "check": "GET /api/whitelist/check/{email}",
             },
+            "admin": {
+                "jira_status": "GET /api/admin/jira/status",
+                "jira_circuit_reset": "POST /api/admin/jira/circuit/reset",
+            },
+            "stats": {
+                "summary": "GET /api/stats/summary",
+            },
+            "webhooks": {
+                "jira": "POST /api/webhooks/jira",
+            },
         }
     })
 
 
 # Error handlers
+from .services.circuit_breaker import CircuitOpenError  # noqa: E402
+from .services.deadline import DeadlineExceeded  # noqa: E402
+
+
+@app.errorhandler(CircuitOpenError)
+def jira_unavailable(error):
+    """Jira is failing and calls to it are paused; tell the client when to retry."""
+    return jsonify({"error": str(error), "retryAfter": int(error.retry_after) + 1}), 503
+
+
+@app.errorhandler(DeadlineExceeded)
+def deadline_exceeded(error):
+    """Jira calls could not finish within the request deadline."""
+    return jsonify({"error": str(error)}), 504
+
+
 @app.errorhandler(404)
 def not_found(error):
     return jsonify({"error": "Not found", "message": str(error)}), 404
@@ -55,6 +55,127 @@ CREATE INDEX IF NOT EXISTS idx_activity_log_user ON activity_log(user_id);
 CREATE INDEX IF NOT EXISTS idx_activity_log_created ON activity_log(created_at DESC);
 CREATE INDEX IF NOT EXISTS idx_activity_log_issue ON activity_log(jira_issue_key);
 
+-- ============================================
+-- Issues Mirror Table
+-- ============================================
+-- Local copy of the Relay issues in Jira, so issue lists are served by
+-- indexed queries instead of Jira searches
+-- Timestamps keep Jira's format, and the *_ts columns hold them as epoch seconds
+-- for sorting and comparison. tools lists the FilterBar tools the issue
+-- matches (by label or summary), for facet counts
+
+CREATE TABLE IF NOT EXISTS issues_mirror (
+  issue_key TEXT PRIMARY KEY,
+  jira_id TEXT,
+  summary TEXT,
+  description TEXT,
+  labels TEXT DEFAULT '[]',
+  tools TEXT DEFAULT '[]',
+  status TEXT COLLATE NOCASE,
+  priority TEXT COLLATE NOCASE,
+  issue_type TEXT COLLATE NOCASE,
+  reporter_email TEXT COLLATE NOCASE,
+  reporter_name TEXT,
+  reporter_avatar TEXT,
+  assignee_email TEXT COLLATE NOCASE,
+  assignee_name TEXT,
+  assignee_avatar TEXT,
+  created TEXT,
+  updated TEXT,
+  created_ts REAL,
+  updated_ts REAL,
+  synced_at REAL
+);
+
+CREATE INDEX IF NOT EXISTS idx_issues_mirror_created ON issues_mirror(created_ts DESC);
+CREATE INDEX IF NOT EXISTS idx_issues_mirror_status ON issues_mirror(status, created_ts DESC);
+CREATE INDEX IF NOT EXISTS idx_issues_mirror_priority ON issues_mirror(priority, created_ts DESC);
+CREATE INDEX IF NOT EXISTS idx_issues_mirror_type ON issues_mirror(issue_type, created_ts DESC);
+CREATE INDEX IF NOT EXISTS idx_issues_mirror_reporter ON issues_mirror(reporter_email, created_ts DESC);
+CREATE INDEX IF NOT EXISTS idx_issues_mirror_updated ON issues_mirror(updated_ts);
+-- Covers the facet count query, which groups by every facet column
+CREATE INDEX IF NOT EXISTS idx_issues_mirror_facets ON issues_mirror(status, priority, issue_type, tools);
+
+-- ============================================
+-- Issues Tombstones Table
+-- ============================================
+-- Issues removed from the mirror because they were deleted in Jira or no
+-- longer belong to Relay (moved to another project, label removed)
+
+CREATE TABLE IF NOT EXISTS issues_tombstones (
+  issue_key TEXT PRIMARY KEY,
+  jira_id TEXT,
+  reason TEXT,
+  deleted_at REAL
+);
+
+-- ============================================
+-- Issues Full-Text Index
+-- ============================================
+-- FTS5 index over issue summaries, descriptions and comments for the
+-- issue list's search filter. The rowid is the numeric Jira issue id.
+-- Rows are written by the application together with issues_mirror rows
+
+CREATE VIRTUAL TABLE IF NOT EXISTS issues_fts USING fts5(
+  issue_key UNINDEXED,
+  summary,
+  description,
+  comments,
+  tokenize = 'unicode61 remove_diacritics 2',
+  prefix = '2 3'
+);
+
+-- ============================================
+-- Issue Counters Table
+-- ============================================
+-- Number of mirrored issues per status, priority and type, and per pair of
+-- them (dimension "status,type" with value "In Progress|Bug"). Adjusted by
+-- the application whenever issues_mirror rows change, and rebuilt from
+-- issues_mirror periodically. The "total" dimension has an empty value
+
+CREATE TABLE IF NOT EXISTS issue_counters (
+  dimension TEXT NOT NULL,
+  value TEXT NOT NULL COLLATE NOCASE,
+  count INTEGER NOT NULL DEFAULT 0,
+  PRIMARY KEY (dimension, value)
+);
+
+-- ============================================
+-- Sync State Table
+-- ============================================
+-- Progress markers for background syncs (e.g. when the issues mirror
+-- was last brought up to date)
+
+CREATE TABLE IF NOT EXISTS sync_state (
+  name TEXT PRIMARY KEY,
+  value TEXT,
+  updated_at TEXT DEFAULT (datetime('now'))
+);
+
+-- ============================================
+-- Webhook Deliveries Table
+-- ============================================
+-- Jira webhook deliveries already processed, so retries are skipped.
+-- Rows older than JIRA_WEBHOOK_MEMORY_SECONDS are pruned
+
+CREATE TABLE IF NOT EXISTS webhook_deliveries (
+  delivery_id TEXT PRIMARY KEY,
+  processed_at REAL
+);
+
+CREATE INDEX IF NOT EXISTS idx_webhook_deliveries_processed ON webhook_deliveries(processed_at);
+
+-- ============================================
+-- Webhook Issue Events Table
+-- ============================================
+-- Time of the latest webhook event applied to each issue, so events
+-- delivered out of order are skipped
+
+CREATE TABLE IF NOT EXISTS webhook_issue_events (
+  issue_key TEXT PRIMARY KEY,
+  event_time REAL
+);
+
 -- ============================================
 -- Trigger: Update timestamp on user_roles
 -- ============================================
@@ -0,0 +1,39 @@
+"""Admin routes for Relay API.
+
+Exposes Jira integration health (circuit breaker and cache state).
+"""
+
+from flask import Blueprint, jsonify, g
+
+from ..utils.auth import require_auth, require_role, log_activity
+from ..services.jira_service import get_jira_status, reset_jira_circuit
+
+admin_bp = Blueprint("admin", __name__, url_prefix="/api/admin")
+
+
+@admin_bp.route("/jira/status", methods=["GET"])
+@require_auth
+@require_role("admin")
+def jira_status():
+    """
+    Get the Jira circuit breaker, connection pool and cache state (admin only).
+
+    Returns:
+        { circuit: {...}, pool: {...}, cache: {...}, single_flight: {...} }
+    """
+    return jsonify(get_jira_status())
+
+
+@admin_bp.route("/jira/circuit/reset", methods=["POST"])
+@require_auth
+@require_role("admin")
+def jira_circuit_reset():
+    """
+    Force the Jira circuit breaker closed (admin only).
+
+    Returns:
+        The circuit breaker state after the reset
+    """
+    circuit = reset_jira_circuit()
+    log_activity(g.user["user_id"], "reset_jira_circuit")
+    return jsonify({"circuit": circuit})
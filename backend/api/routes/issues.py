@@ -1,28 +1,41 @@
 """Issue routes for Relay API.
 
 Exposes Jira functionality to the frontend.
+
+Routes re-raise CircuitOpenError and DeadlineExceeded so the app's error
+handlers answer them with a 503 or 504.
 """
 
 from flask import Blueprint, jsonify, request, g
 
 from ..utils.auth import require_auth, require_role, log_activity
 from ..utils.template_builder import parse_user_agent
+from ..services.circuit_breaker import CircuitOpenError
+from ..services.deadline import DeadlineExceeded, with_deadline
 from ..services.email_service import notify_issue_created, notify_status_changed, notify_comment_added
 from ..services.jira_service import (
     fetch_issues,
+    get_issue_facets,
     get_issue,
+    get_issue_brief,
+    get_issue_history,
     create_issue,
     update_issue,
     add_comment,
     upload_attachment,
     check_user_can_edit,
+    get_issues_bulk,
     get_issues_updated_since,
+    transition_issue,
+    transition_issues_bulk,
+    SearchDepthExceeded,
 )
 
 issues_bp = Blueprint("issues", __name__, url_prefix="/api/issues")
 
 
 @issues_bp.route("", methods=["GET"])
+@with_deadline()
 @require_auth
 def list_issues():
     """
@@ -39,6 +52,10 @@ def list_issues():
 
     Returns:
         { issues: [...], total: number, page: number, totalPages: number }
+        plus { stale: true, staleSeconds: number } when served from an
+        expired cache entry that is being refreshed in the background.
+        416 with { lastReachablePage } when the page lies too far past the
+        pages read so far.
     """
     try:
         status = request.args.get("status")
@@ -63,13 +80,55 @@ def list_issues():
 
         return jsonify(result)
 
+    except SearchDepthExceeded as e:
+        # Pages this deep are reached by paging forward from the last reachable one
+        last_page = (e.reachable + limit - 1) // limit
+        return jsonify({"error": str(e), "lastReachablePage": last_page}), 416
     except ValueError as e:
         return jsonify({"error": str(e)}), 400
+    except (CircuitOpenError, DeadlineExceeded):
+        raise
     except Exception as e:
         return jsonify({"error": f"Failed to fetch issues: {str(e)}"}), 500
 
 
+@issues_bp.route("/facets", methods=["GET"])
+@with_deadline()
+@require_auth
+def list_issue_facets():
+    """
+    Count the issues matching each filter option.
+
+    Query params:
+        status, priority, type, tool, reporter, search: As for GET /api/issues
+
+    Returns:
+        { total: number, facets: { status: {value: count}, priority: {...},
+          type: {...}, tool: {...} } }
+        Each facet is counted under every filter except its own. 204 with
+        no body when the issue mirror is not ready to count from.
+    """
+    try:
+        result = get_issue_facets(
+            status=request.args.get("status"),
+            priority=request.args.get("priority"),
+            issue_type=request.args.get("type"),
+            tool=request.args.get("tool"),
+            reporter=request.args.get("reporter"),
+            search=request.args.get("search"),
+        )
+        if result is None:
+            return "", 204
+        return jsonify(result)
+
+    except (CircuitOpenError, DeadlineExceeded):
+        raise
+    except Exception as e:
+        return jsonify({"error": f"Failed to count issues: {str(e)}"}), 500
+
+
 @issues_bp.route("/<issue_key>", methods=["GET"])
+@with_deadline()
 @require_auth
 def get_issue_detail(issue_key: str):
     """
@@ -85,11 +144,44 @@ def get_issue_detail(issue_key: str):
         issue = get_issue(issue_key)
         return jsonify(issue)
 
+    except (CircuitOpenError, DeadlineExceeded):
+        raise
     except Exception as e:
         return jsonify({"error": f"Failed to get issue: {str(e)}"}), 500
 
 
+@issues_bp.route("/<issue_key>/history", methods=["GET"])
+@with_deadline()
+@require_auth
+def get_issue_history_page(issue_key: str):
+    """
+    Get a page of an issue's history, for loading older activity.
+
+    Query params:
+        before: Offset of the oldest entry already shown (historyStartAt
+            from the issue detail). Omit for the newest entries.
+        limit: Number of entries (default 10, max 100)
+
+    Returns:
+        { history: [...], startAt: number, total: number }
+    """
+    try:
+        before = request.args.get("before")
+        before = int(before) if before is not None else None
+        limit = int(request.args.get("limit", 10))
+
+        return jsonify(get_issue_history(issue_key, before=before, limit=limit))
+
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    except (CircuitOpenError, DeadlineExceeded):
+        raise
+    except Exception as e:
+        return jsonify({"error": f"Failed to get issue history: {str(e)}"}), 500
+
+
 @issues_bp.route("", methods=["POST"])
+@with_deadline()
 @require_auth
 def create_new_issue():
     """
@@ -176,11 +268,14 @@ def create_new_issue():
 
         return jsonify(result), 201
 
+    except (CircuitOpenError, DeadlineExceeded):
+        raise
     except Exception as e:
         return jsonify({"error": f"Failed to create issue: {str(e)}"}), 500
 
 
 @issues_bp.route("/<issue_key>", methods=["PUT"])
+@with_deadline()
 @require_auth
 def update_existing_issue(issue_key: str):
     """
@@ -223,7 +318,7 @@ def update_existing_issue(issue_key: str):
         old_status = None
         if "status" in data:
             try:
-                current_issue = get_issue(issue_key)
+                current_issue = get_issue_brief(issue_key) or {}
                 old_status = current_issue.get("status")
             except:
                 pass
@@ -241,8 +336,8 @@ def update_existing_issue(issue_key: str):
         # Send status change notification if status was updated
         if "status" in data and old_status and old_status != data["status"]:
             try:
-                issue = get_issue(issue_key)
-                reporter_email = issue.get("reporter", {}).get("email")
+                issue = get_issue_brief(issue_key) or {}
+                reporter_email = (issue.get("reporter") or {}).get("email")
                 if reporter_email:
                     notify_status_changed(
                         reporter_email=reporter_email,
@@ -259,11 +354,14 @@ def update_existing_issue(issue_key: str):
 
     except ValueError as e:
         return jsonify({"error": str(e)}), 400
+    except (CircuitOpenError, DeadlineExceeded):
+        raise
     except Exception as e:
         return jsonify({"error": f"Failed to update issue: {str(e)}"}), 500
 
 
 @issues_bp.route("/<issue_key>/comments", methods=["POST"])
+@with_deadline()
 @require_auth
 def add_issue_comment(issue_key: str):
     """
@@ -298,8 +396,8 @@ def add_issue_comment(issue_key: str):
 
         # Send email notification to reporter (if different from commenter)
         try:
-            issue = get_issue(issue_key)
-            reporter_email = issue.get("reporter", {}).get("email")
+            issue = get_issue_brief(issue_key) or {}
+            reporter_email = (issue.get("reporter") or {}).get("email")
             if reporter_email:
                 notify_comment_added(
                     reporter_email=reporter_email,
@@ -315,11 +413,14 @@ def add_issue_comment(issue_key: str):
 
         return jsonify(result), 201
 
+    except (CircuitOpenError, DeadlineExceeded):
+        raise
     except Exception as e:
         return jsonify({"error": f"Failed to add comment: {str(e)}"}), 500
 
 
 @issues_bp.route("/<issue_key>/attachments", methods=["POST"])
+@with_deadline()
 @require_auth
 def upload_issue_attachment(issue_key: str):
     """
@@ -378,11 +479,14 @@ def upload_issue_attachment(issue_key: str):
 
         return jsonify(result), 201
 
+    except (CircuitOpenError, DeadlineExceeded):
+        raise
     except Exception as e:
         return jsonify({"error": f"Failed to upload attachment: {str(e)}"}), 500
 
 
 @issues_bp.route("/<issue_key>", methods=["DELETE"])
+@with_deadline()
 @require_auth
 @require_role("admin")
 def delete_issue(issue_key: str):
@@ -398,8 +502,6 @@ def delete_issue(issue_key: str):
     user = g.user
 
     try:
-        from ..services.jira_service import transition_issue
-
         result = transition_issue(issue_key, "Cancelled")
 
         # Log the activity
@@ -413,11 +515,14 @@ def delete_issue(issue_key: str):
 
     except ValueError as e:
         return jsonify({"error": str(e)}), 400
+    except (CircuitOpenError, DeadlineExceeded):
+        raise
     except Exception as e:
         return jsonify({"error": f"Failed to cancel issue: {str(e)}"}), 500
 
 
 @issues_bp.route("/bulk/status", methods=["POST"])
+@with_deadline()
 @require_auth
 @require_role("sqa", "admin")
 def bulk_update_status():
@@ -433,7 +538,10 @@ def bulk_update_status():
         }
 
     Returns:
-        { updated: number, failed: ["KEY-3", ...] }
+        { updated: number, failed: ["KEY-3", ...], errors: { "KEY-3": reason },
+          pending: ["KEY-4", ...] }
+        where pending issues were still being processed by Jira's bulk task
+        when the wait ended
     """
     user = g.user
     data = request.get_json()
@@ -450,48 +558,54 @@ def bulk_update_status():
     if not new_status:
         return jsonify({"error": "status is required"}), 400
 
-    from ..services.jira_service import transition_issue
+    try:
+        # Current state of every issue in one bulk read (its key searches run
+        # concurrently), then one Jira bulk transition task (or concurrent
+        # single transitions)
+        current_issues = get_issues_bulk(issue_keys)["issues"]
+        result = transition_issues_bulk(issue_keys, new_status, current=current_issues)
+    except (CircuitOpenError, DeadlineExceeded):
+        raise
+    except Exception as e:
+        return jsonify({"error": f"Failed to update issues: {str(e)}"}), 500
 
-    updated = 0
-    failed = []
+    for issue_key in result["updated"]:
+        current_issue = current_issues[issue_key]
+        old_status = current_issue.get("status")
+        new_status = result["statuses"].get(issue_key, new_status)
 
-    for issue_key in issue_keys:
-        try:
-            # Get current issue state for notification
-            current_issue = get_issue(issue_key)
-            old_status = current_issue.get("status")
-
-            # Transition the issue
-            transition_issue(issue_key, new_status)
-            updated += 1
-
-            # Log the activity
-            log_activity(
-                user["user_id"],
-                "bulk_update_status",
-                jira_issue_key=issue_key,
-                metadata={"old_status": old_status, "new_status": new_status},
-            )
-
-            # Send notification if status changed
-            if old_status and old_status != new_status:
-                reporter_email = current_issue.get("reporter", {}).get("email")
-                if reporter_email:
-                    notify_status_changed(
-                        reporter_email=reporter_email,
-                        issue_key=issue_key,
-                        summary=current_issue.get("summary", ""),
-                        old_status=old_status,
-                        new_status=new_status
-                    )
+        # Log the activity
+        log_activity(
+            user["user_id"],
+            "bulk_update_status",
+            jira_issue_key=issue_key,
+            metadata={"old_status": old_status, "new_status": new_status},
+        )
 
-        except Exception as e:
-            failed.append(issue_key)
+        # Send notification if status changed
+        if old_status and old_status != new_status:
+            reporter_email = (current_issue.get("reporter") or {}).get("email")
+            if reporter_email:
+                notify_status_changed(
+                    reporter_email=reporter_email,
+                    issue_key=issue_key,
+                    summary=current_issue.get("summary", ""),
+                    old_status=old_status,
+                    new_status=new_status
+                )
 
-    return jsonify({"updated": updated, "failed": failed})
+    settled = set(result["updated"]) | set(result["pending"])
+    failed = [k for k in issue_keys if str(k).strip().upper() not in settled]
+    return jsonify({
+        "updated": len(result["updated"]),
+        "failed": failed,
+        "errors": result["failed"],
+        "pending": result["pending"],
+    })
 
 
 @issues_bp.route("/updates", methods=["GET"])
+@with_deadline()
 @require_auth
 def get_updates():
     """
@@ -512,5 +626,7 @@ def get_updates():
         issues = get_issues_updated_since(since)
         return jsonify({"issues": issues, "count": len(issues)})
 
+    except (CircuitOpenError, DeadlineExceeded):
+        raise
     except Exception as e:
         return jsonify({"error": f"Failed to get updates: {str(e)}"}), 500
@@ -0,0 +1,40 @@
+"""Stats routes for Relay API.
+
+Dashboard totals by status, priority and type. CircuitOpenError and
+DeadlineExceeded are answered by the app's error handlers.
+"""
+
+from flask import Blueprint, jsonify
+
+from ..utils.auth import require_auth
+from ..services.circuit_breaker import CircuitOpenError
+from ..services.deadline import DeadlineExceeded, with_deadline
+from ..services.jira_service import get_stats_summary
+
+stats_bp = Blueprint("stats", __name__, url_prefix="/api/stats")
+
+
+@stats_bp.route("/summary", methods=["GET"])
+@with_deadline()
+@require_auth
+def stats_summary():
+    """
+    Get issue totals for the dashboard.
+
+    Returns:
+        { total: number, byStatus: {...}, byPriority: {...}, byType: {...},
+          byStatusAndType: {status: {type: number}},
+          byStatusAndPriority: {status: {priority: number}},
+          byPriorityAndType: {priority: {type: number}} },
+        or 204 No Content while the issue counters are not ready
+    """
+    try:
+        result = get_stats_summary()
+        if result is None:
+            return "", 204
+        return jsonify(result)
+
+    except (CircuitOpenError, DeadlineExceeded):
+        raise
+    except Exception as e:
+        return jsonify({"error": f"Failed to get stats: {str(e)}"}), 500
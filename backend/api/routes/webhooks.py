@@ -0,0 +1,56 @@
+"""Webhook routes for Relay API.
+
+Receives Jira webhooks so caches and the local issue mirror follow Jira
+changes as they happen instead of on the next poll or sync.
+"""
+
+import hashlib
+
+from flask import Blueprint, jsonify, request
+
+from ..services.jira_webhooks import (
+    TOKEN_HEADER,
+    WebhookAuthError,
+    handle_event,
+    record_delivery,
+    verify_request,
+)
+
+webhooks_bp = Blueprint("webhooks", __name__, url_prefix="/api/webhooks")
+
+
+@webhooks_bp.route("/jira", methods=["POST"])
+def jira_webhook():
+    """
+    Apply a Jira webhook event.
+
+    Authenticated with JIRA_WEBHOOK_SECRET, either as an X-Hub-Signature
+    HMAC of the body or in the X-Relay-Webhook-Secret header.
+
+    Body:
+        Jira webhook payload (jira:issue_created/updated/deleted,
+        comment_created/updated/deleted; other events are ignored)
+
+    Returns:
+        { status: "applied" | "duplicate" | "stale" | "ignored" | "removed",
+          event: string, key: string }
+    """
+    body = request.get_data()
+    try:
+        verify_request(body, request.headers.get("X-Hub-Signature"), request.headers.get(TOKEN_HEADER))
+    except WebhookAuthError as e:
+        return jsonify({"error": str(e)}), 401
+
+    payload = request.get_json(silent=True)
+    if not isinstance(payload, dict):
+        return jsonify({"error": "Invalid JSON payload"}), 400
+
+    # Retries of a delivery keep its identifier; fall back to the body itself
+    delivery_id = request.headers.get("X-Atlassian-Webhook-Identifier") or hashlib.sha256(body).hexdigest()
+    record_delivery({"X-Atlassian-Webhook-Identifier": delivery_id}, body)
+
+    try:
+        return jsonify(handle_event(payload, delivery_id))
+    except Exception as e:
+        # A 5xx makes Jira deliver the event again
+        return jsonify({"error": f"Failed to apply webhook: {str(e)}"}), 500
@@ -0,0 +1,575 @@
+"""Shared cache stores for Jira query results.
+
+The in-memory TTLCache is private to one process. These backends implement
+the same CacheBackend interface on top of storage that several processes can
+share:
+
+- SQLiteCache: a local SQLite file (e.g. under /tmp) shared by all gunicorn
+  workers on one host
+- RedisCache: any Redis-protocol server (Redis, Valkey, Upstash, a local
+  stand-in) shared across hosts and serverless instances
+
+Values are stored as compressed compact JSON. Backend failures are logged and
+treated as cache misses so Jira stays the source of truth.
+"""
+
+import time
+import zlib
+import socket
+import sqlite3
+import logging
+import threading
+from functools import wraps
+from contextlib import contextmanager
+from typing import Any, Callable, Iterable, Optional
+from urllib.parse import urlparse, unquote
+
+from .jira_cache import CacheBackend, serialize, deserialize
+
+logger = logging.getLogger(__name__)
+
+
+class CacheBackendError(Exception):
+    """Raised when a cache server returns an error reply."""
+
+
+def _fail_open(default):
+    """Log backend errors and return a default instead of failing the request."""
+    def decorator(func):
+        @wraps(func)
+        def wrapper(self, *args, **kwargs):
+            try:
+                return func(self, *args, **kwargs)
+            except (OSError, sqlite3.Error, zlib.error, CacheBackendError, ValueError) as e:
+                logger.warning(f"{self.name} cache {func.__name__} failed: {e}")
+                return default() if callable(default) else default
+        return wrapper
+    return decorator
+
+
+# =============================================================================
+# SQLITE - File-backed cache shared by processes on one host
+# =============================================================================
+
+class SQLiteCache(CacheBackend):
+    """
+    LRU cache with TTL stored in a local SQLite file.
+
+    Each thread gets its own connection; WAL mode lets readers in other
+    workers proceed while one worker writes.
+
+    Args:
+        path: SQLite database file (created if missing)
+        **kwargs: See CacheBackend
+    """
+
+    name = "sqlite"
+
+    # Reads refresh an entry's LRU position at most this often, so hot keys
+    # are not rewritten on every hit
+    ACCESS_RESOLUTION_SECONDS = 30
+
+    def __init__(self, path: str = "/tmp/relay-jira-cache.db", **kwargs):
+        super().__init__(**kwargs)
+        self.path = path
+        self._local = threading.local()
+        self._init_schema()
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def _transaction(self):
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+    def _init_schema(self) -> None:
+        conn = self._conn()
+        conn.execute(
+            """CREATE TABLE IF NOT EXISTS cache_entries (
+                 key TEXT PRIMARY KEY,
+                 value BLOB NOT NULL,
+                 expires_at REAL NOT NULL,
+                 stale_until REAL NOT NULL,
+                 size INTEGER NOT NULL,
+                 meta BLOB,
+                 accessed_at REAL NOT NULL
+               )"""
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_cache_entries_accessed ON cache_entries(accessed_at)"
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_cache_entries_stale ON cache_entries(stale_until)"
+        )
+        conn.execute(
+            """CREATE TABLE IF NOT EXISTS cache_tags (
+                 tag TEXT NOT NULL,
+                 key TEXT NOT NULL,
+                 PRIMARY KEY (tag, key)
+               )"""
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_cache_tags_key ON cache_tags(key)")
+
+    @staticmethod
+    def _delete_keys(conn: sqlite3.Connection, keys: list) -> None:
+        for key in keys:
+            conn.execute("DELETE FROM cache_entries WHERE key = ?", (key,))
+            conn.execute("DELETE FROM cache_tags WHERE key = ?", (key,))
+
+    def _touch(self, conn: sqlite3.Connection, key: str, accessed_at: float, now: float) -> None:
+        """Move an entry up the LRU order unless it was read moments ago."""
+        if now - accessed_at >= self.ACCESS_RESOLUTION_SECONDS:
+            conn.execute("UPDATE cache_entries SET accessed_at = ? WHERE key = ?", (now, key))
+
+    @_fail_open(None)
+    def get(self, key: str) -> Optional[Any]:
+        conn = self._conn()
+        row = conn.execute(
+            "SELECT value, expires_at, stale_until, accessed_at FROM cache_entries WHERE key = ?",
+            (key,),
+        ).fetchone()
+        now = time.time()
+        if row is None or row[1] <= now:
+            if row is not None and row[2] <= now:
+                with self._transaction() as tx:
+                    self._delete_keys(tx, [key])
+                self.expirations += 1
+            self.misses += 1
+            return None
+        self._touch(conn, key, row[3], now)
+        self.hits += 1
+        return deserialize(row[0])
+
+    @_fail_open(None)
+    def get_stale(self, key: str) -> Optional[tuple]:
+        conn = self._conn()
+        row = conn.execute(
+            "SELECT value, expires_at, stale_until, accessed_at FROM cache_entries WHERE key = ?",
+            (key,),
+        ).fetchone()
+        if row is None:
+            return None
+        now = time.time()
+        if row[2] <= now:
+            with self._transaction() as tx:
+                self._delete_keys(tx, [key])
+            self.expirations += 1
+            return None
+        self._touch(conn, key, row[3], now)
+        self.stale_hits += 1
+        return deserialize(row[0]), max(0.0, now - row[1])
+
+    @_fail_open(None)
+    def set(
+        self,
+        key: str,
+        data: Any,
+        ttl_seconds: Optional[float] = None,
+        tags: Iterable[str] = (),
+        meta: Optional[dict] = None,
+        stale_seconds: Optional[float] = None,
+    ) -> None:
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        stale = self.stale_seconds if stale_seconds is None else stale_seconds
+        blob = serialize(data)
+        if len(blob) > self.max_bytes:
+            logger.warning(f"Cache SKIP for key: {key[:12]}... ({len(blob)} bytes exceeds budget)")
+            return
+
+        now = time.time()
+        with self._transaction() as tx:
+            tx.execute(
+                """INSERT OR REPLACE INTO cache_entries
+                   (key, value, expires_at, stale_until, size, meta, accessed_at)
+                   VALUES (?, ?, ?, ?, ?, ?, ?)""",
+                (key, blob, now + ttl, now + ttl + stale, len(blob), serialize(meta or {}), now),
+            )
+            tx.execute("DELETE FROM cache_tags WHERE key = ?", (key,))
+            tx.executemany(
+                "INSERT OR IGNORE INTO cache_tags (tag, key) VALUES (?, ?)",
+                [(tag, key) for tag in set(tags)],
+            )
+            self._evict(tx)
+
+        self._ensure_sweeper()
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        count, total = conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM cache_entries"
+        ).fetchone()
+        while count > self.max_entries or total > self.max_bytes:
+            rows = conn.execute(
+                "SELECT key, size FROM cache_entries ORDER BY accessed_at LIMIT 50"
+            ).fetchall()
+            if not rows:
+                break
+            for key, size in rows:
+                if count <= self.max_entries and total <= self.max_bytes:
+                    break
+                self._delete_keys(conn, [key])
+                count -= 1
+                total -= size
+                self.evictions += 1
+
+    @_fail_open(False)
+    def delete(self, key: str) -> bool:
+        with self._transaction() as tx:
+            existed = tx.execute(
+                "SELECT 1 FROM cache_entries WHERE key = ?", (key,)
+            ).fetchone() is not None
+            self._delete_keys(tx, [key])
+        return existed
+
+    @_fail_open(0)
+    def clear(self) -> int:
+        with self._transaction() as tx:
+            count = tx.execute("SELECT COUNT(*) FROM cache_entries").fetchone()[0]
+            tx.execute("DELETE FROM cache_entries")
+            tx.execute("DELETE FROM cache_tags")
+        return count
+
+    @_fail_open(list)
+    def keys(self) -> list:
+        rows = self._conn().execute(
+            "SELECT key FROM cache_entries ORDER BY accessed_at"
+        ).fetchall()
+        return [r[0] for r in rows]
+
+    @_fail_open(list)
+    def entries_for_tag(self, tag: str) -> list:
+        rows = self._conn().execute(
+            """SELECT e.key, e.value, e.meta FROM cache_tags t
+               JOIN cache_entries e ON e.key = t.key
+               WHERE t.tag = ? AND e.stale_until > ?""",
+            (tag, time.time()),
+        ).fetchall()
+        return [(r[0], deserialize(r[1]), deserialize(r[2]) if r[2] else {}) for r in rows]
+
+    @_fail_open(0)
+    def invalidate_tag(self, tag: str) -> int:
+        with self._transaction() as tx:
+            keys = [r[0] for r in tx.execute(
+                "SELECT key FROM cache_tags WHERE tag = ?", (tag,)
+            ).fetchall()]
+            self._delete_keys(tx, keys)
+        return len(keys)
+
+    @_fail_open(False)
+    def patch(self, key: str, updater: Callable[[Any], Any]) -> bool:
+        with self._transaction() as tx:
+            row = tx.execute(
+                "SELECT value, stale_until FROM cache_entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or row[1] <= time.time():
+                return False
+            blob = serialize(updater(deserialize(row[0])))
+            tx.execute(
+                "UPDATE cache_entries SET value = ?, size = ? WHERE key = ?",
+                (blob, len(blob), key),
+            )
+            self._evict(tx)
+        return True
+
+    @_fail_open(0)
+    def sweep(self) -> int:
+        now = time.time()
+        with self._transaction() as tx:
+            tx.execute(
+                """DELETE FROM cache_tags WHERE key IN
+                   (SELECT key FROM cache_entries WHERE stale_until <= ?)""",
+                (now,),
+            )
+            removed = tx.execute(
+                "DELETE FROM cache_entries WHERE stale_until <= ?", (now,)
+            ).rowcount
+        self.expirations += removed
+        if removed:
+            logger.info(f"Cache SWEEP removed {removed} expired entries")
+        return removed
+
+    @_fail_open(dict)
+    def stats(self) -> dict:
+        count, total = self._conn().execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM cache_entries"
+        ).fetchone()
+        return {**super().stats(), "entries": count, "bytes": total, "path": self.path}
+
+    @_fail_open(0)
+    def __len__(self) -> int:
+        return self._conn().execute("SELECT COUNT(*) FROM cache_entries").fetchone()[0]
+
+    @_fail_open(False)
+    def __contains__(self, key: str) -> bool:
+        row = self._conn().execute(
+            "SELECT 1 FROM cache_entries WHERE key = ? AND expires_at > ?",
+            (key, time.time()),
+        ).fetchone()
+        return row is not None
+
+
+# =============================================================================
+# REDIS - Network cache shared across hosts and serverless instances
+# =============================================================================
+
+class RespConnection:
+    """
+    Minimal thread-safe client for the Redis serialization protocol (RESP2).
+
+    Args:
+        url: redis://[user:password@]host[:port][/db], or rediss:// for TLS
+        timeout: Socket connect/read timeout in seconds
+    """
+
+    def __init__(self, url: str, timeout: float = 2.0):
+        parsed = urlparse(url)
+        if parsed.scheme not in ("redis", "rediss"):
+            raise ValueError(f"Unsupported cache URL scheme '{parsed.scheme}'")
+        self.host = parsed.hostname or "localhost"
+        self.port = parsed.port or 6379
+        self.username = unquote(parsed.username) if parsed.username else None
+        self.password = unquote(parsed.password) if parsed.password else None
+        self.db = int(parsed.path.lstrip("/") or 0)
+        self.use_tls = parsed.scheme == "rediss"
+        self.timeout = timeout
+        self._sock = None
+        self._file = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> None:
+        sock = socket.create_connection((self.host, self.port), timeout=self.timeout)
+        if self.use_tls:
+            import ssl
+            sock = ssl.create_default_context().wrap_socket(sock, server_hostname=self.host)
+        self._sock = sock
+        self._file = sock.makefile("rb")
+        if self.password:
+            auth = ("AUTH", self.username, self.password) if self.username else ("AUTH", self.password)
+            self._send(auth)
+            self._read()
+        if self.db:
+            self._send(("SELECT", self.db))
+            self._read()
+
+    def close(self) -> None:
+        with self._lock:
+            self._close()
+
+    def _close(self) -> None:
+        if self._sock is not None:
+            try:
+                self._sock.close()
+            except OSError:
+                pass
+        self._sock = None
+        self._file = None
+
+    def _send(self, args: tuple) -> None:
+        parts = [b"*%d\r\n" % len(args)]
+        for arg in args:
+            if isinstance(arg, bytes):
+                data = arg
+            else:
+                data = str(arg).encode()
+            parts.append(b"$%d\r\n%s\r\n" % (len(data), data))
+        self._sock.sendall(b"".join(parts))
+
+    def _read(self) -> Any:
+        line = self._file.readline()
+        if not line:
+            raise ConnectionError("Connection closed by cache server")
+        prefix, rest = line[:1], line[1:-2]
+        if prefix == b"+":
+            return rest.decode()
+        if prefix == b"-":
+            raise CacheBackendError(rest.decode())
+        if prefix == b":":
+            return int(rest)
+        if prefix == b"$":
+            length = int(rest)
+            if length == -1:
+                return None
+            return self._file.read(length + 2)[:-2]
+        if prefix == b"*":
+            length = int(rest)
+            if length == -1:
+                return None
+            return [self._read() for _ in range(length)]
+        raise CacheBackendError(f"Unexpected reply from cache server: {line[:20]!r}")
+
+    def execute(self, *args) -> Any:
+        """Send one command and return its decoded reply."""
+        with self._lock:
+            for attempt in range(2):
+                try:
+                    if self._sock is None:
+                        self._connect()
+                    self._send(args)
+                    return self._read()
+                except OSError:
+                    # Reconnect once on a dropped connection
+                    self._close()
+                    if attempt:
+                        raise
+
+
+class RedisCache(CacheBackend):
+    """
+    Cache with TTL stored on a Redis-protocol server.
+
+    Entries expire server-side at the end of their stale window. Entry count
+    and memory limits are enforced by the server's maxmemory policy
+    (allkeys-lru), not by this client.
+
+    Args:
+        url: Server URL (see RespConnection)
+        prefix: Namespace prepended to every key
+        **kwargs: See CacheBackend
+    """
+
+    name = "redis"
+
+    # Tag sets outlive their members and are pruned on read
+    TAG_TTL_SECONDS = 24 * 60 * 60
+
+    def __init__(self, url: str, prefix: str = "relay:jira:", **kwargs):
+        kwargs.setdefault("sweep_interval", 0)
+        super().__init__(**kwargs)
+        self.prefix = prefix
+        self._conn = RespConnection(url)
+
+    def _entry_key(self, key: str) -> str:
+        return f"{self.prefix}entry:{key}"
+
+    def _tag_key(self, tag: str) -> str:
+        return f"{self.prefix}tag:{tag}"
+
+    def _decode(self, blob: Optional[bytes]) -> Optional[dict]:
+        return deserialize(blob) if blob is not None else None
+
+    def _scan(self, pattern: str) -> list:
+        cursor = b"0"
+        found = []
+        while True:
+            cursor, keys = self._conn.execute("SCAN", cursor, "MATCH", pattern, "COUNT", 500)
+            found.extend(k.decode() for k in keys)
+            if cursor in (b"0", 0, "0"):
+                return found
+
+    @_fail_open(None)
+    def get(self, key: str) -> Optional[Any]:
+        entry = self._decode(self._conn.execute("GET", self._entry_key(key)))
+        if entry is None or entry["e"] <= time.time():
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry["d"]
+
+    @_fail_open(None)
+    def get_stale(self, key: str) -> Optional[tuple]:
+        entry = self._decode(self._conn.execute("GET", self._entry_key(key)))
+        if entry is None:
+            return None
+        self.stale_hits += 1
+        return entry["d"], max(0.0, time.time() - entry["e"])
+
+    @_fail_open(None)
+    def set(
+        self,
+        key: str,
+        data: Any,
+        ttl_seconds: Optional[float] = None,
+        tags: Iterable[str] = (),
+        meta: Optional[dict] = None,
+        stale_seconds: Optional[float] = None,
+    ) -> None:
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        stale = self.stale_seconds if stale_seconds is None else stale_seconds
+        tags = sorted(set(tags))
+        blob = serialize({"d": data, "e": time.time() + ttl, "m": meta or {}, "t": tags})
+        if len(blob) > self.max_bytes:
+            logger.warning(f"Cache SKIP for key: {key[:12]}... ({len(blob)} bytes exceeds budget)")
+            return
+
+        lifetime_ms = max(1, int((ttl + stale) * 1000))
+        self._conn.execute("SET", self._entry_key(key), blob, "PX", lifetime_ms)
+        for tag in tags:
+            self._conn.execute("SADD", self._tag_key(tag), key)
+            self._conn.execute("EXPIRE", self._tag_key(tag), self.TAG_TTL_SECONDS)
+
+    @_fail_open(False)
+    def delete(self, key: str) -> bool:
+        return bool(self._conn.execute("DEL", self._entry_key(key)))
+
+    @_fail_open(0)
+    def clear(self) -> int:
+        entries = self._scan(f"{self.prefix}entry:*")
+        keys = entries + self._scan(f"{self.prefix}tag:*")
+        for i in range(0, len(keys), 500):
+            self._conn.execute("DEL", *keys[i:i + 500])
+        return len(entries)
+
+    @_fail_open(list)
+    def keys(self) -> list:
+        offset = len(f"{self.prefix}entry:")
+        return [k[offset:] for k in self._scan(f"{self.prefix}entry:*")]
+
+    @_fail_open(list)
+    def entries_for_tag(self, tag: str) -> list:
+        members = [m.decode() for m in self._conn.execute("SMEMBERS", self._tag_key(tag))]
+        if not members:
+            return []
+        blobs = self._conn.execute("MGET", *[self._entry_key(k) for k in members])
+        results = []
+        for key, blob in zip(members, blobs):
+            entry = self._decode(blob)
+            if entry is None or tag not in entry["t"]:
+                self._conn.execute("SREM", self._tag_key(tag), key)
+                continue
+            results.append((key, entry["d"], entry["m"]))
+        return results
+
+    @_fail_open(0)
+    def invalidate_tag(self, tag: str) -> int:
+        members = [m.decode() for m in self._conn.execute("SMEMBERS", self._tag_key(tag))]
+        removed = 0
+        if members:
+            removed = self._conn.execute("DEL", *[self._entry_key(k) for k in members])
+        self._conn.execute("DEL", self._tag_key(tag))
+        return removed
+
+    @_fail_open(False)
+    def patch(self, key: str, updater: Callable[[Any], Any]) -> bool:
+        # Read-modify-write; a concurrent set() of the same key may win
+        entry_key = self._entry_key(key)
+        entry = self._decode(self._conn.execute("GET", entry_key))
+        remaining_ms = self._conn.execute("PTTL", entry_key)
+        if entry is None or remaining_ms is None or remaining_ms <= 0:
+            return False
+        entry["d"] = updater(entry["d"])
+        self._conn.execute("SET", entry_key, serialize(entry), "PX", remaining_ms)
+        return True
+
+    @_fail_open(dict)
+    def stats(self) -> dict:
+        return {
+            **super().stats(),
+            "entries": len(self.keys()),
+            "server": f"{self._conn.host}:{self._conn.port}",
+        }
+
+    @_fail_open(False)
+    def __contains__(self, key: str) -> bool:
+        return self.get(key) is not None
@@ -0,0 +1,183 @@
+"""Circuit breaker for upstream API calls.
+
+Tracks consecutive upstream failures. After a threshold the circuit opens and
+calls fail immediately instead of tying up worker threads in retries. After a
+cool-down a single trial call is let through (half-open); its outcome closes
+or re-opens the circuit.
+"""
+
+import time
+import logging
+import threading
+from typing import Optional
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is rejected because the circuit is open."""
+
+    def __init__(self, name: str, retry_after: float):
+        self.name = name
+        self.retry_after = max(0.0, retry_after)
+        super().__init__(
+            f"{name} is temporarily unavailable. "
+            f"Retry in {int(self.retry_after) + 1}s."
+        )
+
+
+def is_upstream_failure(error: Exception) -> bool:
+    """
+    Check whether an exception means the upstream service is unhealthy.
+
+    Connection errors, timeouts, 5xx and 429 responses count. Client errors
+    (4xx) and local errors do not, so a bad request never opens the circuit.
+    """
+    if isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout)):
+        return True
+    if isinstance(error, requests.exceptions.HTTPError):
+        response = getattr(error, "response", None)
+        if response is None:
+            return True
+        return response.status_code >= 500 or response.status_code == 429
+    return False
+
+
+class CircuitBreaker:
+    """
+    Thread-safe closed/open/half-open circuit breaker.
+
+    Args:
+        name: Name used in logs and errors (e.g. "Jira")
+        failure_threshold: Consecutive failures that open the circuit
+        recovery_timeout: Seconds the circuit stays open before a trial call
+        half_open_max_calls: Concurrent trial calls allowed while half-open
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30,
+        half_open_max_calls: int = 1,
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._half_open_calls = 0
+
+        self.total_failures = 0
+        self.rejected_calls = 0
+        self.times_opened = 0
+        self.last_failure: Optional[str] = None
+        self.last_failure_at: Optional[float] = None
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._current_state()
+
+    def _current_state(self) -> str:
+        if self._state == OPEN and time.time() - self._opened_at >= self.recovery_timeout:
+            self._state = HALF_OPEN
+            self._half_open_calls = 0
+            logger.info(f"{self.name} circuit HALF-OPEN, allowing a trial call")
+        return self._state
+
+    def before_call(self) -> None:
+        """Raise CircuitOpenError if a call may not proceed right now."""
+        with self._lock:
+            state = self._current_state()
+            if state == CLOSED:
+                return
+            if state == HALF_OPEN and self._half_open_calls < self.half_open_max_calls:
+                self._half_open_calls += 1
+                return
+            self.rejected_calls += 1
+            retry_after = (
+                self.recovery_timeout - (time.time() - self._opened_at)
+                if self._opened_at else self.recovery_timeout
+            )
+            raise CircuitOpenError(self.name, retry_after)
+
+    def record_success(self) -> None:
+        """Record a successful call, closing the circuit if it was half-open."""
+        with self._lock:
+            if self._state != CLOSED:
+                logger.info(f"{self.name} circuit CLOSED after successful trial call")
+            self._state = CLOSED
+            self._failures = 0
+            self._opened_at = None
+            self._half_open_calls = 0
+
+    def record_failure(self, error: Exception) -> None:
+        """Record a failed call; upstream failures may open the circuit."""
+        if not is_upstream_failure(error):
+            # The upstream answered, so it is reachable
+            self.record_success()
+            return
+
+        with self._lock:
+            self.total_failures += 1
+            self.last_failure = str(error)[:200]
+            self.last_failure_at = time.time()
+            self._failures += 1
+
+            if self._state == HALF_OPEN or self._failures >= self.failure_threshold:
+                if self._state != OPEN:
+                    self.times_opened += 1
+                    logger.error(
+                        f"{self.name} circuit OPEN after {self._failures} failures: {error}"
+                    )
+                self._state = OPEN
+                self._opened_at = time.time()
+                self._half_open_calls = 0
+
+    def release(self) -> None:
+        """
+        Give back a call slot without recording an outcome.
+
+        For calls abandoned for local reasons (e.g. the caller ran out of
+        time), which say nothing about the upstream's health.
+        """
+        with self._lock:
+            if self._state == HALF_OPEN and self._half_open_calls > 0:
+                self._half_open_calls -= 1
+
+    def reset(self) -> None:
+        """Force the circuit closed."""
+        self.record_success()
+
+    def stats(self) -> dict:
+        """Return the breaker state and counters."""
+        with self._lock:
+            state = self._current_state()
+            return {
+                "name": self.name,
+                "state": state,
+                "consecutive_failures": self._failures,
+                "failure_threshold": self.failure_threshold,
+                "recovery_timeout": self.recovery_timeout,
+                "opened_at": self._opened_at,
+                "retry_after": (
+                    max(0.0, self.recovery_timeout - (time.time() - self._opened_at))
+                    if state == OPEN and self._opened_at else 0
+                ),
+                "total_failures": self.total_failures,
+                "rejected_calls": self.rejected_calls,
+                "times_opened": self.times_opened,
+                "last_failure": self.last_failure,
+                "last_failure_at": self.last_failure_at,
+            }
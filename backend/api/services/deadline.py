@@ -0,0 +1,126 @@
+"""Request-scoped deadlines for upstream calls.
+
+A route sets a deadline for the whole request with @with_deadline(). Every
+Jira call made while handling it checks the time left before each attempt,
+shrinks its HTTP timeouts and retry budget to fit, and raises
+DeadlineExceeded instead of starting work that cannot finish in time. The
+route turns that into a 504 before the serverless platform kills the
+function halfway through.
+
+The deadline lives in a context variable, so it follows the request into
+asyncio tasks and into worker threads started with contextvars.copy_context().
+"""
+
+import os
+import time
+import contextvars
+from functools import wraps
+from contextlib import contextmanager
+from typing import Optional
+
+# Default time a route may spend on upstream calls; keep it below the
+# platform's function timeout so the 504 still reaches the client
+REQUEST_DEADLINE_SECONDS = float(os.getenv("REQUEST_DEADLINE_SECONDS", "9"))
+# Attempts are not started with less than this left
+MIN_ATTEMPT_SECONDS = float(os.getenv("REQUEST_MIN_ATTEMPT_SECONDS", "0.5"))
+
+# (monotonic expiry, seconds granted) for the current request, if any
+_deadline: contextvars.ContextVar = contextvars.ContextVar("request_deadline", default=None)
+
+
+class DeadlineExceeded(Exception):
+    """Raised when upstream work cannot finish within the request deadline."""
+
+    def __init__(self, operation: str = "Request", seconds: Optional[float] = None):
+        self.operation = operation
+        self.seconds = seconds if seconds is not None else granted()
+        within = f" within the {self.seconds:g}s request deadline" if self.seconds else " in time"
+        super().__init__(f"{operation} could not finish{within}")
+
+
+@contextmanager
+def deadline_scope(seconds: float):
+    """
+    Set a deadline `seconds` from now for the code in the block.
+
+    A scope nested inside another never extends the outer deadline.
+    """
+    expires_at = time.monotonic() + seconds
+    current = _deadline.get()
+    if current is not None and current[0] < expires_at:
+        expires_at, seconds = current
+    token = _deadline.set((expires_at, seconds))
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+@contextmanager
+def detached():
+    """Run the block without a deadline, e.g. background work that outlives the request."""
+    token = _deadline.set(None)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def with_deadline(seconds: Optional[float] = None):
+    """
+    Decorator to give a route a deadline for all upstream calls it makes.
+
+    Args:
+        seconds: Time allowed (default REQUEST_DEADLINE_SECONDS)
+    """
+    def decorator(f):
+        @wraps(f)
+        def decorated(*args, **kwargs):
+            with deadline_scope(seconds if seconds is not None else REQUEST_DEADLINE_SECONDS):
+                return f(*args, **kwargs)
+        return decorated
+    return decorator
+
+
+def remaining() -> Optional[float]:
+    """Seconds left before the current deadline, or None if there is none."""
+    current = _deadline.get()
+    if current is None:
+        return None
+    return max(0.0, current[0] - time.monotonic())
+
+
+def granted() -> Optional[float]:
+    """Seconds the current deadline was set for, or None if there is none."""
+    current = _deadline.get()
+    return current[1] if current is not None else None
+
+
+def expired() -> bool:
+    """Check whether the current deadline has passed."""
+    left = remaining()
+    return left is not None and left <= 0
+
+
+def check(operation: str = "Request") -> None:
+    """Raise DeadlineExceeded if too little time is left to start an attempt."""
+    left = remaining()
+    if left is not None and left < MIN_ATTEMPT_SECONDS:
+        raise DeadlineExceeded(operation)
+
+
+def clamp(seconds: float, reserve: float = 0.0) -> float:
+    """
+    Shrink a timeout or budget to fit the current deadline.
+
+    Args:
+        seconds: Time the caller would like to allow
+        reserve: Time to keep back for work after this step
+
+    Returns:
+        `seconds`, or less if the deadline is closer (never negative)
+    """
+    left = remaining()
+    if left is None:
+        return seconds
+    return max(0.0, min(seconds, left - reserve))
@@ -0,0 +1,961 @@
+"""Local mirror of Relay issues in the Turso database.
+
+The issues_mirror table holds one row per Relay issue with the fields the
+issue list shows and filters on. When JIRA_MIRROR_READS is enabled and the
+mirror was brought up to date recently, fetch_issues answers from an
+indexed query here instead of a Jira search, with the same response shape.
+
+The issues_fts table is an FTS5 index over each issue's summary,
+description and comments, keyed by the Jira issue id. It answers the
+list's search filter with BM25 ranking, prefix matching and highlighted
+snippets, and is written in the same transactions as issues_mirror.
+
+Rows are written from raw Jira issues (search results with MIRROR_FIELDS),
+and patched in place when Relay itself changes an issue. Issues that are
+deleted or leave the project are replaced by issues_tombstones rows.
+"""
+
+import os
+import re
+import html
+import json
+import time
+import logging
+import threading
+import unicodedata
+from typing import Iterable, Optional
+from datetime import datetime
+
+from ..utils.database import get_connection
+
+logger = logging.getLogger(__name__)
+
+# Serve issue lists from the mirror instead of Jira
+MIRROR_READS = os.getenv("JIRA_MIRROR_READS", "false").lower() in ("1", "true", "yes")
+# The mirror is not read once its last sync is older than this
+MIRROR_MAX_LAG_SECONDS = int(os.getenv("JIRA_MIRROR_MAX_LAG_SECONDS", "900"))
+# How long the readiness check is remembered between requests
+_READY_CHECK_SECONDS = 5
+
+# sync_state row recording when the mirror was last known to match Jira
+SYNCED_AT_STATE = "issues_mirror.synced_at"
+
+# Jira fields needed to build a mirror row
+MIRROR_FIELDS = (
+    "key,summary,description,labels,status,priority,issuetype,reporter,assignee,"
+    "created,updated,comment"
+)
+
+# Tools offered by FilterBar; the ones each issue matches are stored with it
+TOOLS = (
+    "AI", "Curator", "Metadata", "AutoEat", "Himera", "Mobile App",
+    "MenuCurator", "Reports",
+)
+
+_COLUMNS = (
+    "issue_key", "jira_id", "summary", "description", "labels", "tools", "status", "priority",
+    "issue_type", "reporter_email", "reporter_name", "reporter_avatar",
+    "assignee_email", "assignee_name", "assignee_avatar",
+    "created", "updated", "created_ts", "updated_ts", "synced_at",
+)
+
+_UPDATED_TS = _COLUMNS.index("updated_ts")
+# Columns the issue counters count by, in (status, priority, type) order
+_COUNTED = tuple(_COLUMNS.index(c) for c in ("status", "priority", "issue_type"))
+
+# Columns returned for list rows (issues_mirror aliased as m), in _row_to_issue order
+_LIST_COLUMNS = (
+    "m.jira_id, m.issue_key, m.summary, m.status, m.priority, m.issue_type, "
+    "m.reporter_email, m.reporter_name, m.reporter_avatar, "
+    "m.assignee_email, m.assignee_name, m.assignee_avatar, m.created, m.updated"
+)
+
+# Full-text index rowid of the issue with a given key
+_FTS_ROWID_OF_KEY = "SELECT CAST(jira_id AS INTEGER) FROM issues_mirror WHERE issue_key = ?"
+
+_UPSERT_SQL = (
+    f"INSERT INTO issues_mirror ({', '.join(_COLUMNS)}) "
+    f"VALUES ({', '.join('?' for _ in _COLUMNS)}) "
+    f"ON CONFLICT(issue_key) DO UPDATE SET "
+    + ", ".join(f"{c} = excluded.{c}" for c in _COLUMNS if c != "issue_key")
+)
+
+# Fields Relay can change that map directly onto mirror columns
+PATCHABLE_FIELDS = {
+    "summary": "summary",
+    "status": "status",
+    "priority": "priority",
+    "description": "description",
+}
+
+# Full-text index columns, and their BM25 weights (issue_key is not indexed)
+_FTS_COLUMNS = ("issue_key", "summary", "description", "comments")
+_FTS_WEIGHTS = (0.0, 10.0, 4.0, 1.0)
+# Tokens shown around the best match in a search snippet
+SNIPPET_TOKENS = 16
+# Private-use markers FTS5 puts around matches; replaced after HTML escaping
+_MARK_OPEN = "\ue000"
+_MARK_CLOSE = "\ue001"
+
+_ready_cache = {"checked_at": 0.0, "ready": False}
+_ready_lock = threading.Lock()
+
+
+def parse_timestamp(value: Optional[str]) -> Optional[float]:
+    """Convert a Jira timestamp such as 2024-01-31T12:00:00.000+0000 to epoch seconds."""
+    try:
+        return datetime.fromisoformat(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+def plain_text(value) -> Optional[str]:
+    """Flatten a description (plain text or Atlassian Document Format) to text."""
+    if value is None or isinstance(value, str):
+        return value
+
+    parts = []
+
+    def walk(node):
+        if isinstance(node, dict):
+            if node.get("type") == "text":
+                parts.append(node.get("text", ""))
+            for child in node.get("content", []):
+                walk(child)
+            if node.get("type") in ("paragraph", "heading", "listItem", "codeBlock"):
+                parts.append("\n")
+        elif isinstance(node, list):
+            for child in node:
+                walk(child)
+
+    walk(value)
+    return "".join(parts).strip()
+
+
+def _comments_text(fields: dict) -> str:
+    """Join the text of an issue's comments for the full-text index."""
+    comments = (fields.get("comment") or {}).get("comments", [])
+    return "\n".join(plain_text(c.get("body")) or "" for c in comments)
+
+
+def _fts_rowid(issue: dict) -> Optional[int]:
+    """Full-text index rowid of an issue (its numeric Jira id)."""
+    try:
+        return int(issue.get("id"))
+    except (TypeError, ValueError):
+        return None
+
+
+def _person(fields: dict, name: str) -> tuple:
+    """(email, display name, avatar) of a Jira user field."""
+    user = fields.get(name) or {}
+    return (
+        user.get("emailAddress"),
+        user.get("displayName"),
+        (user.get("avatarUrls") or {}).get("48x48"),
+    )
+
+
+def _words(text: Optional[str]) -> list:
+    """Lowercased words of a text, split as the issues_fts tokenizer splits them."""
+    text = unicodedata.normalize("NFKD", (text or "").lower())
+    text = "".join(c for c in text if not unicodedata.combining(c))
+    return re.findall(r"[^\W_]+", text)
+
+
+def _has_phrase(words: list, phrase: list) -> bool:
+    """Whether phrase occurs as consecutive entries of words."""
+    size = len(phrase)
+    return size > 0 and any(words[i:i + size] == phrase for i in range(len(words) - size + 1))
+
+
+def issue_tools(labels: list, summary: Optional[str], tools: Iterable[str] = TOOLS) -> list:
+    """
+    Tools an issue matches, the way the tool filter's JQL matches them.
+
+    A tool matches a label equal to it in any case, or its words as a
+    phrase in the summary, so "AI" matches "AI review" but not "Email".
+    The mirror's rows and queries and the facet counts all match tools
+    this way.
+    """
+    labels = {label.lower() for label in labels}
+    words = _words(summary)
+    return [tool for tool in tools if tool.lower() in labels or _has_phrase(words, _words(tool))]
+
+
+def mirror_row(issue: dict, synced_at: Optional[float] = None) -> tuple:
+    """
+    Build an issues_mirror row from a raw Jira issue.
+
+    Args:
+        issue: Jira issue with MIRROR_FIELDS
+        synced_at: When the issue was read from Jira (default now)
+
+    Returns:
+        Column values in _COLUMNS order
+    """
+    fields = issue.get("fields", {})
+    created = fields.get("created")
+    updated = fields.get("updated")
+    labels = fields.get("labels") or []
+    return (
+        issue.get("key", "").upper(),
+        issue.get("id"),
+        fields.get("summary"),
+        plain_text(fields.get("description")),
+        json.dumps(labels),
+        json.dumps(issue_tools(labels, fields.get("summary"))),
+        (fields.get("status") or {}).get("name"),
+        (fields.get("priority") or {}).get("name"),
+        (fields.get("issuetype") or {}).get("name"),
+        *_person(fields, "reporter"),
+        *_person(fields, "assignee"),
+        created,
+        updated,
+        parse_timestamp(created),
+        parse_timestamp(updated),
+        synced_at if synced_at is not None else time.time(),
+    )
+
+
+def _column_values(column: str, table: str, key_column: str, keys: list) -> dict:
+    """Map keys to one column of their rows in a table (missing keys are left out)."""
+    if not keys:
+        return {}
+    conn = get_connection()
+    rows = conn.execute(
+        f"SELECT {key_column}, {column} FROM {table} WHERE {key_column} IN ({', '.join('?' for _ in keys)})",
+        tuple(keys),
+    ).fetchall()
+    return {row[0]: row[1] for row in rows}
+
+
+def _counted_values(keys: list) -> dict:
+    """Map issue keys to the (status, priority, type) of their mirror rows."""
+    if not keys:
+        return {}
+    conn = get_connection()
+    rows = conn.execute(
+        "SELECT issue_key, status, priority, issue_type FROM issues_mirror "
+        f"WHERE issue_key IN ({', '.join('?' for _ in keys)})",
+        tuple(keys),
+    ).fetchall()
+    return {row[0]: tuple(row[1:]) for row in rows}
+
+
+def upsert_issues(issues: Iterable[dict], synced_at: Optional[float] = None) -> int:
+    """
+    Insert or replace mirror rows for raw Jira issues.
+
+    A copy older than the stored row (by `updated`) does not overwrite it,
+    so search results lagging behind a webhook, or webhooks delivered out
+    of order, never roll an issue back; the row is only marked as seen.
+    Likewise a copy older than the issue's tombstone does not bring a
+    deleted issue back.
+
+    Args:
+        issues: Jira issues with MIRROR_FIELDS
+        synced_at: When the issues were read from Jira (default now)
+
+    Returns:
+        Number of rows written
+    """
+    synced_at = synced_at if synced_at is not None else time.time()
+    issues = [issue for issue in issues if issue.get("key")]
+    rows = [mirror_row(issue, synced_at) for issue in issues]
+    if not rows:
+        return 0
+
+    keys = [row[0] for row in rows]
+    stored = _column_values("updated_ts", "issues_mirror", "issue_key", keys)
+    counted = _counted_values(keys)
+    removed = _column_values("deleted_at", "issues_tombstones", "issue_key", keys)
+    fresh = []
+    stale_keys = []
+    for issue, row in zip(issues, rows):
+        key, updated_ts = row[0], row[_UPDATED_TS]
+        if updated_ts is not None and removed.get(key) is not None and updated_ts < removed[key]:
+            continue
+        if updated_ts is not None and stored.get(key) is not None and updated_ts < stored[key]:
+            stale_keys.append(key)
+        else:
+            fresh.append((issue, row))
+
+    # Issues without comment data (e.g. some webhook payloads) keep their indexed comments
+    uncommented = [_fts_rowid(i) for i, _ in fresh if "comment" not in i.get("fields", {})]
+    kept_comments = _column_values("comments", "issues_fts", "rowid", [r for r in uncommented if r is not None])
+
+    fts_rows = []
+    for issue, row in fresh:
+        rowid = _fts_rowid(issue)
+        if rowid is not None:
+            fields = issue.get("fields", {})
+            comments = _comments_text(fields) if "comment" in fields else kept_comments.get(rowid, "")
+            fts_rows.append((rowid, row[0], row[2], row[3], comments))
+
+    conn = get_connection()
+    conn.executemany(_UPSERT_SQL, [row for _, row in fresh])
+    _adjust_counters(
+        conn,
+        [counted[row[0]] for _, row in fresh if row[0] in counted],
+        [tuple(row[i] for i in _COUNTED) for _, row in fresh],
+    )
+    conn.executemany(
+        "UPDATE issues_mirror SET synced_at = max(synced_at, ?) WHERE issue_key = ?",
+        [(synced_at, key) for key in stale_keys],
+    )
+    # An issue seen in Jira again is no longer gone
+    conn.executemany("DELETE FROM issues_tombstones WHERE issue_key = ?", [(row[0],) for _, row in fresh])
+    # FTS5 has no upsert: replace each issue's index row
+    conn.executemany("DELETE FROM issues_fts WHERE rowid = ?", [(r[0],) for r in fts_rows])
+    conn.executemany(
+        f"INSERT INTO issues_fts (rowid, {', '.join(_FTS_COLUMNS)}) VALUES (?, ?, ?, ?, ?)",
+        fts_rows,
+    )
+    conn.commit()
+    return len(fresh)
+
+
+def patch_issue(issue_key: str, changes: dict) -> bool:
+    """
+    Apply a change Relay made to an issue to its mirror row.
+
+    Only fields stored as plain columns are patched; the next sync fills in
+    anything else (such as the new `updated` timestamp).
+
+    Args:
+        issue_key: The Jira issue key
+        changes: New values of the changed fields
+
+    Returns:
+        True if a row was updated
+    """
+    updates = {col: changes[field] for field, col in PATCHABLE_FIELDS.items() if field in changes}
+    if not updates:
+        return False
+
+    issue_key = issue_key.upper()
+    before = _counted_values([issue_key]).get(issue_key) if {"status", "priority"} & set(updates) else None
+    if "summary" in updates:
+        labels = _column_values("labels", "issues_mirror", "issue_key", [issue_key]).get(issue_key)
+        if labels is not None:
+            updates["tools"] = json.dumps(issue_tools(json.loads(labels), updates["summary"]))
+
+    conn = get_connection()
+    assignments = ", ".join(f"{col} = ?" for col in updates)
+    cursor = conn.execute(
+        f"UPDATE issues_mirror SET {assignments} WHERE issue_key = ?",
+        (*updates.values(), issue_key),
+    )
+    indexed = {col: value for col, value in updates.items() if col in _FTS_COLUMNS}
+    if indexed:
+        assignments = ", ".join(f"{col} = ?" for col in indexed)
+        conn.execute(
+            f"UPDATE issues_fts SET {assignments} WHERE rowid = ({_FTS_ROWID_OF_KEY})",
+            (*indexed.values(), issue_key),
+        )
+    if before and cursor.rowcount:
+        after = (updates.get("status", before[0]), updates.get("priority", before[1]), before[2])
+        _adjust_counters(conn, [before], [after])
+    conn.commit()
+    return bool(cursor.rowcount)
+
+
+def refresh_tools() -> int:
+    """
+    Recompute the tools column of every mirror row.
+
+    Needed after TOOLS or the way tools are matched changes, or the column
+    is added to an existing mirror.
+
+    Returns:
+        Number of rows whose tools changed
+    """
+    conn = get_connection()
+    rows = conn.execute("SELECT issue_key, labels, summary, tools FROM issues_mirror").fetchall()
+    updates = []
+    for key, labels, summary, tools in rows:
+        value = json.dumps(issue_tools(json.loads(labels or "[]"), summary))
+        if value != tools:
+            updates.append((value, key))
+    conn.executemany("UPDATE issues_mirror SET tools = ? WHERE issue_key = ?", updates)
+    conn.commit()
+    return len(updates)
+
+
+def add_comment_text(issue_key: str, text: str) -> bool:
+    """
+    Add a comment Relay posted to an issue's full-text index row.
+
+    Returns:
+        True if the comment was added
+    """
+    conn = get_connection()
+    # Comments already indexed (e.g. a redelivered event) are not added twice
+    cursor = conn.execute(
+        "UPDATE issues_fts SET comments = trim(coalesce(comments, '') || char(10) || ?) "
+        f"WHERE rowid = ({_FTS_ROWID_OF_KEY}) AND instr(coalesce(comments, ''), ?) = 0",
+        (text, issue_key.upper(), text),
+    )
+    conn.commit()
+    return bool(cursor.rowcount)
+
+
+def tombstoned_at(issue_key: str) -> Optional[float]:
+    """When an issue was found deleted or moved, or None if it has no tombstone."""
+    return _column_values("deleted_at", "issues_tombstones", "issue_key", [issue_key.upper()]).get(
+        issue_key.upper()
+    )
+
+
+def tombstone_issues(reasons: dict, deleted_at: Optional[float] = None) -> int:
+    """
+    Replace the mirror rows of issues that left Relay with tombstones.
+
+    The issue's row and search index entry are removed, and an
+    issues_tombstones row records why and when, so later syncs can tell a
+    removed issue from one that was never seen.
+
+    Args:
+        reasons: Issue key -> reason ("deleted", "moved", "unlabeled")
+        deleted_at: When the issue was found gone (default now)
+
+    Returns:
+        Number of mirror rows removed
+    """
+    keys = [k.upper() for k in reasons]
+    if not keys:
+        return 0
+
+    deleted_at = deleted_at if deleted_at is not None else time.time()
+    counted = _counted_values(keys)
+    conn = get_connection()
+    conn.executemany(
+        """
+        INSERT INTO issues_tombstones (issue_key, jira_id, reason, deleted_at)
+        VALUES (?, (SELECT jira_id FROM issues_mirror WHERE issue_key = ?), ?, ?)
+        ON CONFLICT(issue_key) DO UPDATE SET
+          jira_id = coalesce(excluded.jira_id, jira_id),
+          reason = excluded.reason,
+          deleted_at = excluded.deleted_at
+        """,
+        [(key.upper(), key.upper(), reason, deleted_at) for key, reason in reasons.items()],
+    )
+    placeholders = ", ".join("?" for _ in keys)
+    conn.execute(
+        "DELETE FROM issues_fts WHERE rowid IN "
+        f"(SELECT CAST(jira_id AS INTEGER) FROM issues_mirror WHERE issue_key IN ({placeholders}))",
+        tuple(keys),
+    )
+    cursor = conn.execute(f"DELETE FROM issues_mirror WHERE issue_key IN ({placeholders})", tuple(keys))
+    _adjust_counters(conn, list(counted.values()), [])
+    conn.commit()
+    return cursor.rowcount
+
+
+def keys_synced_before(before: float) -> list:
+    """Keys of mirror rows not written from Jira since `before`."""
+    conn = get_connection()
+    rows = conn.execute("SELECT issue_key FROM issues_mirror WHERE synced_at < ?", (before,)).fetchall()
+    return [row[0] for row in rows]
+
+
+def count_issues() -> int:
+    """Number of issues in the mirror."""
+    conn = get_connection()
+    return conn.execute("SELECT COUNT(*) FROM issues_mirror").fetchone()[0]
+
+
+# =============================================================================
+# SYNC STATE
+# =============================================================================
+
+def get_sync_state(name: str) -> Optional[str]:
+    """Read a sync_state value."""
+    conn = get_connection()
+    result = conn.execute("SELECT value FROM sync_state WHERE name = ?", (name,)).fetchone()
+    return result[0] if result else None
+
+
+def set_sync_state(name: str, value: str) -> None:
+    """Write a sync_state value."""
+    conn = get_connection()
+    conn.execute(
+        """
+        INSERT INTO sync_state (name, value, updated_at) VALUES (?, ?, datetime('now'))
+        ON CONFLICT(name) DO UPDATE SET value = excluded.value, updated_at = excluded.updated_at
+        """,
+        (name, value),
+    )
+    conn.commit()
+
+
+def mark_synced(synced_at: Optional[float] = None) -> None:
+    """Record that the mirror matched Jira as of `synced_at` (default now)."""
+    set_sync_state(SYNCED_AT_STATE, str(synced_at if synced_at is not None else time.time()))
+    with _ready_lock:
+        _ready_cache["checked_at"] = 0.0
+
+
+def mirror_lag() -> Optional[float]:
+    """Seconds since the mirror last matched Jira, or None if it was never loaded."""
+    try:
+        value = get_sync_state(SYNCED_AT_STATE)
+    except Exception as e:
+        logger.warning(f"Could not read issue mirror state: {e}")
+        return None
+    return max(0.0, time.time() - float(value)) if value else None
+
+
+def is_ready() -> bool:
+    """Check whether issue lists should be served from the mirror."""
+    if not MIRROR_READS:
+        return False
+
+    with _ready_lock:
+        if time.monotonic() - _ready_cache["checked_at"] < _READY_CHECK_SECONDS:
+            return _ready_cache["ready"]
+
+    lag = mirror_lag()
+    ready = lag is not None and lag <= MIRROR_MAX_LAG_SECONDS
+    with _ready_lock:
+        if ready != _ready_cache["ready"]:
+            logger.info(f"Issue mirror reads {'enabled' if ready else 'paused'} (lag {lag}s)")
+        _ready_cache.update(checked_at=time.monotonic(), ready=ready)
+    return ready
+
+
+# =============================================================================
+# QUERIES - fetch_issues filters as SQL
+# =============================================================================
+
+def _in_clause(column: str, value: Optional[str], where: list, params: list) -> None:
+    """Add `column IN (...)` for a comma-separated filter value."""
+    items = [v.strip() for v in (value or "").split(",") if v.strip()]
+    if items:
+        where.append(f"{column} IN ({', '.join('?' for _ in items)})")
+        params.extend(items)
+
+
+def _fts_query(search: str) -> Optional[str]:
+    """
+    Turn search text into an FTS5 query.
+
+    Every word must match, as a prefix, in the summary, description or
+    comments. Words are quoted so FTS5 syntax in the input is not
+    interpreted.
+
+    Returns:
+        The MATCH expression, or None if the text has no words
+    """
+    words = re.findall(r"\w+", search)
+    if not words:
+        return None
+    return " ".join(f'"{w}"*' for w in words)
+
+
+def _tool_condition(tool: str, params: list) -> str:
+    """
+    Condition for one tool, matching the issues issue_tools matches.
+
+    TOOLS are read from the tools column; any other tool is compared with
+    the labels, and looked up as a phrase in the full-text index's summary
+    column.
+    """
+    if tool in TOOLS:
+        params.append(tool)
+        return "EXISTS (SELECT 1 FROM json_each(m.tools) WHERE value = ?)"
+
+    params.append(tool.lower())
+    label = "EXISTS (SELECT 1 FROM json_each(m.labels) WHERE lower(value) = ?)"
+    words = _words(tool)
+    if not words:
+        return label
+    params.append(f'summary : "{" ".join(words)}"')
+    return (
+        f"({label} OR CAST(m.jira_id AS INTEGER) IN "
+        "(SELECT rowid FROM issues_fts WHERE issues_fts MATCH ?))"
+    )
+
+
+def _build_where(filters: dict) -> tuple:
+    """
+    Build the WHERE clause matching _build_issues_jql for normalized filters.
+
+    The search filter is left out; query_issues matches it against the
+    full-text index.
+
+    Returns:
+        (SQL condition on issues_mirror aliased as m, parameters)
+    """
+    where = []
+    params = []
+
+    _in_clause("m.status", filters.get("status"), where, params)
+    _in_clause("m.priority", filters.get("priority"), where, params)
+    _in_clause("m.issue_type", filters.get("issue_type"), where, params)
+
+    if filters.get("tool"):
+        tool_conditions = [
+            _tool_condition(t.strip(), params) for t in filters["tool"].split(",") if t.strip()
+        ]
+        if tool_conditions:
+            where.append(f"({' OR '.join(tool_conditions)})")
+
+    if filters.get("reporter"):
+        where.append("m.reporter_email = ?")
+        params.append(filters["reporter"])
+
+    return " AND ".join(where) or "1 = 1", tuple(params)
+
+
+def _user(email: Optional[str], name: Optional[str], avatar: Optional[str]) -> Optional[dict]:
+    if email is None and name is None and avatar is None:
+        return None
+    return {"email": email, "name": name, "avatar": avatar}
+
+
+def _row_to_issue(row: tuple) -> dict:
+    """Map a _LIST_COLUMNS row to the issue list format."""
+    return {
+        "id": row[0],
+        "key": row[1],
+        "summary": row[2],
+        "status": row[3],
+        "priority": row[4],
+        "type": row[5],
+        "reporter": _user(row[6], row[7], row[8]),
+        "assignee": _user(row[9], row[10], row[11]),
+        "created": row[12],
+        "updated": row[13],
+    }
+
+
+def _highlight(snippet: Optional[str]) -> Optional[str]:
+    """HTML-escape a search snippet and wrap its matches in <mark> tags."""
+    if snippet is None:
+        return None
+    return html.escape(snippet).replace(_MARK_OPEN, "<mark>").replace(_MARK_CLOSE, "</mark>")
+
+
+def _source(filters: dict) -> tuple:
+    """
+    Build the source of the mirror rows that match filters.
+
+    Returns:
+        (table list and WHERE clause to follow FROM, parameters, FTS5 match
+        expression or None when there is no search)
+    """
+    where, params = _build_where(filters)
+    match = _fts_query(filters["search"]) if filters.get("search") else None
+    if match:
+        source = (
+            "issues_fts JOIN issues_mirror m ON m.issue_key = issues_fts.issue_key "
+            f"WHERE issues_fts MATCH ? AND {where}"
+        )
+        return source, (match, *params), match
+    return f"issues_mirror m WHERE {where}", params, None
+
+
+def query_issues(filters: dict, page: int = 1, limit: int = 50) -> dict:
+    """
+    Run fetch_issues filters against the mirror.
+
+    Without a search, rows are ordered newest first like the Jira path.
+    With one, they come from the full-text index ranked by BM25 (summary
+    matches weigh most), and each row gets a `snippet` of the best matching
+    text with matches in <mark> tags.
+
+    Args:
+        filters: Normalized filters (see jira_service.normalize_filters)
+        page: Page number (1-indexed)
+        limit: Number of results per page
+
+    Returns:
+        Dict with issues, total, page, and totalPages, as fetch_issues returns
+    """
+    source, params, match = _source(filters)
+    offset = (page - 1) * limit
+    conn = get_connection()
+
+    if match:
+        weights = ", ".join(str(w) for w in _FTS_WEIGHTS)
+        select = (
+            f"SELECT {_LIST_COLUMNS}, "
+            f"snippet(issues_fts, -1, '{_MARK_OPEN}', '{_MARK_CLOSE}', '…', {SNIPPET_TOKENS}) "
+            f"FROM {source} ORDER BY bm25(issues_fts, {weights}), m.created_ts DESC"
+        )
+    else:
+        select = (
+            f"SELECT {_LIST_COLUMNS} FROM {source} ORDER BY m.created_ts DESC"
+        )
+
+    total = conn.execute(f"SELECT COUNT(*) FROM {source}", params).fetchone()[0]
+    rows = conn.execute(f"{select} LIMIT ? OFFSET ?", (*params, limit, offset)).fetchall()
+
+    issues = []
+    for row in rows:
+        issue = _row_to_issue(row)
+        if match:
+            issue["snippet"] = _highlight(row[-1])
+        issues.append(issue)
+
+    return {
+        "issues": issues,
+        "total": total,
+        "page": page,
+        "totalPages": (total + limit - 1) // limit if limit > 0 else 0,
+    }
+
+
+# =============================================================================
+# FACETS - Issue counts per filter value
+# =============================================================================
+
+# Filters that get per-value counts -> the name their counts are returned under
+FACETS = {"status": "status", "priority": "priority", "issue_type": "type", "tool": "tool"}
+
+
+def facet_tools(filters: dict) -> list:
+    """Tool names with facet counts: TOOLS, plus any other tool being filtered on."""
+    tools = list(TOOLS)
+    for tool in (filters.get("tool") or "").split(","):
+        if tool and tool not in tools:
+            tools.append(tool)
+    return tools
+
+
+def count_facets(rows: Iterable[tuple], filters: dict) -> dict:
+    """
+    Tally facet counts from grouped issue rows.
+
+    Each facet is counted under every filter except its own, so a value's
+    count is what the list would total with only that value selected in
+    its facet.
+
+    Args:
+        rows: (status, priority, issue_type, tools matched, count) tuples
+        filters: Normalized filters (see jira_service.normalize_filters)
+
+    Returns:
+        Dict with total (issues matching every filter) and facets, mapping
+        status, priority, type and tool to {value: count}
+    """
+    selected = {
+        name: {v.strip().lower() for v in (filters.get(name) or "").split(",") if v.strip()}
+        for name in FACETS
+    }
+    facets = {facet: {} for facet in FACETS.values()}
+    total = 0
+
+    for status, priority, issue_type, tools, count in rows:
+        values = {"status": [status], "priority": [priority], "issue_type": [issue_type], "tool": tools}
+        matches = {
+            name: not selected[name] or any((v or "").lower() in selected[name] for v in values[name])
+            for name in FACETS
+        }
+        if all(matches.values()):
+            total += count
+        for name, facet in FACETS.items():
+            if all(matched for other, matched in matches.items() if other != name):
+                for value in values[name]:
+                    if value is not None:
+                        facets[facet][value] = facets[facet].get(value, 0) + count
+
+    return {"total": total, "facets": facets}
+
+
+def query_facets(filters: dict) -> dict:
+    """
+    Count mirrored issues per status, priority, type and tool.
+
+    Runs one grouped query over the issues matching the filters that have
+    no facet (reporter and search); count_facets then applies the facet
+    filters to the groups. Without those filters the query reads only the
+    idx_issues_mirror_facets index.
+
+    Args:
+        filters: Normalized filters (see jira_service.normalize_filters)
+
+    Returns:
+        Dict with total and facets, as count_facets returns
+    """
+    source, params, _ = _source({k: v for k, v in filters.items() if k not in FACETS})
+
+    # Tools outside TOOLS are not stored per row and are matched here
+    extra = [tool for tool in facet_tools(filters) if tool not in TOOLS]
+    flag_params = []
+    flags = [f"{_tool_condition(tool, flag_params)} AS t{i}" for i, tool in enumerate(extra)]
+    groups = ["m.status", "m.priority", "m.issue_type", "m.tools"] + [f"t{i}" for i in range(len(extra))]
+
+    rows = get_connection().execute(
+        f"SELECT {', '.join(groups[:4] + flags)}, COUNT(*) FROM {source} GROUP BY {', '.join(groups)}",
+        (*flag_params, *params),
+    ).fetchall()
+
+    grouped = []
+    for status, priority, issue_type, tools, *row in rows:
+        *matched_extra, count = row
+        matched = json.loads(tools or "[]") + [t for t, flag in zip(extra, matched_extra) if flag]
+        grouped.append((status, priority, issue_type, matched, count))
+    return count_facets(grouped, filters)
+
+
+# =============================================================================
+# COUNTERS - Issue totals by status, priority and type
+# =============================================================================
+
+# sync_state row recording when the counters were last rebuilt
+RECOUNTED_STATE = "issue_counters.recounted_at"
+
+# Counter dimensions -> the issue fields they count by
+COUNTER_DIMENSIONS = {
+    "total": (),
+    "status": ("status",),
+    "priority": ("priority",),
+    "type": ("type",),
+    "status,type": ("status", "type"),
+    "status,priority": ("status", "priority"),
+    "priority,type": ("priority", "type"),
+}
+# Joins the values of a pair dimension ("In Progress|Bug")
+_COUNTER_SEPARATOR = "|"
+
+# Counter dimensions -> their key in the stats summary
+_SUMMARY_KEYS = {
+    "status": "byStatus",
+    "priority": "byPriority",
+    "type": "byType",
+    "status,type": "byStatusAndType",
+    "status,priority": "byStatusAndPriority",
+    "priority,type": "byPriorityAndType",
+}
+
+_ADJUST_COUNTER_SQL = (
+    "INSERT INTO issue_counters (dimension, value, count) VALUES (?, ?, ?) "
+    "ON CONFLICT(dimension, value) DO UPDATE SET count = count + excluded.count"
+)
+
+
+def _counter_keys(counted: tuple) -> list:
+    """(dimension, value) of every counter an issue with (status, priority, type) is in."""
+    values = dict(zip(("status", "priority", "type"), counted))
+    keys = []
+    for dimension, fields in COUNTER_DIMENSIONS.items():
+        parts = [values[f] for f in fields]
+        if all(parts):
+            keys.append((dimension, _COUNTER_SEPARATOR.join(parts)))
+    return keys
+
+
+def tally_counters(rows: Iterable[tuple]) -> dict:
+    """
+    Counter values for grouped issues.
+
+    Args:
+        rows: (status, priority, type, count) tuples
+
+    Returns:
+        Dict of (dimension, value) -> count
+    """
+    counts = {}
+    for *counted, count in rows:
+        for key in _counter_keys(tuple(counted)):
+            counts[key] = counts.get(key, 0) + count
+    return counts
+
+
+def _adjust_counters(conn, removed: list, added: list) -> None:
+    """
+    Move issues between counters, in the caller's transaction.
+
+    Args:
+        conn: Connection the mirror rows were written with (not committed)
+        removed: (status, priority, type) of the rows replaced or deleted
+        added: (status, priority, type) of the rows written
+    """
+    changes = tally_counters((*counted, -1) for counted in removed)
+    for key, count in tally_counters((*counted, 1) for counted in added).items():
+        changes[key] = changes.get(key, 0) + count
+    rows = [(dimension, value, count) for (dimension, value), count in changes.items() if count]
+    if rows:
+        conn.executemany(_ADJUST_COUNTER_SQL, rows)
+
+
+def _by_counter(rows: list) -> dict:
+    """Map (dimension, value, count) rows to {(dimension, lowercased value): count}."""
+    return {(dimension, value.lower()): count for dimension, value, count in rows}
+
+
+def recount_counters() -> dict:
+    """
+    Rebuild the counters from issues_mirror.
+
+    Corrects drift from writers that raced between reading a row and
+    adjusting the counters, or from rows changed outside this module.
+
+    Returns:
+        Dict with issues (rows counted) and drift (sum of the differences
+        between the old and rebuilt counters)
+    """
+    conn = get_connection()
+    # Deleting first takes the write lock, so no adjustment slips in between
+    before = _by_counter(
+        conn.execute("DELETE FROM issue_counters RETURNING dimension, value, count").fetchall()
+    )
+    rows = conn.execute(
+        "SELECT status, priority, issue_type, COUNT(*) FROM issues_mirror "
+        "GROUP BY status, priority, issue_type"
+    ).fetchall()
+    counts = tally_counters(rows)
+    conn.executemany(
+        _ADJUST_COUNTER_SQL, [(dimension, value, count) for (dimension, value), count in counts.items()]
+    )
+    after = _by_counter(conn.execute("SELECT dimension, value, count FROM issue_counters").fetchall())
+    conn.commit()
+    set_sync_state(RECOUNTED_STATE, str(time.time()))
+
+    drift = sum(abs(after.get(key, 0) - before.get(key, 0)) for key in set(before) | set(after))
+    if drift and before:
+        logger.warning(f"Issue counters were off by {drift}; rebuilt from the mirror")
+    return {"issues": counts.get(("total", ""), 0), "drift": drift}
+
+
+def counters_ready() -> bool:
+    """Check whether the stats summary can be served from the counters."""
+    return is_ready() and get_sync_state(RECOUNTED_STATE) is not None
+
+
+def summarize_counters(counts: dict) -> dict:
+    """
+    Shape counter values as the stats summary.
+
+    Args:
+        counts: (dimension, value) -> count, as tally_counters returns
+
+    Returns:
+        Dict with total; byStatus, byPriority and byType ({value: count});
+        and byStatusAndType, byStatusAndPriority and byPriorityAndType
+        ({first value: {second value: count}})
+    """
+    summary = {"total": 0, **{key: {} for key in _SUMMARY_KEYS.values()}}
+    for (dimension, value), count in counts.items():
+        if not count:
+            continue
+        if dimension == "total":
+            summary["total"] += count
+            continue
+        if dimension not in _SUMMARY_KEYS:
+            continue
+        *outer, inner = value.split(_COUNTER_SEPARATOR)
+        target = summary[_SUMMARY_KEYS[dimension]]
+        for part in outer:
+            target = target.setdefault(part, {})
+        target[inner] = target.get(inner, 0) + count
+    return summary
+
+
+def counter_summary() -> dict:
+    """The stats summary from the issue_counters table (one small read)."""
+    rows = get_connection().execute("SELECT dimension, value, count FROM issue_counters").fetchall()
+    return summarize_counters({(dimension, value): count for dimension, value, count in rows})
@@ -0,0 +1,484 @@
+"""Cache store and request coalescing for Jira query results.
+
+Provides a bounded, thread-safe LRU cache with per-entry TTL. Entries are
+evicted when the cache exceeds either its entry count or its byte budget,
+and a background sweep removes expired entries that are never read again.
+
+Entries can carry tags (e.g. the issue keys a list page contains) so writes
+can drop or patch only the entries that depend on the changed issue.
+
+Expired entries can be kept for an extra stale window so callers can serve
+them while a fresh value is fetched (stale-while-revalidate).
+
+CacheBackend defines the interface shared by every store; TTLCache is the
+in-process implementation and cache_backends.py adds shared stores.
+
+SingleFlight lets concurrent callers asking for the same key share one
+upstream call instead of each hitting Jira.
+"""
+
+import json
+import zlib
+import time
+import logging
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Callable, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def _estimate_size(data: Any) -> int:
+    """Estimate the memory footprint of a cached value in bytes."""
+    try:
+        return len(json.dumps(data, default=str, separators=(",", ":")))
+    except (TypeError, ValueError):
+        return len(repr(data))
+
+
+def serialize(value: Any) -> bytes:
+    """Encode a cache value as compressed compact JSON."""
+    return zlib.compress(json.dumps(value, default=str, separators=(",", ":")).encode())
+
+
+def deserialize(blob: bytes) -> Any:
+    """Decode a value produced by serialize()."""
+    return json.loads(zlib.decompress(blob).decode())
+
+
+class CacheBackend(ABC):
+    """
+    Interface shared by the Jira cache stores.
+
+    Every entry has a TTL, an optional stale window during which it can still
+    be read through get_stale(), dependency tags and free-form meta.
+
+    Args:
+        ttl_seconds: Default time-to-live for new entries
+        max_entries: Maximum number of entries kept in the cache
+        max_bytes: Maximum estimated size of all cached values
+        sweep_interval: Seconds between background expiry sweeps
+                        (0 disables the sweeper thread)
+        stale_seconds: How long expired entries stay readable through
+                       get_stale() before they are removed
+    """
+
+    name = "base"
+
+    def __init__(
+        self,
+        ttl_seconds: float = 300,
+        max_entries: int = 1000,
+        max_bytes: int = 50 * 1024 * 1024,
+        sweep_interval: float = 60,
+        stale_seconds: float = 0,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.stale_seconds = stale_seconds
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.sweep_interval = sweep_interval
+        self._sweeper: Optional[threading.Thread] = None
+        self._sweeper_lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.stale_hits = 0
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Any]:
+        """Get a value if present and not expired."""
+
+    @abstractmethod
+    def get_stale(self, key: str) -> Optional[tuple]:
+        """Get (data, seconds_past_expiry) for an entry inside its stale window."""
+
+    @abstractmethod
+    def set(
+        self,
+        key: str,
+        data: Any,
+        ttl_seconds: Optional[float] = None,
+        tags: Iterable[str] = (),
+        meta: Optional[dict] = None,
+        stale_seconds: Optional[float] = None,
+    ) -> None:
+        """Store a value with optional TTL/stale overrides, tags and meta."""
+
+    @abstractmethod
+    def delete(self, key: str) -> bool:
+        """Remove a single entry. Returns True if it existed."""
+
+    @abstractmethod
+    def clear(self) -> int:
+        """Remove all entries. Returns the number of entries removed."""
+
+    @abstractmethod
+    def keys(self) -> list:
+        """Snapshot of the current keys."""
+
+    @abstractmethod
+    def entries_for_tag(self, tag: str) -> list:
+        """Return (key, data, meta) for every readable entry carrying a tag."""
+
+    @abstractmethod
+    def invalidate_tag(self, tag: str) -> int:
+        """Remove every entry carrying a tag. Returns the number removed."""
+
+    @abstractmethod
+    def patch(self, key: str, updater: Callable[[Any], Any]) -> bool:
+        """Replace an entry's value in place, keeping its TTL, tags and meta."""
+
+    def sweep(self) -> int:
+        """Remove entries past their stale window. Returns the number removed."""
+        return 0
+
+    def stats(self) -> dict:
+        """Return cache usage counters."""
+        return {
+            "backend": self.name,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "stale_hits": self.stale_hits,
+        }
+
+    def __len__(self) -> int:
+        return len(self.keys())
+
+    @abstractmethod
+    def __contains__(self, key: str) -> bool:
+        """Check a key is present and not expired."""
+
+    # -------------------------------------------------------------------------
+    # Background sweeper
+    # -------------------------------------------------------------------------
+
+    def _ensure_sweeper(self) -> None:
+        """Start the expiry sweeper thread on first use."""
+        if self.sweep_interval <= 0 or self._sweeper is not None:
+            return
+        with self._sweeper_lock:
+            if self._sweeper is not None:
+                return
+            self._sweeper = threading.Thread(
+                target=self._sweep_loop, name="jira-cache-sweeper", daemon=True
+            )
+            self._sweeper.start()
+
+    def _sweep_loop(self) -> None:
+        while True:
+            time.sleep(self.sweep_interval)
+            try:
+                self.sweep()
+            except Exception as e:
+                logger.error(f"Cache sweep failed: {e}")
+
+
+class TTLCache(CacheBackend):
+    """
+    Thread-safe in-process LRU cache with per-entry TTL and size limits.
+
+    Values are stored as live objects; see CacheBackend for the arguments.
+    """
+
+    name = "memory"
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+        # { cache_key: { "data": ..., "expires_at": timestamp,
+        #                "stale_until": timestamp, "size": bytes,
+        #                "tags": set, "meta": dict } }
+        self._entries: "OrderedDict[str, dict]" = OrderedDict()
+        # { tag: { cache_key, ... } }
+        self._tags: dict = {}
+        self._lock = threading.RLock()
+        self._total_bytes = 0
+
+    # -------------------------------------------------------------------------
+    # Public API
+    # -------------------------------------------------------------------------
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get a value if present and not expired, marking it recently used."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            now = time.time()
+            if entry["expires_at"] <= now:
+                if entry["stale_until"] <= now:
+                    self._remove(key)
+                    self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry["data"]
+
+    def get_stale(self, key: str) -> Optional[tuple]:
+        """
+        Get an entry that may have expired but is still inside its stale window.
+
+        Returns:
+            (data, seconds_past_expiry) or None if the entry is missing or
+            beyond the stale window. Fresh entries report 0 seconds.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            now = time.time()
+            if entry["stale_until"] <= now:
+                self._remove(key)
+                self.expirations += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stale_hits += 1
+            return entry["data"], max(0.0, now - entry["expires_at"])
+
+    def set(
+        self,
+        key: str,
+        data: Any,
+        ttl_seconds: Optional[float] = None,
+        tags: Iterable[str] = (),
+        meta: Optional[dict] = None,
+        stale_seconds: Optional[float] = None,
+    ) -> None:
+        """
+        Store a value, evicting least recently used entries if over budget.
+
+        Args:
+            key: Cache key
+            data: Value to store
+            ttl_seconds: Override the default TTL for this entry
+            tags: Dependency tags used by invalidate_tag()/entries_for_tag()
+            meta: Extra information about the entry (e.g. the query filters)
+            stale_seconds: Override the default stale window for this entry
+        """
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        stale = self.stale_seconds if stale_seconds is None else stale_seconds
+        size = _estimate_size(data)
+
+        if size > self.max_bytes:
+            logger.warning(
+                f"Cache SKIP for key: {key[:12]}... ({size} bytes exceeds budget)"
+            )
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            entry_tags = set(tags)
+            expires_at = time.time() + ttl
+            self._entries[key] = {
+                "data": data,
+                "expires_at": expires_at,
+                "stale_until": expires_at + stale,
+                "size": size,
+                "tags": entry_tags,
+                "meta": meta or {},
+            }
+            for tag in entry_tags:
+                self._tags.setdefault(tag, set()).add(key)
+            self._total_bytes += size
+            self._evict()
+
+        self._ensure_sweeper()
+
+    def delete(self, key: str) -> bool:
+        """Remove a single entry. Returns True if it existed."""
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+                return True
+            return False
+
+    def clear(self) -> int:
+        """Remove all entries. Returns the number of entries removed."""
+        with self._lock:
+            count = len(self._entries)
+            self._entries.clear()
+            self._tags.clear()
+            self._total_bytes = 0
+            return count
+
+    def entries_for_tag(self, tag: str) -> list:
+        """Return (key, data, meta) for every readable entry carrying a tag."""
+        now = time.time()
+        with self._lock:
+            return [
+                (key, self._entries[key]["data"], self._entries[key]["meta"])
+                for key in self._tags.get(tag, ())
+                if self._entries[key]["stale_until"] > now
+            ]
+
+    def invalidate_tag(self, tag: str) -> int:
+        """Remove every entry carrying a tag. Returns the number removed."""
+        with self._lock:
+            keys = list(self._tags.get(tag, ()))
+            for key in keys:
+                self._remove(key)
+            return len(keys)
+
+    def patch(self, key: str, updater: Callable[[Any], Any]) -> bool:
+        """
+        Replace an entry's value in place, keeping its TTL, tags and meta.
+
+        Args:
+            key: Cache key
+            updater: Called with the current value, returns the new value
+
+        Returns:
+            True if the entry existed and was patched
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry["stale_until"] <= time.time():
+                return False
+            data = updater(entry["data"])
+            size = _estimate_size(data)
+            self._total_bytes += size - entry["size"]
+            entry["data"] = data
+            entry["size"] = size
+            self._evict()
+            return True
+
+    def keys(self) -> list:
+        """Snapshot of the current keys, least recently used first."""
+        with self._lock:
+            return list(self._entries.keys())
+
+    def sweep(self) -> int:
+        """Remove entries past their stale window. Returns the number removed."""
+        now = time.time()
+        with self._lock:
+            expired = [k for k, e in self._entries.items() if e["stale_until"] <= now]
+            for key in expired:
+                self._remove(key)
+            self.expirations += len(expired)
+        if expired:
+            logger.info(f"Cache SWEEP removed {len(expired)} expired entries")
+        return len(expired)
+
+    def stats(self) -> dict:
+        """Return cache usage counters."""
+        with self._lock:
+            return {
+                **super().stats(),
+                "entries": len(self._entries),
+                "tags": len(self._tags),
+                "bytes": self._total_bytes,
+            }
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and entry["expires_at"] > time.time()
+
+    # -------------------------------------------------------------------------
+    # Internals (callers must hold self._lock)
+    # -------------------------------------------------------------------------
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        self._total_bytes -= entry["size"]
+        for tag in entry["tags"]:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+    def _evict(self) -> None:
+        while self._entries and (
+            len(self._entries) > self.max_entries or self._total_bytes > self.max_bytes
+        ):
+            key, _ = next(iter(self._entries.items()))
+            self._remove(key)
+            self.evictions += 1
+
+
+class SingleFlightTimeout(TimeoutError):
+    """Raised when a caller gives up waiting for an in-flight call."""
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent calls that share a key into one execution.
+
+    The first caller for a key runs the function; callers arriving while it
+    is in flight wait for it and receive the same result or exception.
+    """
+
+    def __init__(self):
+        # { key: { "event": Event, "result": ..., "error": Exception, "waiters": int } }
+        self._calls: dict = {}
+        self._lock = threading.Lock()
+
+        self.calls = 0
+        self.coalesced = 0
+
+    def do(self, key: str, func: Callable[[], Any], timeout: Optional[float] = None) -> Any:
+        """
+        Run func once for all concurrent callers with the same key.
+
+        Args:
+            key: Key identifying the call
+            func: Function to run
+            timeout: Seconds a waiting caller waits for the running call
+                before raising SingleFlightTimeout (None waits indefinitely)
+        """
+        with self._lock:
+            self.calls += 1
+            call = self._calls.get(key)
+            if call is not None:
+                call["waiters"] += 1
+                self.coalesced += 1
+                leader = False
+            else:
+                call = {"event": threading.Event(), "result": None, "error": None, "waiters": 0}
+                self._calls[key] = call
+                leader = True
+
+        if not leader:
+            if not call["event"].wait(timeout):
+                raise SingleFlightTimeout(f"Gave up waiting for in-flight call: {key[:18]}...")
+            if call["error"] is not None:
+                raise call["error"]
+            return call["result"]
+
+        try:
+            call["result"] = func()
+            return call["result"]
+        except Exception as e:
+            call["error"] = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call["event"].set()
+            if call["waiters"]:
+                logger.info(f"Coalesced {call['waiters']} calls for key: {key[:18]}...")
+
+    def stats(self) -> dict:
+        """Return coalescing counters."""
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "coalesced": self.coalesced,
+                "in_flight": len(self._calls),
+            }
@@ -1,56 +1,144 @@
 """Jira Cloud API service for Relay.
 
 Provides functions to interact with Jira Cloud REST API v3.
-Includes in-memory caching for performance optimization.
+Includes a bounded in-memory cache for performance optimization.
 """
 
 import os
+import json
 import time
+import socket
 import logging
+import uuid
 import hashlib
-from typing import Optional
-from datetime import datetime
+import threading
+import contextvars
+from typing import Iterator, Optional
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 
+import requests
 from atlassian import Jira
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+
+from . import deadline, issue_mirror
+from .deadline import DeadlineExceeded
+from .jira_cache import CacheBackend, SingleFlight, SingleFlightTimeout, TTLCache
+from .cache_backends import RedisCache, SQLiteCache
+from .circuit_breaker import CircuitBreaker, CircuitOpenError, is_upstream_failure
+from .retry_policy import AMBIGUOUS, PERMANENT, RetryBudget, classify_error, retry_delay
 
 logger = logging.getLogger(__name__)
 
 # =============================================================================
-# JIRA CACHE - Simple in-memory cache with TTL for issue list queries
+# JIRA CACHE - Bounded LRU cache with TTL for issue list queries
 # =============================================================================
 
-CACHE_TTL_SECONDS = 300  # 5 minutes
+# Cache backend: "memory" (per process), "sqlite" (shared file on one host)
+# or "redis" (shared Redis-protocol server)
+CACHE_BACKEND = os.getenv("JIRA_CACHE_BACKEND", "memory").lower()
+
+CACHE_TTL_SECONDS = int(os.getenv("JIRA_CACHE_TTL_SECONDS", "300"))  # 5 minutes
+CACHE_MAX_ENTRIES = int(os.getenv("JIRA_CACHE_MAX_ENTRIES", "1000"))
+CACHE_MAX_BYTES = int(os.getenv("JIRA_CACHE_MAX_BYTES", str(50 * 1024 * 1024)))  # 50 MB
+CACHE_SWEEP_SECONDS = int(os.getenv("JIRA_CACHE_SWEEP_SECONDS", "60"))
+# Hard-staleness ceiling: expired entries younger than this are served while
+# a background refresh runs; older ones block on Jira (0 disables)
+CACHE_STALE_SECONDS = int(os.getenv("JIRA_CACHE_STALE_SECONDS", "600"))
+# How long expired entries are kept as last known data for when Jira is down
+CACHE_RETAIN_SECONDS = int(os.getenv("JIRA_CACHE_RETAIN_SECONDS", "3600"))
+
+
+def _create_cache() -> CacheBackend:
+    """Create the cache backend selected by JIRA_CACHE_BACKEND."""
+    options = {
+        "ttl_seconds": CACHE_TTL_SECONDS,
+        "max_entries": CACHE_MAX_ENTRIES,
+        "max_bytes": CACHE_MAX_BYTES,
+        "sweep_interval": CACHE_SWEEP_SECONDS,
+        "stale_seconds": max(CACHE_STALE_SECONDS, CACHE_RETAIN_SECONDS),
+    }
+
+    try:
+        if CACHE_BACKEND == "sqlite":
+            path = os.getenv("JIRA_CACHE_PATH", "/tmp/relay-jira-cache.db")
+            return SQLiteCache(path=path, **options)
+
+        if CACHE_BACKEND == "redis":
+            url = os.getenv("JIRA_CACHE_URL") or os.getenv("REDIS_URL")
+            if not url:
+                raise ValueError("JIRA_CACHE_URL must be set for the redis cache backend")
+            return RedisCache(url=url, **options)
+
+        if CACHE_BACKEND != "memory":
+            raise ValueError(f"Unknown JIRA_CACHE_BACKEND '{CACHE_BACKEND}'")
+    except Exception as e:
+        logger.error(f"Failed to create {CACHE_BACKEND} cache, using memory: {e}")
+
+    return TTLCache(**options)
+
 
-# Cache structure: { cache_key: { "data": ..., "expires_at": timestamp } }
-JIRA_CACHE: dict = {}
+JIRA_CACHE = _create_cache()
+
+# Coalesces concurrent identical Jira reads into one upstream call
+_SINGLE_FLIGHT = SingleFlight()
+
+# Issue detail cache: entries are served without checking Jira for
+# DETAIL_FRESH_SECONDS, then revalidated against the issue's `updated`
+# timestamp for up to DETAIL_RETAIN_SECONDS before a full refetch
+DETAIL_FRESH_SECONDS = int(os.getenv("JIRA_DETAIL_FRESH_SECONDS", "15"))
+DETAIL_RETAIN_SECONDS = int(os.getenv("JIRA_DETAIL_RETAIN_SECONDS", "3600"))
+
+# Cache keys with a background refresh in flight
+_refreshing: set = set()
+_refreshing_lock = threading.Lock()
 
 
 def _get_cache_key(prefix: str, **kwargs) -> str:
     """Generate a cache key from prefix and kwargs."""
     sorted_items = sorted((k, v) for k, v in kwargs.items() if v is not None)
     key_str = f"{prefix}:{sorted_items}"
-    return hashlib.md5(key_str.encode()).hexdigest()
+    return f"{prefix}:{hashlib.md5(key_str.encode()).hexdigest()}"
+
+
+def _issues_cache_key(
+    status: Optional[str] = None,
+    priority: Optional[str] = None,
+    issue_type: Optional[str] = None,
+    tool: Optional[str] = None,
+    reporter: Optional[str] = None,
+    search: Optional[str] = None,
+) -> str:
+    """Cache key for the result window of one normalized fetch_issues filter set."""
+    return _get_cache_key(
+        "issues",
+        status=status,
+        priority=priority,
+        issue_type=issue_type,
+        tool=tool,
+        reporter=reporter,
+        search=search,
+    )
 
 
 def _get_from_cache(cache_key: str) -> Optional[dict]:
     """Get data from cache if not expired."""
-    entry = JIRA_CACHE.get(cache_key)
-    if entry and entry["expires_at"] > time.time():
-        logger.info(f"Cache HIT for key: {cache_key[:12]}...")
-        return entry["data"]
-    if entry:
-        # Expired, remove it
-        del JIRA_CACHE[cache_key]
-    return None
+    data = JIRA_CACHE.get(cache_key)
+    if data is not None:
+        logger.info(f"Cache HIT for key: {cache_key[:18]}...")
+    return data
 
 
-def _set_cache(cache_key: str, data: dict) -> None:
-    """Store data in cache with TTL."""
-    JIRA_CACHE[cache_key] = {
-        "data": data,
-        "expires_at": time.time() + CACHE_TTL_SECONDS,
-    }
-    logger.info(f"Cache SET for key: {cache_key[:12]}... (TTL: {CACHE_TTL_SECONDS}s)")
+def _set_cache(
+    cache_key: str,
+    data: dict,
+    tags: tuple = (),
+    meta: Optional[dict] = None,
+) -> None:
+    """Store data in cache with TTL, tagged with the issues it depends on."""
+    JIRA_CACHE.set(cache_key, data, tags=tags, meta=meta)
+    logger.info(f"Cache SET for key: {cache_key[:18]}... (TTL: {CACHE_TTL_SECONDS}s)")
 
 
 def _invalidate_cache(pattern: Optional[str] = None) -> None:
@@ -61,27 +149,482 @@ def _invalidate_cache(pattern: Optional[str] = None) -> None:
         pattern: If provided, only invalidate keys containing this pattern.
                  If None, clear the entire cache.
     """
-    global JIRA_CACHE
     if pattern is None:
-        count = len(JIRA_CACHE)
-        JIRA_CACHE = {}
+        count = JIRA_CACHE.clear()
         logger.info(f"Cache CLEARED ({count} entries)")
+        schedule_cache_warmup()
     else:
-        keys_to_remove = [k for k in JIRA_CACHE.keys()]
+        keys_to_remove = [k for k in JIRA_CACHE.keys() if pattern in k]
         for key in keys_to_remove:
-            del JIRA_CACHE[key]
+            JIRA_CACHE.delete(key)
         if keys_to_remove:
             logger.info(f"Cache INVALIDATED {len(keys_to_remove)} entries")
 
-# Singleton Jira client
-_jira_client: Optional[Jira] = None
+
+def get_cache_stats() -> dict:
+    """Return cache and request coalescing counters."""
+    return {
+        "cache": JIRA_CACHE.stats(),
+        "single_flight": _SINGLE_FLIGHT.stats(),
+    }
+
+
+def _coalesced(key: str, func):
+    """
+    Run func through the single-flight group, sharing it with concurrent
+    callers, but wait for someone else's call no longer than the request
+    deadline allows.
+    """
+    try:
+        return _SINGLE_FLIGHT.do(key, func, timeout=deadline.remaining())
+    except SingleFlightTimeout:
+        raise DeadlineExceeded("Waiting for an in-flight Jira call")
+
+
+def _refresh_in_background(cache_key: str, refresh) -> None:
+    """
+    Run a cache refresh in a background thread, at most one per key.
+
+    Args:
+        cache_key: The cache key being refreshed
+        refresh: Callable that fetches fresh data and stores it in the cache
+    """
+    with _refreshing_lock:
+        if cache_key in _refreshing:
+            return
+        _refreshing.add(cache_key)
+
+    def _run():
+        try:
+            refresh()
+            logger.info(f"Cache REFRESHED key: {cache_key[:18]}...")
+        except Exception as e:
+            logger.warning(f"Background refresh failed for {cache_key[:18]}...: {e}")
+        finally:
+            with _refreshing_lock:
+                _refreshing.discard(cache_key)
+
+    threading.Thread(target=_run, name="jira-cache-refresh", daemon=True).start()
+
+
+# =============================================================================
+# CACHE DEPENDENCY TRACKING - Invalidate only list pages affected by a write
+# =============================================================================
+
+# Tag carried by every cached issue list page
+LIST_CACHE_TAG = "issues:list"
+# Tag carried by cached facet counts
+FACETS_CACHE_TAG = "issues:facets"
+
+# Statuses a newly created issue can start in (used to match status filters)
+INITIAL_STATUSES = [
+    s.strip() for s in os.getenv("JIRA_INITIAL_STATUSES", "Open,To Do").split(",") if s.strip()
+]
+
+# Issue fields shown in list rows that can be patched in place
+_LIST_PATCHABLE_FIELDS = ("summary", "status", "priority")
+
+# Issue fields that decide whether an issue matches a list filter
+_FILTER_DEPENDENCIES = {
+    "status": ("status",),
+    "priority": ("priority",),
+    "type": ("issue_type",),
+    "reporter": ("reporter",),
+    "summary": ("tool", "search"),
+    "description": ("search",),
+}
+
+# Issue fields whose values facets count (summary and labels decide the tool)
+_FACET_COUNTED_FIELDS = ("status", "priority", "type", "summary", "labels")
+# Filters that facet counts are taken under but not broken down by
+_FACET_BASE_FILTERS = ("reporter", "search")
+
+
+def _issue_tag(issue_key: str) -> str:
+    """Cache tag for list pages that contain an issue."""
+    return f"issue:{issue_key.upper()}"
+
+
+def _split_filter(value: Optional[str]) -> list:
+    """Split a comma-separated filter value into lowercase items."""
+    if not value:
+        return []
+    return [v.strip().lower() for v in value.split(",") if v.strip()]
+
+
+def _filters_could_match(filters: dict, issue: dict) -> bool:
+    """
+    Check whether an issue could appear in a list page with these filters.
+
+    Only the fields present in `issue` are checked; anything unknown is
+    assumed to match so the check errs on the side of invalidating.
+
+    Args:
+        filters: The fetch_issues filters the page was cached with
+        issue: Known issue fields (status, priority, type, reporter,
+               summary, description, labels)
+
+    Returns:
+        True if the issue may belong to the page's result set
+    """
+    if filters.get("status") and "status" in issue:
+        candidates = issue["status"] if isinstance(issue["status"], list) else [issue["status"]]
+        if not {c.lower() for c in candidates} & set(_split_filter(filters["status"])):
+            return False
+
+    if filters.get("priority") and "priority" in issue:
+        if (issue["priority"] or "").lower() not in _split_filter(filters["priority"]):
+            return False
+
+    if filters.get("issue_type") and "type" in issue:
+        if (issue["type"] or "").lower() not in _split_filter(filters["issue_type"]):
+            return False
+
+    if filters.get("reporter") and "reporter" in issue:
+        if (issue["reporter"] or "").lower() != filters["reporter"].strip().lower():
+            return False
+
+    if filters.get("tool") and "summary" in issue:
+        tools = _split_filter(filters["tool"])
+        if not issue_mirror.issue_tools(issue.get("labels", []), issue["summary"], tools):
+            return False
+
+    if filters.get("search") and "summary" in issue and "description" in issue:
+        text = f"{issue['summary'] or ''} {issue['description'] or ''}".lower()
+        terms = [t for t in filters["search"].lower().split() if t]
+        if terms and not any(t in text for t in terms):
+            return False
+
+    return True
+
+
+def _patch_list_page(window: dict, issue_key: str, changes: dict) -> dict:
+    """Return a copy of a cached list window with one issue's fields updated."""
+    updates = {f: changes[f] for f in _LIST_PATCHABLE_FIELDS if f in changes}
+    segments = [
+        [seg_start, [{**i, **updates} if i.get("key") == issue_key else i for i in seg_issues]]
+        for seg_start, seg_issues in window.get("segments", [])
+    ]
+    return {**window, "segments": segments}
+
+
+def _invalidate_issue(
+    issue_key: str,
+    changes: Optional[dict] = None,
+    sync_mirror: bool = True,
+    warm: bool = True,
+) -> None:
+    """
+    Update cached list pages after an issue was modified.
+
+    Pages that contain the issue are patched in place when the change cannot
+    affect their filter membership, and dropped otherwise. Pages that filter
+    on a changed field and could now match the issue are dropped as well.
+    Unrelated pages stay warm.
+
+    Args:
+        issue_key: The Jira issue key
+        changes: The new values of the changed fields (None drops every
+                 page containing the issue)
+        sync_mirror: Also apply the change to the local issue mirror (off
+                     when the caller has already written the mirror row)
+        warm: Schedule a cache warm-up if list pages were dropped (off for
+              webhook-driven invalidation, which comes in bursts)
+    """
+    issue_key = issue_key.upper()
+    if sync_mirror:
+        _sync_mirror_row(issue_key, changes)
+
+    # Cached detail payloads are always refetched after a write
+    JIRA_CACHE.delete(_detail_cache_key(issue_key))
+    JIRA_CACHE.delete(_brief_cache_key(issue_key))
+
+    _invalidate_facets(changes)
+
+    if changes is None:
+        dropped = JIRA_CACHE.invalidate_tag(_issue_tag(issue_key))
+        if dropped:
+            logger.info(f"Cache INVALIDATED {dropped} entries for {issue_key}")
+        return
+
+    dropped = 0
+    patched = 0
+    affected_filters = {
+        f for field in changes for f in _FILTER_DEPENDENCIES.get(field, ())
+    }
+    unpatchable = set(changes) - set(_LIST_PATCHABLE_FIELDS) - {"description"}
+
+    # Pages that currently contain the issue
+    containing = set()
+    for key, _, meta in JIRA_CACHE.entries_for_tag(_issue_tag(issue_key)):
+        containing.add(key)
+        filters = meta.get("filters", {})
+        if unpatchable or any(filters.get(f) for f in affected_filters):
+            dropped += JIRA_CACHE.delete(key)
+        elif JIRA_CACHE.patch(key, lambda page: _patch_list_page(page, issue_key, changes)):
+            patched += 1
+
+    # Pages the issue may have moved into
+    if affected_filters:
+        for key, _, meta in JIRA_CACHE.entries_for_tag(LIST_CACHE_TAG):
+            if key in containing:
+                continue
+            filters = meta.get("filters", {})
+            if any(filters.get(f) for f in affected_filters) and _filters_could_match(filters, changes):
+                dropped += JIRA_CACHE.delete(key)
+
+    if dropped or patched:
+        logger.info(f"Cache for {issue_key}: {dropped} entries dropped, {patched} patched")
+    if dropped and warm:
+        schedule_cache_warmup()
+
+
+def _invalidate_for_new_issue(issue: dict, warm: bool = True) -> None:
+    """
+    Drop cached list pages whose filters could match a newly created issue.
+
+    New issues sort first (created DESC), so every page of a matching filter
+    set shifts by one row and is dropped. Filter sets that cannot contain the
+    issue stay warm.
+
+    Args:
+        issue: Known fields of the new issue (type, priority, reporter,
+               summary, description, labels)
+        warm: Schedule a cache warm-up if list pages were dropped
+    """
+    issue = {"status": INITIAL_STATUSES, **issue}
+    _invalidate_facets(issue, is_new=True)
+    dropped = 0
+    for key, _, meta in JIRA_CACHE.entries_for_tag(LIST_CACHE_TAG):
+        if _filters_could_match(meta.get("filters", {}), issue):
+            dropped += JIRA_CACHE.delete(key)
+    if dropped:
+        logger.info(f"Cache INVALIDATED {dropped} list entries for new issue")
+        if warm:
+            schedule_cache_warmup()
+
+
+def _invalidate_facets(issue: Optional[dict], is_new: bool = False) -> None:
+    """
+    Drop cached issue counts (FACETS_CACHE_TAG) that a write could change.
+
+    Counts cover every issue matching an entry's reporter and search
+    filters, whatever its status, priority, type or tool, so an entry is
+    kept only when the issue cannot be among them or the write changed no
+    counted field.
+
+    Args:
+        issue: Known fields of the issue: the new values of the changed
+               fields, or every field of a new issue (None drops all entries)
+        is_new: The issue was just created
+    """
+    dropped = 0
+    for key, _, meta in JIRA_CACHE.entries_for_tag(FACETS_CACHE_TAG):
+        filters = meta.get("filters", {})
+        base = {f: filters.get(f) for f in _FACET_BASE_FILTERS}
+        if issue is None:
+            affected = True
+        elif is_new:
+            affected = _filters_could_match(base, issue)
+        else:
+            # A changed reporter, summary or description may move the issue
+            # into or out of the counted set
+            moved = {f for field in issue for f in _FILTER_DEPENDENCIES.get(field, ())}
+            affected = any(base.get(f) for f in moved) or (
+                bool(set(issue) & set(_FACET_COUNTED_FIELDS)) and _filters_could_match(base, issue)
+            )
+        if affected:
+            dropped += JIRA_CACHE.delete(key)
+    if dropped:
+        logger.info(f"Cache INVALIDATED {dropped} facet entries")
+
+
+# =============================================================================
+# CACHE WARM-UP - Prefetch the default issue list views in the background
+# =============================================================================
+
+# Seconds to wait before warming, so bursts of writes trigger one warm-up
+WARM_DELAY_SECONDS = float(os.getenv("JIRA_CACHE_WARM_DELAY", "2"))
+# Minimum seconds between two warm-up fetches
+WARM_INTERVAL_SECONDS = float(os.getenv("JIRA_CACHE_WARM_INTERVAL", "1"))
+# Number of recently active users whose "my issues" view is warmed
+WARM_REPORTERS = int(os.getenv("JIRA_CACHE_WARM_REPORTERS", "10"))
+
+# The views the Issues page and dashboard open with
+DEFAULT_WARM_VIEWS = [
+    {"page": 1, "limit": 20},
+    {"page": 1, "limit": 5},
+    {"status": "Open", "page": 1, "limit": 20},
+    {"status": "To Do", "page": 1, "limit": 20},
+    {"status": "In Progress", "page": 1, "limit": 20},
+    {"status": "In Review", "page": 1, "limit": 20},
+    {"status": "Done", "page": 1, "limit": 20},
+]
+
+_WARM_VIEW_FIELDS = ("status", "priority", "issue_type", "tool", "reporter", "search")
+
+_warmup_lock = threading.Lock()
+_warmup_state = {"running": False, "pending": False}
+
+
+def get_warm_views() -> list:
+    """
+    Get the fetch_issues views to prefetch.
+
+    JIRA_CACHE_WARM_VIEWS can hold a JSON list of fetch_issues arguments to
+    replace the defaults. The "my issues" view of recently active users is
+    added on top.
+
+    Returns:
+        List of dicts of fetch_issues keyword arguments
+    """
+    views = DEFAULT_WARM_VIEWS
+    raw = os.getenv("JIRA_CACHE_WARM_VIEWS")
+    if raw:
+        try:
+            views = json.loads(raw)
+        except ValueError as e:
+            logger.error(f"Invalid JIRA_CACHE_WARM_VIEWS, using defaults: {e}")
+
+    views = list(views)
+    if WARM_REPORTERS > 0:
+        try:
+            from ..utils.database import get_recently_active_emails
+
+            for email in get_recently_active_emails(limit=WARM_REPORTERS):
+                views.append({"reporter": email, "page": 1, "limit": 20})
+        except Exception as e:
+            logger.warning(f"Could not load active users for cache warm-up: {e}")
+
+    return views
+
+
+def warm_cache(views: Optional[list] = None) -> int:
+    """
+    Prefetch issue list views that are not already cached.
+
+    Fetches run one at a time, at most one every WARM_INTERVAL_SECONDS, and
+    wait while interactive Jira reads are in flight.
+
+    Args:
+        views: fetch_issues keyword arguments (defaults to get_warm_views())
+
+    Returns:
+        Number of views fetched from Jira
+    """
+    warmed = 0
+    for view in get_warm_views() if views is None else views:
+        kwargs = {k: view.get(k) for k in _WARM_VIEW_FIELDS}
+        kwargs["page"] = int(view.get("page", 1))
+        kwargs["limit"] = int(view.get("limit", 50))
+
+        filters = normalize_filters(**{k: kwargs[k] for k in _WARM_VIEW_FIELDS})
+        window = _get_from_cache(_issues_cache_key(**filters))
+        if window and _page_from_window(window, (kwargs["page"] - 1) * kwargs["limit"], kwargs["limit"], kwargs["page"]):
+            continue
+
+        # Yield to interactive traffic
+        waited = 0.0
+        while _SINGLE_FLIGHT.stats()["in_flight"] > 0 and waited < 10:
+            time.sleep(0.5)
+            waited += 0.5
+
+        try:
+            fetch_issues(**kwargs, skip_cache=True)
+            warmed += 1
+        except Exception as e:
+            logger.warning(f"Cache warm-up failed for view {view}: {e}")
+            break
+
+        time.sleep(WARM_INTERVAL_SECONDS)
+
+    if warmed:
+        logger.info(f"Cache WARMED {warmed} issue list views")
+    return warmed
+
+
+def schedule_cache_warmup(delay: float = WARM_DELAY_SECONDS) -> None:
+    """
+    Warm the cache in a background thread without blocking the caller.
+
+    Only one warm-up runs at a time; requests made while it runs are merged
+    into a single follow-up pass. Nothing is warmed while the issue mirror
+    answers list requests, since the warmed pages would not be read.
+
+    Args:
+        delay: Seconds to wait before starting
+    """
+    if issue_mirror.is_ready():
+        return
+    with _warmup_lock:
+        if _warmup_state["running"]:
+            _warmup_state["pending"] = True
+            return
+        _warmup_state["running"] = True
+
+    def _run():
+        while True:
+            time.sleep(delay)
+            try:
+                warm_cache()
+            except Exception as e:
+                logger.warning(f"Cache warm-up failed: {e}")
+            with _warmup_lock:
+                if not _warmup_state["pending"]:
+                    _warmup_state["running"] = False
+                    return
+                _warmup_state["pending"] = False
+
+    threading.Thread(target=_run, name="jira-cache-warmup", daemon=True).start()
+
+
+# =============================================================================
+# JIRA CLIENT - Per-thread clients sharing one tuned connection pool
+# =============================================================================
+
+# Pooled connections to Jira; should match the number of worker threads
+JIRA_POOL_SIZE = int(os.getenv("JIRA_POOL_SIZE", "10"))
+JIRA_CONNECT_TIMEOUT = float(os.getenv("JIRA_CONNECT_TIMEOUT", "5"))
+JIRA_READ_TIMEOUT = float(os.getenv("JIRA_READ_TIMEOUT", "30"))
+
+
+class _KeepAliveAdapter(HTTPAdapter):
+    """HTTP adapter that enables TCP keep-alive on pooled connections."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs["socket_options"] = HTTPConnection.default_socket_options + [
+            (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+        ]
+        super().init_poolmanager(*args, **kwargs)
+
+
+# One adapter (and so one connection pool) shared by every thread's client
+_jira_adapter: Optional[HTTPAdapter] = None
+_jira_adapter_lock = threading.Lock()
+
+# Each thread gets its own Jira client and requests.Session, since sessions
+# are not safe to share across threads; the connection pool is
+_jira_local = threading.local()
+
+
+def _get_jira_adapter() -> HTTPAdapter:
+    """Get or create the shared pooled HTTP adapter for Jira."""
+    global _jira_adapter
+
+    with _jira_adapter_lock:
+        if _jira_adapter is None:
+            _jira_adapter = _KeepAliveAdapter(
+                pool_connections=1,
+                pool_maxsize=JIRA_POOL_SIZE,
+            )
+    return _jira_adapter
 
 
 def get_jira_client() -> Jira:
-    """Get or create the Jira client singleton."""
-    global _jira_client
+    """Get or create the Jira client for the current thread."""
+    client = getattr(_jira_local, "client", None)
 
-    if _jira_client is None:
+    if client is None:
         jira_url = os.getenv("JIRA_URL")
         jira_email = os.getenv("JIRA_EMAIL")
         jira_token = os.getenv("JIRA_API_TOKEN")
@@ -92,14 +635,51 @@ def get_jira_client() -> Jira:
                 "Set JIRA_URL, JIRA_EMAIL, and JIRA_API_TOKEN environment variables."
             )
 
-        _jira_client = Jira(
+        session = requests.Session()
+        adapter = _get_jira_adapter()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+
+        client = Jira(
             url=jira_url,
             username=jira_email,
             password=jira_token,
             cloud=True,
+            session=session,
         )
+        # (connect, read) timeouts passed to every request
+        client.timeout = (JIRA_CONNECT_TIMEOUT, JIRA_READ_TIMEOUT)
+        _jira_local.client = client
+
+    return client
+
+
+def get_pool_stats() -> dict:
+    """
+    Return connection pool counters for the Jira adapter.
+
+    `connections_created` counts TLS handshakes; `connections_reused` counts
+    requests served over an already open connection.
+    """
+    stats = {
+        "pool_size": JIRA_POOL_SIZE,
+        "connections_created": 0,
+        "connections_reused": 0,
+        "requests": 0,
+        "idle_connections": 0,
+    }
+    if _jira_adapter is None:
+        return stats
 
-    return _jira_client
+    pools = _jira_adapter.poolmanager.pools
+    for key in pools.keys():
+        pool = pools[key]
+        stats["connections_created"] += pool.num_connections
+        stats["requests"] += pool.num_requests
+        stats["idle_connections"] += pool.pool.qsize() if pool.pool else 0
+
+    stats["connections_reused"] = max(0, stats["requests"] - stats["connections_created"])
+    return stats
 
 
 def get_project_key() -> str:
@@ -110,28 +690,156 @@ def get_project_key() -> str:
     return project_key
 
 
-def _retry_with_backoff(func, max_retries: int = 3, base_delay: float = 1.0):
-    """Execute a function with retry and exponential backoff."""
+# =============================================================================
+# CIRCUIT BREAKER - Fail fast while Jira is down instead of retrying
+# =============================================================================
+
+JIRA_BREAKER = CircuitBreaker(
+    "Jira",
+    failure_threshold=int(os.getenv("JIRA_BREAKER_FAILURE_THRESHOLD", "5")),
+    recovery_timeout=float(os.getenv("JIRA_BREAKER_RECOVERY_SECONDS", "30")),
+)
+
+
+def get_jira_status() -> dict:
+    """Return the Jira circuit breaker, connection pool and cache counters."""
+    return {
+        "circuit": JIRA_BREAKER.stats(),
+        "pool": get_pool_stats(),
+        **get_cache_stats(),
+    }
+
+
+def reset_jira_circuit() -> dict:
+    """Force the Jira circuit closed and return its state."""
+    JIRA_BREAKER.reset()
+    logger.info("Jira circuit manually reset")
+    return JIRA_BREAKER.stats()
+
+
+# Total time one Jira call may spend on attempts and retry delays
+RETRY_BUDGET_SECONDS = float(os.getenv("JIRA_RETRY_BUDGET_SECONDS", "20"))
+RETRY_MAX_DELAY_SECONDS = float(os.getenv("JIRA_RETRY_MAX_DELAY", "10"))
+
+
+def _apply_deadline_timeouts() -> None:
+    """Shrink this thread's Jira client timeouts to fit the request deadline."""
+    get_jira_client().timeout = (
+        deadline.clamp(JIRA_CONNECT_TIMEOUT),
+        deadline.clamp(JIRA_READ_TIMEOUT),
+    )
+
+
+def _retry_with_backoff(
+    func,
+    max_retries: int = 3,
+    base_delay: float = 1.0,
+    idempotent: bool = True,
+    recover=None,
+    budget: float = RETRY_BUDGET_SECONDS,
+):
+    """
+    Execute a function with classified retries and jittered backoff.
+
+    Only transient failures are retried; permanent ones (e.g. 400, 404)
+    raise at once. Delays honor Retry-After and use full jitter, and no
+    retry starts once the time budget is spent.
+
+    Every attempt goes through the Jira circuit breaker: while it is open the
+    call fails immediately with CircuitOpenError instead of being retried.
+
+    Inside a request deadline (see deadline.with_deadline) the HTTP timeouts
+    and retry budget shrink to the time left, and DeadlineExceeded is raised
+    rather than starting an attempt or retry that cannot finish in time.
+
+    Args:
+        func: Function making the Jira call
+        max_retries: Maximum number of attempts
+        base_delay: Backoff before the first retry
+        idempotent: Whether repeating the call is harmless. Non-idempotent
+            calls are not retried after a failure that may have succeeded
+            upstream unless `recover` shows it did not.
+        recover: For non-idempotent calls, a function that looks for the
+            effect of an attempt that may have succeeded; returns its
+            result, or None if the call has to be made again
+        budget: Seconds allowed for all attempts and delays
+    """
+    capped = deadline.clamp(budget, reserve=deadline.MIN_ATTEMPT_SECONDS)
+    retry_budget = RetryBudget(capped)
     last_exception = None
 
     for attempt in range(max_retries):
+        deadline.check("Jira call")
+        _apply_deadline_timeouts()
+        JIRA_BREAKER.before_call()
         try:
-            return func()
+            result = func()
+            JIRA_BREAKER.record_success()
+            return result
         except Exception as e:
+            if deadline.expired() and isinstance(e, requests.exceptions.Timeout):
+                # Cut short by our own shrunken timeout, not a Jira failure
+                JIRA_BREAKER.release()
+                raise DeadlineExceeded("Jira call") from e
+
+            JIRA_BREAKER.record_failure(e)
             last_exception = e
-            if attempt < max_retries - 1:
-                delay = base_delay * (2**attempt)
-                logger.warning(
+            kind = classify_error(e)
+
+            if kind == PERMANENT or attempt == max_retries - 1:
+                logger.error(f"Jira API call failed ({kind}, attempt {attempt + 1}/{max_retries}): {e}")
+                break
+
+            if kind == AMBIGUOUS and not idempotent:
+                recovered = _recover_write(recover, e)
+                if recovered is not None:
+                    return recovered
+
+            delay = retry_delay(e, attempt, base_delay, RETRY_MAX_DELAY_SECONDS)
+            if not retry_budget.allows(delay):
+                if capped < budget:
+                    logger.error(f"Jira API call failed ({e}), no time left in the request deadline to retry")
+                    raise DeadlineExceeded("Jira call") from e
+                logger.error(
                     f"Jira API call failed (attempt {attempt + 1}/{max_retries}): {e}. "
-                    f"Retrying in {delay}s..."
+                    f"Retry budget of {budget}s exhausted"
                 )
-                time.sleep(delay)
-            else:
-                logger.error(f"Jira API call failed after {max_retries} attempts: {e}")
+                break
+
+            logger.warning(
+                f"Jira API call failed (attempt {attempt + 1}/{max_retries}): {e}. "
+                f"Retrying in {delay:.1f}s..."
+            )
+            time.sleep(delay)
 
     raise last_exception
 
 
+def _recover_write(recover, error: Exception):
+    """
+    Check whether a write that failed ambiguously took effect anyway.
+
+    Returns:
+        The recovered result, or None if the write should be retried
+
+    Raises:
+        The original error if the write cannot be checked
+    """
+    if recover is None:
+        logger.error(f"Not retrying non-idempotent Jira call after ambiguous failure: {error}")
+        raise error
+
+    try:
+        recovered = recover()
+    except Exception as check_error:
+        logger.error(f"Could not check whether the Jira write succeeded: {check_error}")
+        raise error
+
+    if recovered is not None:
+        logger.info(f"Jira write succeeded despite error ({error}), not retrying")
+    return recovered
+
+
 def fetch_issues(
     status: Optional[str] = None,
     priority: Optional[str] = None,
@@ -146,6 +854,10 @@ def fetch_issues(
     """
     Fetch issues from Jira with optional filters.
 
+    Results are cached per filter set as windows of contiguous rows, so any
+    page/limit combination is served from rows already fetched and only the
+    missing slice is requested from Jira.
+
     Args:
         status: Comma-separated status values (e.g., "Open,In Progress")
         priority: Comma-separated priority values (e.g., "Highest,High")
@@ -158,230 +870,1393 @@ def fetch_issues(
         skip_cache: If True, bypass cache and fetch fresh data
 
     Returns:
-        Dict with issues, total, page, and totalPages
+        Dict with issues, total, page, and totalPages. When an expired cache
+        entry is served, also includes stale=True and staleSeconds.
     """
-    # Check cache first (unless skip_cache is True)
-    cache_key = _get_cache_key(
-        "issues",
+    filters = normalize_filters(
         status=status,
         priority=priority,
         issue_type=issue_type,
         tool=tool,
         reporter=reporter,
         search=search,
-        page=page,
-        limit=limit,
     )
+    window_key = _issues_cache_key(**filters)
+    start = (page - 1) * limit
 
+    # Answer from the local issue mirror when it is enabled and up to date
+    if not skip_cache and issue_mirror.is_ready():
+        try:
+            return issue_mirror.query_issues(filters, page, limit)
+        except Exception as e:
+            logger.warning(f"Issue mirror query failed, falling back to Jira: {e}")
+
+    # Check cache first (unless skip_cache is True)
     if not skip_cache:
-        cached = _get_from_cache(cache_key)
-        if cached:
-            return cached
+        window = _get_from_cache(window_key)
+        if window:
+            cached = _page_from_window(window, start, limit, page)
+            if cached:
+                return cached
+
+        # Stale-while-revalidate: serve a recently expired page immediately
+        # and repopulate it in the background
+        stale = JIRA_CACHE.get_stale(window_key) if CACHE_STALE_SECONDS > 0 and not window else None
+        if stale and stale[1] <= CACHE_STALE_SECONDS:
+            data, age = stale
+            cached = _page_from_window(data, start, limit, page)
+            if cached:
+                logger.info(f"Cache STALE for key: {window_key[:18]}... ({int(age)}s past TTL)")
+                _refresh_in_background(
+                    f"{window_key}:{start}:{limit}",
+                    lambda: fetch_issues(**filters, page=page, limit=limit, skip_cache=True),
+                )
+                return {**cached, "stale": True, "staleSeconds": int(age)}
 
-    jira = get_jira_client()
-    project_key = get_project_key()
+    try:
+        # Concurrent callers for the same slice share one upstream request
+        return _coalesced(
+            f"{window_key}:{start}:{limit}:{skip_cache}",
+            lambda: _load_issues_page(window_key, filters, page, limit, skip_cache),
+        )
+    except CircuitOpenError:
+        # Jira is down: serve the last known rows for this page if we have them
+        last_known = JIRA_CACHE.get_stale(window_key)
+        cached = _page_from_window(last_known[0], start, limit, page) if last_known else None
+        if not cached:
+            raise
+        logger.warning(f"Jira circuit open, serving last known data for {window_key[:18]}...")
+        return {**cached, "stale": True, "staleSeconds": int(last_known[1])}
+
+
+# Known spellings of filter enums, used to normalize user input
+_CANONICAL_VALUES = {
+    "status": [
+        "Open", "To Do", "In Progress", "In Review", "Done", "Resolved",
+        "Cancelled", "Closed", "Reopened", "SQA Investigation",
+        "Selected for Development",
+    ],
+    "priority": ["Highest", "High", "Medium", "Low", "Lowest"],
+    "issue_type": ["Bug", "Task", "Story"],
+    "tool": list(issue_mirror.TOOLS),
+}
+
+
+def normalize_filters(
+    status: Optional[str] = None,
+    priority: Optional[str] = None,
+    issue_type: Optional[str] = None,
+    tool: Optional[str] = None,
+    reporter: Optional[str] = None,
+    search: Optional[str] = None,
+) -> dict:
+    """
+    Normalize fetch_issues filters so equivalent queries share a cache key.
 
-    # Build JQL query - Filter to only show issues created via Relay App
-    jql_parts = [
-        f"project = '{project_key}'",
-        '(labels = "relay-app" OR description ~ "Relay App")'
-    ]
+    Multi-value filters become sorted, de-duplicated, comma-separated lists
+    with known enum values in their canonical case. The reporter is
+    lowercased and search whitespace collapsed. Empty filters become None.
 
-    if status:
-        statuses = [s.strip() for s in status.split(",")]
-        status_jql = ", ".join([f'"{s}"' for s in statuses])
-        jql_parts.append(f"status IN ({status_jql})")
+    Returns:
+        Dict with status, priority, issue_type, tool, reporter and search
+    """
+    raw = {"status": status, "priority": priority, "issue_type": issue_type, "tool": tool}
+    normalized = {}
 
-    if priority:
-        priorities = [p.strip() for p in priority.split(",")]
-        priority_jql = ", ".join([f'"{p}"' for p in priorities])
-        jql_parts.append(f"priority IN ({priority_jql})")
+    for name, value in raw.items():
+        canonical = {v.lower(): v for v in _CANONICAL_VALUES[name]}
+        values = {}
+        for item in (value or "").split(","):
+            item = " ".join(item.split())
+            if item:
+                values.setdefault(item.lower(), canonical.get(item.lower(), item))
+        normalized[name] = ",".join(values[k] for k in sorted(values)) or None
 
-    if issue_type:
-        types = [t.strip() for t in issue_type.split(",")]
-        type_jql = ", ".join([f'"{t}"' for t in types])
-        jql_parts.append(f"issuetype IN ({type_jql})")
+    normalized["reporter"] = reporter.strip().lower() or None if reporter else None
+    normalized["search"] = " ".join(search.split()) or None if search else None
 
-    if tool:
-        tool_names = [t.strip() for t in tool.split(",")]
-        tool_conditions = []
-        for t in tool_names:
-            # Check for label OR tool name in summary
-            # Simplified JQL: labels = "AI" OR summary ~ "AI"
-            tool_conditions.append(f'(labels = "{t}" OR summary ~ "\\"{t}\\"")')
+    return normalized
+
+
+def _window_end(window: dict) -> Optional[int]:
+    """Number of rows in a window's query, if its last page has been read."""
+    return window.get("total") if window.get("totalExact") else None
+
+
+def _page_from_window(window: dict, start: int, limit: int, page: int) -> Optional[dict]:
+    """
+    Build a page response from a cached window, or None if rows are missing.
+
+    Rows are only cut off at the total once the window has read the query's
+    last page. Before that the total is an approximate count (or a lower
+    bound), and a page past it is fetched rather than answered empty.
+    """
+    segments = window.get("segments", [])
+    end = start + limit
+    known_end = _window_end(window)
+    if known_end is not None:
+        end = min(end, known_end)
+    if _missing_ranges(segments, start, end):
+        return None
+
+    rows = []
+    for seg_start, seg_issues in segments:
+        lo = max(start, seg_start)
+        hi = min(end, seg_start + len(seg_issues))
+        if lo < hi:
+            rows.extend(seg_issues[lo - seg_start:hi - seg_start])
+
+    total = window.get("total") or 0
+    if known_end is None:
+        total = max(total, start + len(rows))
+
+    return {
+        "issues": rows,
+        "total": total,
+        "page": page,
+        "totalPages": (total + limit - 1) // limit if limit > 0 else 0,
+    }
+
+
+def _missing_ranges(segments: list, start: int, end: int) -> list:
+    """Return the (start, end) offsets in [start, end) not covered by segments."""
+    gaps = []
+    pos = start
+    for seg_start, seg_issues in sorted(segments, key=lambda seg: seg[0]):
+        seg_end = seg_start + len(seg_issues)
+        if seg_end <= pos:
+            continue
+        if seg_start >= end:
+            break
+        if seg_start > pos:
+            gaps.append((pos, seg_start))
+        pos = max(pos, seg_end)
+        if pos >= end:
+            break
+    if pos < end:
+        gaps.append((pos, end))
+    return gaps
+
+
+def _merge_segments(segments: list, start: int, issues: list) -> list:
+    """Merge a freshly fetched slice into a window's contiguous segments."""
+    rows = {}
+    for seg_start, seg_issues in segments:
+        for i, issue in enumerate(seg_issues):
+            rows[seg_start + i] = issue
+    for i, issue in enumerate(issues):
+        rows[start + i] = issue
+
+    merged = []
+    for offset in sorted(rows):
+        if merged and merged[-1][0] + len(merged[-1][1]) == offset:
+            merged[-1][1].append(rows[offset])
+        else:
+            merged.append([offset, [rows[offset]]])
+    return merged
+
+
+# Serializes read-merge-write of cached windows within this process
+_window_lock = threading.Lock()
+
+
+def _load_issues_page(
+    window_key: str,
+    filters: dict,
+    page: int,
+    limit: int,
+    skip_cache: bool,
+) -> dict:
+    """Fetch the rows of a page missing from its cached window and cache them."""
+    fetch_start, fetch_count, tokens, total = _window_fetch_span(window_key, page, limit, skip_cache)
+    issues, fetch_start, total, tokens, exact = _fetch_issues_from_jira(
+        filters, fetch_start, fetch_count, tokens, total
+    )
+    return _store_window_slice(
+        window_key, filters, page, limit, skip_cache, fetch_start, issues, total, tokens, exact
+    )
+
+
+def _window_fetch_span(window_key: str, page: int, limit: int, skip_cache: bool) -> tuple:
+    """
+    Work out which rows of a page must be fetched from Jira.
+
+    Returns:
+        (start offset, row count, page tokens, total) spanning the rows the
+        window does not hold, with the page tokens and total it already knows
+    """
+    start = (page - 1) * limit
+    window = None if skip_cache else _get_from_cache(window_key)
+    segments = window.get("segments", []) if window else []
+
+    # Only fetch the span of rows the window does not already hold
+    end = start + limit
+    if window and _window_end(window) is not None:
+        end = min(end, _window_end(window))
+    gaps = _missing_ranges(segments, start, end) or [(start, start + limit)]
+    tokens = window.get("tokens", {}) if window else {}
+    total = window.get("total") if window else None
+    return gaps[0][0], gaps[-1][1] - gaps[0][0], tokens, total
+
+
+def _merged_total(current: dict, total: int, exact: bool) -> Optional[tuple]:
+    """
+    Combine a cached window's total with one from a new slice of its query.
+
+    Returns:
+        (total, exact) for the merged window, or None when the totals show
+        the query's results changed and the cached rows must be dropped
+    """
+    current_total = current.get("total") or 0
+    current_exact = bool(current.get("totalExact"))
+    if current_total == total:
+        return total, exact or current_exact
+    if exact and current_exact:
+        return None
+    if exact:
+        return total, True
+    if current_exact:
+        # Rows past a counted end mean issues were added since
+        return (current_total, True) if total <= current_total else None
+    return max(current_total, total), False
+
+
+def _store_window_slice(
+    window_key: str,
+    filters: dict,
+    page: int,
+    limit: int,
+    skip_cache: bool,
+    fetch_start: int,
+    issues: list,
+    total: int,
+    tokens: Optional[dict] = None,
+    exact: bool = False,
+) -> dict:
+    """
+    Merge freshly fetched rows into the cached window and return the page.
+
+    exact marks a total counted off the query's last page; otherwise it is
+    an approximate count that never cuts rows off.
+    """
+    start = (page - 1) * limit
+    fetch_end = fetch_start + len(issues)
+
+    with _window_lock:
+        current = None if skip_cache else _get_from_cache(window_key)
+        merged = _merged_total(current, total, exact) if current else None
+        now = time.time()
+        if merged:
+            total, exact = merged
+            segments = _merge_segments(current.get("segments", []), fetch_start, issues)
+            tokens = {**current.get("tokens", {}), **(tokens or {})}
+            ttl = max(1, current.get("expires_at", now) - now)
+        else:
+            segments = _merge_segments([], fetch_start, issues)
+            tokens = tokens or {}
+            ttl = CACHE_TTL_SECONDS
+
+        # Page tokens let later pages resume the /search/jql walk midway
+        window = {
+            "total": total,
+            "totalExact": exact,
+            "segments": segments,
+            "tokens": tokens,
+            "expires_at": now + ttl,
+        }
+        keys = {i["key"] for _, seg in segments for i in seg if i.get("key")}
+
+        # Store in cache, tagged with the issues the window holds
+        JIRA_CACHE.set(
+            window_key,
+            window,
+            ttl_seconds=ttl,
+            tags=(LIST_CACHE_TAG, *(_issue_tag(k) for k in keys)),
+            meta={"filters": filters},
+        )
+        logger.info(f"Cache SET for key: {window_key[:18]}... (rows {fetch_start}-{fetch_end})")
+
+    return _page_from_window(window, start, limit, page) or {
+        "issues": issues[start - fetch_start:start - fetch_start + limit],
+        "total": total,
+        "page": page,
+        "totalPages": (total + limit - 1) // limit if limit > 0 else 0,
+    }
+
+
+def _is_relay_issue(issue: dict) -> bool:
+    """Check an issue matches the fetch_issues base query (project and Relay marker)."""
+    fields = issue.get("fields") or {}
+    project = (fields.get("project") or {}).get("key")
+    if project and project.upper() != get_project_key().upper():
+        return False
+    if "relay-app" in (fields.get("labels") or []):
+        return True
+    description = issue_mirror.plain_text(fields.get("description")) or ""
+    return "relay app" in description.lower()
+
+
+def _build_issues_jql(filters: dict) -> str:
+    """Build the fetch_issues JQL query for normalized filters."""
+    project_key = get_project_key()
+
+    # Build JQL query - Filter to only show issues created via Relay App
+    jql_parts = [
+        f"project = '{project_key}'",
+        '(labels = "relay-app" OR description ~ "Relay App")'
+    ]
+
+    if filters.get("status"):
+        statuses = [s.strip() for s in filters["status"].split(",")]
+        status_jql = ", ".join([f'"{s}"' for s in statuses])
+        jql_parts.append(f"status IN ({status_jql})")
+
+    if filters.get("priority"):
+        priorities = [p.strip() for p in filters["priority"].split(",")]
+        priority_jql = ", ".join([f'"{p}"' for p in priorities])
+        jql_parts.append(f"priority IN ({priority_jql})")
+
+    if filters.get("issue_type"):
+        types = [t.strip() for t in filters["issue_type"].split(",")]
+        type_jql = ", ".join([f'"{t}"' for t in types])
+        jql_parts.append(f"issuetype IN ({type_jql})")
+
+    if filters.get("tool"):
+        tool_names = [t.strip() for t in filters["tool"].split(",")]
+        tool_conditions = []
+        for t in tool_names:
+            # Check for label OR tool name in summary
+            # Simplified JQL: labels = "AI" OR summary ~ "AI"
+            tool_conditions.append(f'(labels = "{t}" OR summary ~ "\\"{t}\\"")')
+
+        if tool_conditions:
+            jql_parts.append(f"({' OR '.join(tool_conditions)})")
+
+    if filters.get("reporter"):
+        jql_parts.append(f'reporter = "{filters["reporter"]}"')
+
+    if filters.get("search"):
+        # Escape special JQL characters
+        escaped_search = filters["search"].replace('"', '\\"')
+        jql_parts.append(f'(summary ~ "{escaped_search}" OR description ~ "{escaped_search}")')
+
+    jql = " AND ".join(jql_parts)
+    jql += " ORDER BY created DESC"
+    return jql
+
+
+# Fields requested for issue list rows and for get_issues_updated_since
+LIST_FIELDS = "key,summary,status,priority,issuetype,reporter,assignee,created,updated"
+UPDATED_FIELDS = "key,summary,status,priority,updated"
+
+
+def _transform_list_issue(issue: dict) -> dict:
+    """Transform a Jira search result into the issue list format."""
+    fields = issue.get("fields", {})
+    return {
+        "id": issue.get("id"),
+        "key": issue.get("key"),
+        "summary": fields.get("summary"),
+        "status": fields.get("status", {}).get("name") if fields.get("status") else None,
+        "priority": fields.get("priority", {}).get("name") if fields.get("priority") else None,
+        "type": fields.get("issuetype", {}).get("name") if fields.get("issuetype") else None,
+        "reporter": {
+            "email": fields.get("reporter", {}).get("emailAddress"),
+            "name": fields.get("reporter", {}).get("displayName"),
+            "avatar": fields.get("reporter", {}).get("avatarUrls", {}).get("48x48"),
+        } if fields.get("reporter") else None,
+        "assignee": {
+            "email": fields.get("assignee", {}).get("emailAddress"),
+            "name": fields.get("assignee", {}).get("displayName"),
+            "avatar": fields.get("assignee", {}).get("avatarUrls", {}).get("48x48"),
+        } if fields.get("assignee") else None,
+        "created": fields.get("created"),
+        "updated": fields.get("updated"),
+    }
+
+
+# =============================================================================
+# SEARCH - Token-paginated /search/jql results and approximate counts
+# =============================================================================
+
+# Rows per /search/jql page when walking results; list windows are filled
+# in pages of this size so their page tokens line up
+SEARCH_PAGE_SIZE = 50
+# Jira caps /search/jql pages at 100 issues when specific fields are requested
+SEARCH_MAX_PAGE_SIZE = 100
+# Most pages one request walks past the closest known page token; deeper
+# rows are reached by paging forward, each page learning the next token
+SEARCH_MAX_SKIP_PAGES = max(1, int(os.getenv("JIRA_SEARCH_MAX_SKIP_PAGES", "10")))
+
+
+class SearchDepthExceeded(Exception):
+    """Raised when rows lie too many unread /search/jql pages ahead."""
+
+    def __init__(self, start_at: int, reachable: int):
+        self.start_at = start_at
+        self.reachable = reachable
+        super().__init__(
+            f"Row {start_at + 1} is too far ahead of the rows loaded so far; "
+            f"page forward from row {reachable}"
+        )
+
+
+def _search_params(jql: str, fields: str, max_results: int, page_token: Optional[str] = None) -> dict:
+    """Query params for one /search/jql page."""
+    params = {"jql": jql, "maxResults": max_results, "fields": fields}
+    if page_token:
+        params["nextPageToken"] = page_token
+    return params
+
+
+def _search_page(jql: str, fields: str, max_results: int, page_token: Optional[str] = None) -> dict:
+    """
+    Fetch one page of a JQL search.
+
+    Returns:
+        The raw response: issues, plus nextPageToken unless isLast
+    """
+    jira = get_jira_client()
+    params = _search_params(jql, fields, max_results, page_token)
+
+    def _fetch():
+        # Atlassian has deprecated /rest/api/3/search in favor of /rest/api/3/search/jql
+        # We use a raw request to ensure compatibility with the latest Jira Cloud requirement
+        path = "rest/api/3/search/jql"
+        response = jira.request(method="GET", path=path, params=params)
+        return response.json() if hasattr(response, 'json') else response
+
+    return _retry_with_backoff(_fetch)
+
+
+def _is_last_page(result: dict) -> bool:
+    """Check whether a /search/jql response is the final page."""
+    return bool(result.get("isLast")) or not result.get("nextPageToken")
+
+
+def iter_issues(
+    jql: str,
+    fields: str = LIST_FIELDS,
+    page_size: int = SEARCH_MAX_PAGE_SIZE,
+    transform=_transform_list_issue,
+) -> Iterator[dict]:
+    """
+    Lazily iterate over every issue matching a JQL query.
+
+    Follows /search/jql's nextPageToken cursors, requesting the next page
+    only once the caller has consumed the current one, so stopping early
+    never fetches pages that are not needed.
+
+    Args:
+        jql: JQL query
+        fields: Comma-separated fields to request
+        page_size: Issues per request (max 100)
+        transform: Function turning a raw Jira issue into the yielded value
+
+    Yields:
+        Transformed issues in the query's order
+    """
+    page_size = max(1, min(page_size, SEARCH_MAX_PAGE_SIZE))
+    page_token = None
+
+    while True:
+        result = _search_page(jql, fields, page_size, page_token)
+        for issue in result.get("issues", []):
+            yield transform(issue)
+
+        if _is_last_page(result):
+            return
+        page_token = result["nextPageToken"]
+
+
+def _count_jql(jql: str) -> str:
+    """Strip ORDER BY from a JQL query, which a count does not need."""
+    upper = jql.upper()
+    index = upper.rfind(" ORDER BY ")
+    return jql[:index] if index != -1 else jql
+
+
+def count_issues(jql: str) -> int:
+    """
+    Get the approximate number of issues matching a JQL query.
+
+    Uses Jira's approximate-count endpoint, since /search/jql no longer
+    returns a reliable total. The count can briefly lag recent changes.
+
+    Args:
+        jql: JQL query (any ORDER BY clause is ignored)
+
+    Returns:
+        Approximate number of matching issues
+    """
+    jira = get_jira_client()
+    body = {"jql": _count_jql(jql)}
+
+    def _fetch():
+        path = "rest/api/3/search/approximate-count"
+        response = jira.request(method="POST", path=path, json=body)
+        return response.json() if hasattr(response, 'json') else response
+
+    return int(_retry_with_backoff(_fetch).get("count", 0))
+
+
+def _walk_start(tokens: dict, start_at: int) -> tuple:
+    """
+    Pick where to start walking pages to reach row start_at.
+
+    Args:
+        tokens: Known page tokens, row offset (as a string) -> token
+
+    Returns:
+        (offset, page token) of the closest known page at or before start_at;
+        (0, None) starts from the first page
+    """
+    known = [int(offset) for offset in tokens if int(offset) <= start_at]
+    if not known:
+        return 0, None
+    offset = max(known)
+    return offset, tokens[str(offset)]
+
+
+def _fetch_issues_from_jira(
+    filters: dict,
+    start_at: int,
+    max_results: int,
+    tokens: Optional[dict] = None,
+    total: Optional[int] = None,
+) -> tuple:
+    """
+    Run the fetch_issues JQL search for the rows from start_at.
+
+    /search/jql pages by opaque nextPageToken cursors instead of offsets, so
+    rows are reached by walking pages of SEARCH_PAGE_SIZE from the closest
+    page whose token is already known. The approximate count is fetched
+    alongside the first page when the total is not yet known.
+
+    Args:
+        filters: Normalized fetch_issues filters
+        start_at: First row wanted
+        max_results: Number of rows wanted from start_at
+        tokens: Page tokens learned by earlier walks of the same query
+        total: Total already known for the query, if any
+
+    Returns:
+        (issues, fetch_start, total, tokens, exact): every row fetched in the
+        list format starting at row fetch_start (at or before start_at), the
+        total, the known page tokens, and whether the total is exact (the
+        last page was read) rather than an approximate count
+    """
+    jql = _build_issues_jql(filters)
+    tokens = dict(tokens or {})
+    fetch_start, page_token = _walk_start(tokens, start_at)
+    _check_walk_depth(fetch_start, start_at)
+
+    logger.info(
+        f"Fetching issues with JQL: {jql} (rows {start_at}-{start_at + max_results}, "
+        f"walking from {fetch_start})"
+    )
+
+    count = None
+    if total is None:
+        # Run in a copy of this context so the request deadline applies there too
+        count = _detail_executor.submit(contextvars.copy_context().run, count_issues, jql)
+
+    try:
+        issues = []
+        offset = fetch_start
+        exact = False
+        while True:
+            try:
+                result = _search_page(jql, LIST_FIELDS, SEARCH_PAGE_SIZE, page_token)
+            except requests.exceptions.HTTPError as e:
+                resumed = page_token is not None and offset == fetch_start
+                if not resumed or is_upstream_failure(e):
+                    raise
+                # Cached page tokens do not live forever; walk again from the first page
+                logger.warning(f"Page token rejected ({e}), restarting search from the first page")
+                return _fetch_issues_from_jira(filters, start_at, max_results, None, total)
+            page = [_transform_list_issue(issue) for issue in result.get("issues", [])]
+            issues.extend(page)
+            offset += len(page)
+
+            if _is_last_page(result) or not page:
+                # Reached the end: the total is exact
+                total = offset
+                exact = True
+                break
+            page_token = result["nextPageToken"]
+            tokens[str(offset)] = page_token
+            if offset >= start_at + max_results:
+                break
+
+        if not exact:
+            if count is not None:
+                try:
+                    total = count.result()
+                except Exception as e:
+                    logger.warning(f"Approximate count failed, totalling the rows read: {e}")
+            # A next page exists, so at least one more row follows those read
+            total = max(total or 0, offset + 1)
+    finally:
+        # Not needed once the last page gave the exact total (or the walk failed)
+        if count is not None:
+            count.cancel()
+
+    return issues, fetch_start, total, tokens, exact
+
+
+def _check_walk_depth(fetch_start: int, start_at: int) -> None:
+    """Raise SearchDepthExceeded if reaching start_at takes too many page walks."""
+    reachable = fetch_start + SEARCH_MAX_SKIP_PAGES * SEARCH_PAGE_SIZE
+    if start_at >= reachable:
+        raise SearchDepthExceeded(start_at, reachable)
+
+
+# =============================================================================
+# FACETS - Issue counts per status, priority, type and tool
+# =============================================================================
+
+def get_issue_facets(
+    status: Optional[str] = None,
+    priority: Optional[str] = None,
+    issue_type: Optional[str] = None,
+    tool: Optional[str] = None,
+    reporter: Optional[str] = None,
+    search: Optional[str] = None,
+) -> Optional[dict]:
+    """
+    Count the issues each status, priority, type and tool value would match.
+
+    A facet is counted under every filter except its own, so each value's
+    count is what fetch_issues would total with only that value selected
+    in its facet. Counts come only from the local issue mirror: from Jira
+    they would take a walk over every matching issue on each filter change.
+    They are cached until a write changes a counted field.
+
+    Args:
+        status: Comma-separated status values
+        priority: Comma-separated priority values
+        issue_type: Comma-separated issue types
+        tool: Comma-separated tool names
+        reporter: Reporter email address
+        search: Search text for summary/description
+
+    Returns:
+        Dict with total (issues matching every filter) and facets, mapping
+        status, priority, type and tool to {value: count}; None when the
+        issue mirror is not ready
+    """
+    if not issue_mirror.is_ready():
+        return None
+
+    filters = normalize_filters(
+        status=status,
+        priority=priority,
+        issue_type=issue_type,
+        tool=tool,
+        reporter=reporter,
+        search=search,
+    )
+    cache_key = _get_cache_key("facets", **filters)
+    cached = _get_from_cache(cache_key)
+    if cached:
+        return cached
+
+    try:
+        result = issue_mirror.query_facets(filters)
+    except Exception as e:
+        logger.warning(f"Issue mirror facet query failed: {e}")
+        return None
+    # Dropped by _invalidate_facets on the same writes that drop list pages
+    _set_cache(cache_key, result, tags=(FACETS_CACHE_TAG,), meta={"filters": filters})
+    return result
+
+
+# =============================================================================
+# STATS - Dashboard totals by status, priority and type
+# =============================================================================
+
+def get_stats_summary() -> Optional[dict]:
+    """
+    Get issue totals by status, priority and type, and by pairs of them.
+
+    Read only from the issue counters, which cost the same however many
+    issues there are: from Jira the summary would take a walk over every
+    Relay issue.
+
+    Returns:
+        Dict with total; byStatus, byPriority and byType ({value: count});
+        and byStatusAndType, byStatusAndPriority and byPriorityAndType
+        ({first value: {second value: count}}); None when the counters are
+        not ready
+    """
+    if not issue_mirror.counters_ready():
+        return None
+    try:
+        return issue_mirror.counter_summary()
+    except Exception as e:
+        logger.warning(f"Issue counters read failed: {e}")
+        return None
+
+
+# Fields _transform_issue_detail reads; nothing else is downloaded
+DETAIL_FIELDS = (
+    "summary,description,status,priority,issuetype,reporter,assignee,"
+    "created,updated,attachment,comment"
+)
+# History entries returned with an issue; older ones load via get_issue_history
+HISTORY_PAGE_SIZE = max(1, int(os.getenv("JIRA_HISTORY_PAGE_SIZE", "10")))
+# Jira caps changelog pages at 100 entries
+HISTORY_MAX_PAGE_SIZE = 100
+# Entries read past the last known changelog total, to absorb recent changes
+_HISTORY_SLACK = 5
+
+# Runs interactive side reads: the changelog fetch alongside the issue
+# fetch, list counts and bulk key searches
+_detail_executor = ThreadPoolExecutor(max_workers=JIRA_POOL_SIZE, thread_name_prefix="jira-detail")
+
+
+def _history_total_key(issue_key: str) -> str:
+    """Cache key for an issue's last known changelog length."""
+    return f"history-total:{issue_key.upper()}"
+
+
+def _history_tail_request(issue_key: str, limit: int) -> tuple:
+    """
+    Work out which changelog page should hold the newest `limit` entries.
+
+    The changelog is paginated oldest first, so the page starts from the
+    last known total, with some slack for entries added since. With no known
+    total a full first page is read, which holds the whole changelog of
+    most issues.
+
+    Returns:
+        (startAt, maxResults)
+    """
+    known_total = JIRA_CACHE.get(_history_total_key(issue_key))
+    if known_total is None:
+        return 0, HISTORY_MAX_PAGE_SIZE
+    return max(0, known_total - limit), min(limit + _HISTORY_SLACK, HISTORY_MAX_PAGE_SIZE)
+
+
+def _page_has_tail(start: int, page: dict, limit: int) -> bool:
+    """Check a changelog page covers the newest `limit` entries."""
+    total = page.get("total", 0)
+    return start + len(page.get("values", [])) >= total and start <= max(0, total - limit)
+
+
+def _history_tail(issue_key: str, limit: int, start: int, page: dict) -> tuple:
+    """
+    Cut the newest `limit` entries out of a changelog page.
+
+    Returns:
+        (entries oldest first, offset of the first entry, total entries)
+    """
+    total = page.get("total", 0)
+    JIRA_CACHE.set(_history_total_key(issue_key), total, ttl_seconds=DETAIL_RETAIN_SECONDS)
+    tail_start = max(start, total - limit)
+    return page.get("values", [])[tail_start - start:], tail_start, total
+
+
+def _changelog_page(issue_key: str, start_at: int, max_results: int) -> dict:
+    """Fetch one page of an issue's changelog (oldest first)."""
+    jira = get_jira_client()
+
+    def _fetch():
+        return jira.get_issue_changelog(issue_key, start=start_at, limit=max_results)
+
+    return _retry_with_backoff(_fetch)
+
+
+def _fetch_history_tail(issue_key: str, limit: int) -> tuple:
+    """
+    Fetch an issue's newest `limit` changelog entries.
+
+    Usually one request; a second is made only when the changelog grew
+    past the slack since its length was last seen.
+
+    Returns:
+        (entries oldest first, offset of the first entry, total entries)
+    """
+    start, count = _history_tail_request(issue_key, limit)
+    page = _changelog_page(issue_key, start, count)
+
+    if not _page_has_tail(start, page, limit):
+        start = max(0, page.get("total", 0) - limit)
+        page = _changelog_page(issue_key, start, limit)
+
+    return _history_tail(issue_key, limit, start, page)
+
+
+def get_issue_history(
+    issue_key: str,
+    before: Optional[int] = None,
+    limit: int = HISTORY_PAGE_SIZE,
+) -> dict:
+    """
+    Get a page of an issue's history, for loading older activity lazily.
+
+    Changelog entries never change once written, so older pages are cached.
+
+    Args:
+        issue_key: The Jira issue key (e.g., "BUG-123")
+        before: Offset of the oldest entry already shown (historyStartAt);
+            entries just before it are returned. Omit for the newest entries.
+        limit: Number of entries to return (max 100)
+
+    Returns:
+        Dict with history (oldest first), startAt and total
+    """
+    limit = max(1, min(limit, HISTORY_MAX_PAGE_SIZE))
+
+    if before is None:
+        entries, start, total = _fetch_history_tail(issue_key, limit)
+    else:
+        start = max(0, before - limit)
+        cache_key = f"history:{issue_key.upper()}:{start}:{before - start}"
+        page = _get_from_cache(cache_key) if before > 0 else {"values": []}
+        if page is None:
+            page = _changelog_page(issue_key, start, before - start)
+            JIRA_CACHE.set(cache_key, page, ttl_seconds=DETAIL_RETAIN_SECONDS)
+        entries, total = page.get("values", [])[:before - start], page.get("total", 0)
+
+    return {
+        "history": [_transform_history(change) for change in entries],
+        "startAt": start,
+        "total": total,
+    }
+
+
+def _detail_cache_key(issue_key: str) -> str:
+    """Cache key for an issue's detail payload."""
+    return f"detail:{issue_key.upper()}"
+
+
+def _set_detail_cache(issue_key: str, detail: dict) -> None:
+    """Store an issue detail payload, fresh for DETAIL_FRESH_SECONDS."""
+    JIRA_CACHE.set(
+        _detail_cache_key(issue_key),
+        detail,
+        ttl_seconds=DETAIL_FRESH_SECONDS,
+        stale_seconds=DETAIL_RETAIN_SECONDS,
+    )
+
+
+def _get_updated_timestamps(issue_keys: list) -> dict:
+    """
+    Fetch only the `updated` field for a batch of issues in one search.
+
+    Args:
+        issue_keys: Jira issue keys to check
+
+    Returns:
+        Dict of issue key -> updated timestamp (missing issues are omitted)
+    """
+    if not issue_keys:
+        return {}
+
+    jira = get_jira_client()
+    params = _updated_timestamps_params(issue_keys)
+
+    def _fetch():
+        path = "rest/api/3/search/jql"
+        response = jira.request(method="GET", path=path, params=params)
+        return response.json() if hasattr(response, 'json') else response
+
+    return _read_updated_timestamps(_retry_with_backoff(_fetch))
+
+
+def _updated_timestamps_params(issue_keys: list) -> dict:
+    """Search params fetching only the `updated` field for the given issues."""
+    keys_jql = ", ".join(f'"{k}"' for k in issue_keys)
+    return {
+        "jql": f"key IN ({keys_jql})",
+        "maxResults": len(issue_keys),
+        "fields": "updated",
+    }
+
+
+def _read_updated_timestamps(result: dict) -> dict:
+    """Map issue key -> updated timestamp from a search response."""
+    return {
+        issue.get("key", "").upper(): issue.get("fields", {}).get("updated")
+        for issue in result.get("issues", [])
+    }
+
+
+def revalidate_issue_details(issue_keys: list) -> dict:
+    """
+    Check cached issue details against Jira's `updated` timestamps.
+
+    Unchanged entries are marked fresh again; changed or missing ones are
+    dropped so the next get_issue refetches them.
+
+    Args:
+        issue_keys: Jira issue keys whose cached details should be checked
+
+    Returns:
+        Dict of issue key -> True if the cached detail is still current
+    """
+    cached = _cached_details(issue_keys)
+    if not cached:
+        return {}
+
+    return _apply_revalidation(cached, _get_updated_timestamps(list(cached.keys())))
+
+
+def _cached_details(issue_keys: list) -> dict:
+    """Return issue key -> cached detail (fresh or stale) for the given keys."""
+    cached = {}
+    for key in {k.upper() for k in issue_keys}:
+        entry = JIRA_CACHE.get_stale(_detail_cache_key(key))
+        if entry:
+            cached[key] = entry[0]
+    return cached
+
+
+def _apply_revalidation(cached: dict, updated: dict) -> dict:
+    """Refresh or drop cached details by comparing `updated` timestamps."""
+    results = {}
+    for key, detail in cached.items():
+        if updated.get(key) and updated[key] == detail.get("updated"):
+            _set_detail_cache(key, detail)
+            results[key] = True
+        else:
+            JIRA_CACHE.delete(_detail_cache_key(key))
+            results[key] = False
+
+    return results
+
+
+def get_issue(issue_key: str, skip_cache: bool = False) -> dict:
+    """
+    Get a single issue with all details.
+
+    Cached details are reused while fresh, then revalidated with a cheap
+    `updated` timestamp check before falling back to the full fetch.
+
+    Args:
+        issue_key: The Jira issue key (e.g., "BUG-123")
+        skip_cache: If True, bypass cache and fetch fresh data
+
+    Returns:
+        Dict with full issue details including comments and attachments.
+        While the Jira circuit is open, the last known details are returned
+        with stale=True and staleSeconds.
+    """
+    cache_key = _detail_cache_key(issue_key)
+
+    def _load():
+        if not skip_cache:
+            cached = _get_from_cache(cache_key)
+            if cached:
+                return cached
+
+            try:
+                if revalidate_issue_details([issue_key]).get(issue_key.upper()):
+                    logger.info(f"Cache REVALIDATED detail for {issue_key}")
+                    return _get_from_cache(cache_key) or _fetch_issue_detail(issue_key)
+            except (CircuitOpenError, DeadlineExceeded):
+                raise
+            except Exception as e:
+                logger.warning(f"Detail revalidation failed for {issue_key}: {e}")
+
+        detail = _fetch_issue_detail(issue_key)
+        _set_detail_cache(issue_key, detail)
+        return detail
+
+    try:
+        # Concurrent callers for the same issue share one upstream request
+        return _coalesced(cache_key, _load)
+    except CircuitOpenError:
+        # Jira is down: serve the last known detail if we have it
+        last_known = JIRA_CACHE.get_stale(cache_key)
+        if not last_known:
+            raise
+        logger.warning(f"Jira circuit open, serving last known detail for {issue_key}")
+        return {**last_known[0], "stale": True, "staleSeconds": int(last_known[1])}
+
+
+def _fetch_issue_detail(issue_key: str) -> dict:
+    """
+    Fetch an issue's detail fields, comments and newest history from Jira.
+
+    Only the fields the detail view shows are requested, and instead of
+    expanding the whole changelog its newest entries are read from the
+    paginated changelog endpoint, concurrently with the issue itself.
+    """
+    jira = get_jira_client()
+    # Run in a copy of this context so the request deadline applies there too
+    history = _detail_executor.submit(
+        contextvars.copy_context().run, _fetch_history_tail, issue_key, HISTORY_PAGE_SIZE
+    )
+
+    def _fetch():
+        return jira.issue(issue_key, fields=DETAIL_FIELDS)
+
+    issue = _retry_with_backoff(_fetch)
+    fields = issue.get("fields", {})
+
+    # Comments come back in the issue's `comment` field, so the detail is a
+    # single round trip. Only fall back to the comments endpoint when the
+    # field is missing or Jira truncated it.
+    comment_field = fields.get("comment") or {}
+    raw_comments = comment_field.get("comments")
+    if raw_comments is None or comment_field.get("total", 0) > len(raw_comments):
+        def _fetch_comments():
+            return jira.issue_get_comments(issue_key)
+
+        raw_comments = _retry_with_backoff(_fetch_comments).get("comments", [])
+
+    return _transform_issue_detail(issue, raw_comments, history.result())
+
+
+def _transform_issue_detail(issue: dict, raw_comments: list, history_tail: tuple) -> dict:
+    """
+    Transform a Jira issue, its comments and its newest history into the detail format.
+
+    Args:
+        issue: Jira issue with DETAIL_FIELDS
+        raw_comments: Jira comments
+        history_tail: (changelog entries, offset of the first entry, total entries)
+    """
+    fields = issue.get("fields", {})
+    histories, history_start, history_total = history_tail
+
+    comments = []
+    for comment in raw_comments:
+        comments.append({
+            "id": comment.get("id"),
+            "author": {
+                "email": comment.get("author", {}).get("emailAddress"),
+                "name": comment.get("author", {}).get("displayName"),
+                "avatar": comment.get("author", {}).get("avatarUrls", {}).get("48x48"),
+            } if comment.get("author") else None,
+            "body": comment.get("body"),
+            "created": comment.get("created"),
+            "updated": comment.get("updated"),
+        })
+
+    # Get attachments
+    attachments = []
+    for attachment in fields.get("attachment", []):
+        attachments.append({
+            "id": attachment.get("id"),
+            "filename": attachment.get("filename"),
+            "size": attachment.get("size"),
+            "mimeType": attachment.get("mimeType"),
+            "content": attachment.get("content"),  # Download URL
+            "created": attachment.get("created"),
+            "author": {
+                "email": attachment.get("author", {}).get("emailAddress"),
+                "name": attachment.get("author", {}).get("displayName"),
+            } if attachment.get("author") else None,
+        })
+
+    return {
+        "id": issue.get("id"),
+        "key": issue.get("key"),
+        "summary": fields.get("summary"),
+        "description": fields.get("description"),
+        "status": fields.get("status", {}).get("name") if fields.get("status") else None,
+        "priority": fields.get("priority", {}).get("name") if fields.get("priority") else None,
+        "type": fields.get("issuetype", {}).get("name") if fields.get("issuetype") else None,
+        "reporter": {
+            "email": fields.get("reporter", {}).get("emailAddress"),
+            "name": fields.get("reporter", {}).get("displayName"),
+            "avatar": fields.get("reporter", {}).get("avatarUrls", {}).get("48x48"),
+        } if fields.get("reporter") else None,
+        "assignee": {
+            "email": fields.get("assignee", {}).get("emailAddress"),
+            "name": fields.get("assignee", {}).get("displayName"),
+            "avatar": fields.get("assignee", {}).get("avatarUrls", {}).get("48x48"),
+        } if fields.get("assignee") else None,
+        "created": fields.get("created"),
+        "updated": fields.get("updated"),
+        "comments": comments,
+        "attachments": attachments,
+        "history": [_transform_history(change) for change in histories],
+        # Older entries can be loaded with get_issue_history(before=historyStartAt)
+        "historyStartAt": history_start,
+        "historyTotal": history_total,
+    }
+
+
+def _transform_history(change: dict) -> dict:
+    """Transform a Jira changelog entry into the history format."""
+    items = []
+    for item in change.get("items", []):
+        items.append({
+            "field": item.get("field"),
+            "from": item.get("fromString"),
+            "to": item.get("toString"),
+        })
+    return {
+        "id": change.get("id"),
+        "author": {
+            "email": change.get("author", {}).get("emailAddress"),
+            "name": change.get("author", {}).get("displayName"),
+        } if change.get("author") else None,
+        "created": change.get("created"),
+        "items": items,
+    }
+
+
+# =============================================================================
+# ISSUE MIRROR - Keep the local issues_mirror table in step with Jira
+# =============================================================================
+
+def refresh_mirrored_issue(issue_key: str) -> bool:
+    """
+    Re-read one issue from Jira into the local issue mirror.
+
+    Args:
+        issue_key: The Jira issue key
+
+    Returns:
+        True if the row was written, False if the issue no longer exists
+        (its row is replaced by a tombstone)
+    """
+    jira = get_jira_client()
+
+    def _fetch():
+        return jira.issue(issue_key, fields=issue_mirror.MIRROR_FIELDS)
+
+    try:
+        issue = _retry_with_backoff(_fetch)
+    except requests.exceptions.HTTPError as e:
+        if getattr(e.response, "status_code", None) != 404:
+            raise
+        issue_mirror.tombstone_issues({issue_key: "deleted"})
+        return False
+
+    if (issue.get("key") or "").upper() != issue_key.upper():
+        # Jira follows the old key of a moved issue to its new one
+        issue_mirror.tombstone_issues({issue_key: "moved"})
+        return False
+
+    return issue_mirror.upsert_issues([issue]) > 0
+
+
+def _sync_mirror_row(issue_key: Optional[str], changes: Optional[dict] = None) -> None:
+    """
+    Carry a write Relay made to an issue over to the local issue mirror.
+
+    Changes to plain columns are patched in place; anything else (new
+    issues, assignees) re-reads the issue. Failures only log, since the
+    next sync repairs the row and the Jira write itself succeeded.
+    """
+    if not issue_key or not issue_mirror.MIRROR_READS:
+        return
+
+    try:
+        if changes and set(changes) <= set(issue_mirror.PATCHABLE_FIELDS):
+            if issue_mirror.patch_issue(issue_key, changes):
+                return
+        refresh_mirrored_issue(issue_key)
+    except Exception as e:
+        logger.warning(f"Issue mirror update failed for {issue_key}: {e}")
+
+
+def _index_mirror_comment(issue_key: str, text: str) -> None:
+    """Add a comment Relay posted to the issue's full-text index row."""
+    if not issue_mirror.MIRROR_READS:
+        return
+
+    try:
+        issue_mirror.add_comment_text(issue_key, text)
+    except Exception as e:
+        logger.warning(f"Issue search index update failed for {issue_key}: {e}")
+
+
+# =============================================================================
+# BULK READS - Many issues by key in a few searches
+# =============================================================================
+
+# Light projection for get_issues_bulk: the list row fields, without
+# description, comments, attachments or changelog
+BULK_FIELDS = LIST_FIELDS
+# Keys per `key in (...)` search, so each chunk is a single page
+BULK_CHUNK_SIZE = SEARCH_MAX_PAGE_SIZE
+
+
+def _brief_cache_key(issue_key: str) -> str:
+    """Cache key for an issue's light (list row) projection."""
+    return f"brief:{issue_key.upper()}"
+
+
+def _cached_brief(issue_key: str) -> Optional[dict]:
+    """Return a cached light projection, falling back to a fresh detail."""
+    return JIRA_CACHE.get(_brief_cache_key(issue_key)) or JIRA_CACHE.get(_detail_cache_key(issue_key))
+
+
+def _bulk_keys(issue_keys: list) -> list:
+    """Uppercase and de-duplicate issue keys, keeping their order."""
+    # Request bodies may carry numbers or other JSON values; compare them as text
+    keys = (str(k).strip().upper() for k in issue_keys if k is not None)
+    return list(dict.fromkeys(k for k in keys if k))
+
+
+def _search_keys(issue_keys: list, fields: str) -> list:
+    """
+    Fetch the raw issues for up to BULK_CHUNK_SIZE keys in one search.
+
+    JQL rejects the whole query if it names an issue that does not exist.
+    The keys named in the error are dropped and the search repeated; if the
+    error names none, the chunk is split in half until the bad keys are
+    isolated.
+    """
+    keys_jql = ", ".join(f'"{k}"' for k in issue_keys)
+    jql = f"key IN ({keys_jql})"
+
+    try:
+        return list(iter_issues(jql, fields=fields, transform=lambda issue: issue))
+    except requests.exceptions.HTTPError as e:
+        status = getattr(getattr(e, "response", None), "status_code", None)
+        if status != 400:
+            raise
+        retry = _without_rejected_keys(e, issue_keys)
+        if retry is not None:
+            return _search_keys(retry, fields) if retry else []
+        if len(issue_keys) == 1:
+            return []
+        middle = len(issue_keys) // 2
+        return _search_keys(issue_keys[:middle], fields) + _search_keys(issue_keys[middle:], fields)
+
+
+def _without_rejected_keys(error: Exception, issue_keys: list) -> Optional[list]:
+    """
+    Drop the keys a rejected `key in (...)` search says do not exist.
 
-        if tool_conditions:
-            jql_parts.append(f"({' OR '.join(tool_conditions)})")
+    Returns:
+        The remaining keys, or None if the error names none of them
+    """
+    response = getattr(error, "response", None)
+    message = f"{error} {getattr(response, 'text', '')}".upper()
+    rejected = {k for k in issue_keys if f"'{k}'" in message}
+    if not rejected:
+        return None
+    return [k for k in issue_keys if k not in rejected]
 
 
-    if reporter:
-        jql_parts.append(f'reporter = "{reporter}"')
+def get_issues_bulk(
+    issue_keys: list,
+    fields: str = BULK_FIELDS,
+    skip_cache: bool = False,
+) -> dict:
+    """
+    Get many issues by key with a few `key in (...)` searches.
 
-    if search:
-        # Escape special JQL characters
-        escaped_search = search.replace('"', '\\"')
-        jql_parts.append(f'(summary ~ "{escaped_search}" OR description ~ "{escaped_search}")')
+    Returns a light projection (the issue list row format) without comments
+    or history, so a 100-issue bulk operation costs one upstream read
+    instead of one per issue. Issues already cached are not fetched, and
+    fetched issues are cached for later single-issue lookups.
 
-    jql = " AND ".join(jql_parts)
-    jql += " ORDER BY created DESC"
+    Args:
+        issue_keys: Jira issue keys (e.g., ["BUG-1", "BUG-2"])
+        fields: Comma-separated fields to request; caches are only read and
+            filled for the default BULK_FIELDS projection
+        skip_cache: If True, bypass cache and fetch fresh data
 
-    # Calculate start index
-    start_at = (page - 1) * limit
+    Returns:
+        { issues: { key: issue }, missing: [keys Jira did not return] }
+    """
+    keys = _bulk_keys(issue_keys)
+    use_cache = fields == BULK_FIELDS
+    found = {}
+
+    if use_cache and not skip_cache:
+        for key in keys:
+            cached = _cached_brief(key)
+            if cached:
+                found[key] = cached
+
+    wanted = [k for k in keys if k not in found]
+    chunks = [wanted[i:i + BULK_CHUNK_SIZE] for i in range(0, len(wanted), BULK_CHUNK_SIZE)]
+    if chunks:
+        logger.info(f"Bulk fetching {len(wanted)} issues in {len(chunks)} searches ({len(found)} cached)")
+
+    if len(chunks) > 1:
+        # Run in copies of this context so the request deadline applies there too
+        futures = [
+            _detail_executor.submit(contextvars.copy_context().run, _search_keys, chunk, fields)
+            for chunk in chunks
+        ]
+        results = [future.result() for future in futures]
+    else:
+        results = [_search_keys(chunk, fields) for chunk in chunks]
 
-    logger.info(f"Fetching issues with JQL: {jql}")
+    for raw in (issue for result in results for issue in result):
+        issue = _transform_list_issue(raw)
+        key = (issue.get("key") or "").upper()
+        found[key] = issue
+        if use_cache:
+            JIRA_CACHE.set(_brief_cache_key(key), issue)
 
-    def _fetch():
-        # Atlassian has deprecated /rest/api/3/search in favor of /rest/api/3/search/jql
-        # We use a raw request to ensure compatibility with the latest Jira Cloud requirement
-        path = "rest/api/3/search/jql"
-        params = {
-            "jql": jql,
-            "startAt": start_at,
-            "maxResults": limit,
-            "fields": "key,summary,status,priority,issuetype,reporter,assignee,created,updated",
-        }
-        response = jira.request(method="GET", path=path, params=params)
-        return response.json() if hasattr(response, 'json') else response
+    return {
+        "issues": {k: found[k] for k in keys if k in found},
+        "missing": [k for k in keys if k not in found],
+    }
 
-    result = _retry_with_backoff(_fetch)
-
-    # Transform issues to a cleaner format
-    issues = []
-    for issue in result.get("issues", []):
-        fields = issue.get("fields", {})
-        issues.append({
-            "key": issue.get("key"),
-            "summary": fields.get("summary"),
-            "status": fields.get("status", {}).get("name") if fields.get("status") else None,
-            "priority": fields.get("priority", {}).get("name") if fields.get("priority") else None,
-            "type": fields.get("issuetype", {}).get("name") if fields.get("issuetype") else None,
-            "reporter": {
-                "email": fields.get("reporter", {}).get("emailAddress"),
-                "name": fields.get("reporter", {}).get("displayName"),
-                "avatar": fields.get("reporter", {}).get("avatarUrls", {}).get("48x48"),
-            } if fields.get("reporter") else None,
-            "assignee": {
-                "email": fields.get("assignee", {}).get("emailAddress"),
-                "name": fields.get("assignee", {}).get("displayName"),
-                "avatar": fields.get("assignee", {}).get("avatarUrls", {}).get("48x48"),
-            } if fields.get("assignee") else None,
-            "created": fields.get("created"),
-            "updated": fields.get("updated"),
-        })
 
-    total = result.get("total", 0)
-    total_pages = (total + limit - 1) // limit if limit > 0 else 0
+def get_issue_brief(issue_key: str) -> Optional[dict]:
+    """
+    Get one issue's light projection (see get_issues_bulk).
 
-    response = {
-        "issues": issues,
-        "total": total,
-        "page": page,
-        "totalPages": total_pages,
-    }
+    Returns:
+        The issue in the list row format, or None if Jira did not return it
+    """
+    return get_issues_bulk([issue_key])["issues"].get(issue_key.strip().upper())
 
-    # Store in cache
-    _set_cache(cache_key, response)
 
-    return response
+# Prefix of the per-request label that makes create_issue safe to retry
+CORRELATION_LABEL_PREFIX = "relay-req-"
 
 
-def get_issue(issue_key: str) -> dict:
+def _find_issue_by_label(label: str) -> Optional[dict]:
     """
-    Get a single issue with all details.
+    Look up an issue by its correlation label.
 
-    Args:
-        issue_key: The Jira issue key (e.g., "BUG-123")
+    Jira's search index can lag a create by a moment, so a miss is not
+    proof the issue does not exist; it is the best check available.
 
     Returns:
-        Dict with full issue details including comments and attachments
+        Dict with key and self, or None if no issue has the label
     """
     jira = get_jira_client()
 
     def _fetch():
-        return jira.issue(issue_key, expand="changelog")
+        path = "rest/api/3/search/jql"
+        params = {
+            "jql": f'project = "{get_project_key()}" AND labels = "{label}"',
+            "maxResults": 1,
+            "fields": "key",
+        }
+        response = jira.request(method="GET", path=path, params=params)
+        return response.json() if hasattr(response, 'json') else response
 
-    issue = _retry_with_backoff(_fetch)
-    fields = issue.get("fields", {})
+    issues = _retry_with_backoff(_fetch).get("issues", [])
+    if not issues:
+        return None
+    return {"id": issues[0].get("id"), "key": issues[0].get("key"), "self": issues[0].get("self")}
 
-    # Fetch comments separately
-    def _fetch_comments():
-        return jira.issue_get_comments(issue_key)
 
-    comments_data = _retry_with_backoff(_fetch_comments)
-    comments = []
-    for comment in comments_data.get("comments", []):
-        comments.append({
-            "id": comment.get("id"),
-            "author": {
-                "email": comment.get("author", {}).get("emailAddress"),
-                "name": comment.get("author", {}).get("displayName"),
-                "avatar": comment.get("author", {}).get("avatarUrls", {}).get("48x48"),
-            } if comment.get("author") else None,
-            "body": comment.get("body"),
-            "created": comment.get("created"),
-            "updated": comment.get("updated"),
-        })
+def _remove_correlation_label(issue_key: str, label: str) -> None:
+    """
+    Drop a correlation label once its create is confirmed.
 
-    # Get attachments
-    attachments = []
-    for attachment in fields.get("attachment", []):
-        attachments.append({
-            "id": attachment.get("id"),
-            "filename": attachment.get("filename"),
-            "size": attachment.get("size"),
-            "mimeType": attachment.get("mimeType"),
-            "content": attachment.get("content"),  # Download URL
-            "created": attachment.get("created"),
-            "author": {
-                "email": attachment.get("author", {}).get("emailAddress"),
-                "name": attachment.get("author", {}).get("displayName"),
-            } if attachment.get("author") else None,
-        })
+    The label only matters while create_issue may still retry. A failure
+    here is logged rather than raised, since the issue itself exists.
+    """
+    jira = get_jira_client()
 
-    # Get activity/history from changelog
-    history = []
-    changelog = issue.get("changelog", {})
-    for change in changelog.get("histories", [])[-10:]:  # Last 10 changes
-        items = []
-        for item in change.get("items", []):
-            items.append({
-                "field": item.get("field"),
-                "from": item.get("fromString"),
-                "to": item.get("toString"),
-            })
-        history.append({
-            "id": change.get("id"),
-            "author": {
-                "email": change.get("author", {}).get("emailAddress"),
-                "name": change.get("author", {}).get("displayName"),
-            } if change.get("author") else None,
-            "created": change.get("created"),
-            "items": items,
-        })
+    def _remove():
+        return jira.edit_issue(issue_key, {"labels": [{"remove": label}]})
 
-    return {
-        "key": issue.get("key"),
-        "summary": fields.get("summary"),
-        "description": fields.get("description"),
-        "status": fields.get("status", {}).get("name") if fields.get("status") else None,
-        "priority": fields.get("priority", {}).get("name") if fields.get("priority") else None,
-        "type": fields.get("issuetype", {}).get("name") if fields.get("issuetype") else None,
-        "reporter": {
-            "email": fields.get("reporter", {}).get("emailAddress"),
-            "name": fields.get("reporter", {}).get("displayName"),
-            "avatar": fields.get("reporter", {}).get("avatarUrls", {}).get("48x48"),
-        } if fields.get("reporter") else None,
-        "assignee": {
-            "email": fields.get("assignee", {}).get("emailAddress"),
-            "name": fields.get("assignee", {}).get("displayName"),
-            "avatar": fields.get("assignee", {}).get("avatarUrls", {}).get("48x48"),
-        } if fields.get("assignee") else None,
-        "created": fields.get("created"),
-        "updated": fields.get("updated"),
-        "comments": comments,
-        "attachments": attachments,
-        "history": history,
-    }
+    try:
+        _retry_with_backoff(_remove)
+    except Exception as e:
+        logger.warning(f"Could not remove label {label} from {issue_key}: {e}")
 
 
 def create_issue(
@@ -414,6 +2289,7 @@ def create_issue(
 
     jira = get_jira_client()
     project_key = get_project_key()
+    correlation_label = f"{CORRELATION_LABEL_PREFIX}{uuid.uuid4().hex[:16]}"
 
     # Build the formatted description using the SQA template
     description = build_jira_description(
@@ -432,7 +2308,9 @@ def create_issue(
         "description": description,
         "issuetype": {"name": issue_type},
         "priority": {"name": priority},
-        "labels": ["relay-app"],
+        # The correlation label lets a retry find an issue this request
+        # already created before the error reached us; it is removed below
+        "labels": ["relay-app", correlation_label],
     }
 
     logger.info(f"Creating issue in project {project_key}: {summary}")
@@ -440,12 +2318,25 @@ def create_issue(
     def _create():
         return jira.create_issue(fields=issue_data)
 
-    result = _retry_with_backoff(_create)
+    result = _retry_with_backoff(
+        _create,
+        idempotent=False,
+        recover=lambda: _find_issue_by_label(correlation_label),
+    )
 
     logger.info(f"Created issue: {result.get('key')}")
+    _remove_correlation_label(result.get("key"), correlation_label)
 
-    # Invalidate issue list cache when a new issue is created
-    _invalidate_cache()
+    # Invalidate only the list pages the new issue could appear on
+    _invalidate_for_new_issue({
+        "type": issue_type,
+        "priority": priority,
+        "reporter": user_email,
+        "summary": summary,
+        "description": details,
+        "labels": ["relay-app"],
+    })
+    _sync_mirror_row(result.get("key"))
 
     return {
         "key": result.get("key"),
@@ -466,6 +2357,9 @@ def update_issue(issue_key: str, fields: dict) -> dict:
     """
     jira = get_jira_client()
 
+    # Read the issue's state before the field update drops its cached copy
+    state = _issue_state(issue_key) if "status" in fields else None
+
     update_fields = {}
 
     if "summary" in fields:
@@ -489,60 +2383,422 @@ def update_issue(issue_key: str, fields: dict) -> dict:
 
         _retry_with_backoff(_update)
 
+        # Refresh only the cached pages that contain or could contain this issue
+        _invalidate_issue(issue_key, {
+            k: fields[k] for k in ("summary", "description", "priority", "assignee") if k in fields
+        })
+
     # Handle status transition separately
     if "status" in fields:
-        transition_issue(issue_key, fields["status"])
-
-    # Invalidate cache when any issue is updated
-    _invalidate_cache()
+        transition_issue(issue_key, fields["status"], current=state)
 
     return {"key": issue_key}
 
 
-def transition_issue(issue_key: str, target_status: str) -> dict:
+# =============================================================================
+# WORKFLOW GRAPH - Transition IDs cached per (project, issue type, status)
+# =============================================================================
+
+# Workflows rarely change; a stale entry is also replaced whenever Jira
+# rejects one of its transitions
+WORKFLOW_TTL_SECONDS = int(os.getenv("JIRA_WORKFLOW_TTL_SECONDS", "86400"))
+
+
+def _workflow_cache_key(issue_type: str, status: str) -> str:
+    """Cache key for the transitions out of one workflow status."""
+    return f"workflow:{get_project_key()}:{issue_type}:{status}".lower()
+
+
+def _issue_state(issue_key: str, current: Optional[dict] = None) -> Optional[dict]:
+    """
+    Find an issue's type and current status without calling Jira.
+
+    Uses the caller's copy of the issue if given, then cached details and
+    bulk projections, then cached list pages.
+
+    Returns:
+        Dict with type and status, or None if the issue is not cached
+    """
+    candidates = [current] if current else []
+
+    for cache_key in (_detail_cache_key(issue_key), _brief_cache_key(issue_key)):
+        entry = JIRA_CACHE.get_stale(cache_key)
+        if entry:
+            candidates.append(entry[0])
+
+    for _, window, _ in JIRA_CACHE.entries_for_tag(_issue_tag(issue_key)):
+        for _, seg_issues in window.get("segments", []):
+            candidates.extend(i for i in seg_issues if i.get("key", "").upper() == issue_key.upper())
+
+    for issue in candidates:
+        if issue.get("type") and issue.get("status"):
+            return {"type": issue["type"], "status": issue["status"]}
+    return None
+
+
+def _get_issue_transitions(issue_key: str, state: Optional[dict] = None) -> tuple:
+    """
+    Get the transitions available to an issue.
+
+    When the issue's type and status are known, the workflow graph cache is
+    used and filled; otherwise the issue's transitions are fetched live.
+
+    Returns:
+        (transitions response, workflow cache key if served from the cache)
+    """
+    cache_key = _workflow_cache_key(state["type"], state["status"]) if state else None
+    if cache_key:
+        cached = JIRA_CACHE.get(cache_key)
+        if cached:
+            return cached, cache_key
+
+    jira = get_jira_client()
+
+    def _get_transitions():
+        # The raw response keeps each transition's full `to` status
+        return jira.get_issue_transitions_full(issue_key)
+
+    transitions = _workflow_transitions(_retry_with_backoff(_get_transitions))
+    if cache_key:
+        JIRA_CACHE.set(cache_key, transitions, ttl_seconds=WORKFLOW_TTL_SECONDS)
+    return transitions, None
+
+
+def _workflow_transitions(transitions: dict) -> dict:
+    """Keep only the id, name and target status of each transition."""
+    return {
+        "transitions": [
+            {"id": t.get("id"), "name": t.get("name"), "to": {"name": t.get("to", {}).get("name")}}
+            for t in transitions.get("transitions", [])
+        ]
+    }
+
+
+def transition_issue(issue_key: str, target_status: str, current: Optional[dict] = None) -> dict:
     """
     Transition an issue to a new status.
 
+    The transition ID comes from the workflow graph cache when the issue's
+    type and status are known, so usually only the transition itself calls
+    Jira. If the cached graph has no matching transition, or Jira rejects
+    it, the entry is dropped and the issue's live transitions are used.
+
     Args:
         issue_key: The Jira issue key
         target_status: The target status name
+        current: The caller's copy of the issue (with type and status), if any
 
     Returns:
-        Dict with issue key and new status
+        Dict with issue key and new status (as spelled by Jira)
     """
     jira = get_jira_client()
 
-    # Get available transitions
-    def _get_transitions():
-        return jira.get_issue_transitions(issue_key)
+    transition_id, new_status, cache_key = _resolve_transition(issue_key, target_status, current)
+
+    logger.info(f"Transitioning {issue_key} to {target_status}")
+
+    def _transition():
+        return jira.set_issue_status_by_transition_id(issue_key, transition_id)
+
+    def _transition_applied():
+        # A transition that went through leaves the issue in the new status
+        issue = jira.issue(issue_key, fields="status")
+        status = issue.get("fields", {}).get("status", {}).get("name", "")
+        return True if status.lower() == new_status.lower() else None
+
+    try:
+        _retry_with_backoff(_transition, idempotent=False, recover=_transition_applied)
+    except requests.exceptions.HTTPError as e:
+        if not cache_key or is_upstream_failure(e):
+            raise
+        # Jira rejected the cached transition: retry with the live ones
+        logger.info(f"Workflow cache REJECTED for {issue_key} -> {target_status}, refreshing")
+        JIRA_CACHE.delete(cache_key)
+        transitions, _ = _get_issue_transitions(issue_key)
+        transition_id, new_status = _select_transition(transitions, target_status)
+        _retry_with_backoff(_transition, idempotent=False, recover=_transition_applied)
+
+    # Refresh only the cached pages affected by the status change
+    _invalidate_issue(issue_key, {"status": new_status})
+
+    return {"key": issue_key, "status": new_status}
+
+
+def _resolve_transition(issue_key: str, target_status: str, current: Optional[dict] = None) -> tuple:
+    """
+    Find the transition that takes an issue to a status.
+
+    Uses the workflow graph cache when the issue's state is known; a cached
+    graph without a matching transition is dropped and the live
+    transitions are used instead.
+
+    Returns:
+        (transition ID, target status name, workflow cache key if the
+        transition came from the cache)
+
+    Raises:
+        ValueError: If the issue has no transition to the status
+    """
+    transitions, cache_key = _get_issue_transitions(issue_key, _issue_state(issue_key, current))
+    try:
+        transition_id, new_status = _select_transition(transitions, target_status)
+    except ValueError:
+        if not cache_key:
+            raise
+        # The workflow (or the issue's status) changed since it was cached
+        logger.info(f"Workflow cache MISMATCH for {issue_key} -> {target_status}, refreshing")
+        JIRA_CACHE.delete(cache_key)
+        transitions, cache_key = _get_issue_transitions(issue_key)
+        transition_id, new_status = _select_transition(transitions, target_status)
+    return transition_id, new_status, cache_key
+
 
-    transitions = _retry_with_backoff(_get_transitions)
+def _select_transition(transitions: dict, target_status: str) -> tuple:
+    """
+    Find the transition that leads to the target status.
+
+    Returns:
+        (transition id, status name as spelled by Jira)
 
-    # Find the transition that leads to the target status
-    transition_id = None
+    Raises:
+        ValueError: If no available transition leads to the target status
+    """
     for t in transitions.get("transitions", []):
         if t.get("to", {}).get("name", "").lower() == target_status.lower():
-            transition_id = t.get("id")
-            break
+            return t.get("id"), t.get("to", {}).get("name")
 
-    if not transition_id:
-        available = [t.get("to", {}).get("name") for t in transitions.get("transitions", [])]
-        raise ValueError(
-            f"Cannot transition to '{target_status}'. "
-            f"Available transitions: {available}"
-        )
+    available = [t.get("to", {}).get("name") for t in transitions.get("transitions", [])]
+    raise ValueError(
+        f"Cannot transition to '{target_status}'. "
+        f"Available transitions: {available}"
+    )
 
-    logger.info(f"Transitioning {issue_key} to {target_status}")
 
-    def _transition():
-        return jira.issue_transition(issue_key, transition_id)
+# =============================================================================
+# BULK TRANSITIONS - One Jira background task for many issues
+# =============================================================================
+
+# Bulk transitions run as a Jira task whose progress is polled
+BULK_POLL_INTERVAL_SECONDS = float(os.getenv("JIRA_BULK_POLL_INTERVAL", "0.5"))
+BULK_POLL_MAX_INTERVAL_SECONDS = 2.0
+# Longest a bulk transition is waited for (never past the request deadline)
+BULK_TIMEOUT_SECONDS = float(os.getenv("JIRA_BULK_TIMEOUT_SECONDS", "30"))
+# How long to use single transitions after the bulk endpoint was unavailable
+BULK_UNAVAILABLE_SECONDS = 3600
+
+# Statuses meaning the bulk endpoint is not available on this Jira
+_BULK_UNAVAILABLE_STATUSES = {404, 405, 501}
+_BULK_DONE_STATUSES = {"COMPLETE", "FAILED", "CANCELLED", "DEAD"}
+# Reason given for issues a bulk task had not processed when the wait ended
+_BULK_UNFINISHED = "Bulk transition did not finish in time"
+_bulk_unavailable_until = 0.0
+# Concurrent single transitions (the fallback when the bulk endpoint is
+# unavailable) run on their own small pool, so interactive reads on
+# _detail_executor never queue behind a large bulk change
+BULK_TRANSITION_WORKERS = max(1, int(os.getenv("JIRA_BULK_TRANSITION_WORKERS", "4")))
+_transition_executor = ThreadPoolExecutor(
+    max_workers=BULK_TRANSITION_WORKERS, thread_name_prefix="jira-transition"
+)
+
+
+def transition_issues_bulk(
+    issue_keys: list,
+    target_status: str,
+    current: Optional[dict] = None,
+) -> dict:
+    """
+    Transition many issues to a status with Jira's bulk transition API.
+
+    Issues are grouped by transition ID and submitted as one bulk task,
+    whose progress is polled until it finishes or the wait runs out; issues
+    the task had not reached by then are reported as pending, since Jira
+    may still move them. Issues whose cached transition Jira rejects are
+    retried one by one with their live transitions. If the bulk endpoint is
+    unavailable, every issue is transitioned individually and concurrently
+    instead.
+
+    Args:
+        issue_keys: Jira issue keys
+        target_status: The target status name
+        current: Issue key -> the caller's copy of the issue (with id, type
+            and status), e.g. from get_issues_bulk; fetched if not given
+
+    Returns:
+        { updated: [keys], failed: { key: reason }, pending: [keys still
+        processing], statuses: { updated key: status as spelled by Jira } }
+    """
+    global _bulk_unavailable_until
+
+    keys = _bulk_keys(issue_keys)
+    if current is None:
+        current = get_issues_bulk(keys)["issues"]
+    current = {k.upper(): v for k, v in current.items()}
+
+    failed = {k: "Issue not found" for k in keys if k not in current}
+    groups = {}  # { transition ID: [keys] }
+    statuses = {}  # { key: target status as spelled by Jira }
+    from_cache = set()
+    singles = []
+    for key in keys:
+        if key in failed:
+            continue
+        if not current[key].get("id"):
+            singles.append(key)
+            continue
+        try:
+            transition_id, statuses[key], cache_key = _resolve_transition(key, target_status, current[key])
+        except ValueError as e:
+            failed[key] = str(e)
+            continue
+        groups.setdefault(transition_id, []).append(key)
+        if cache_key:
+            from_cache.add(key)
+
+    updated, pending = [], []
+    if groups and time.time() < _bulk_unavailable_until:
+        singles.extend(k for group in groups.values() for k in group)
+    elif groups:
+        try:
+            bulk_updated, bulk_failed = _run_bulk_transition(groups, current)
+        except requests.exceptions.HTTPError as e:
+            status = getattr(getattr(e, "response", None), "status_code", None)
+            if status not in _BULK_UNAVAILABLE_STATUSES:
+                raise
+            logger.warning(f"Jira bulk transition unavailable ({status}), using single transitions")
+            _bulk_unavailable_until = time.time() + BULK_UNAVAILABLE_SECONDS
+            singles.extend(k for group in groups.values() for k in group)
+        else:
+            updated.extend(bulk_updated)
+            for key, reason in bulk_failed.items():
+                if reason == _BULK_UNFINISHED:
+                    # The task may still move it: drop what is cached rather
+                    # than guess its status
+                    pending.append(key)
+                    _invalidate_issue(key)
+                elif key in from_cache:
+                    # A stale workflow cache entry may have picked the transition
+                    singles.append(key)
+                else:
+                    failed[key] = reason
+            for key in bulk_updated:
+                _invalidate_issue(key, {"status": statuses[key]})
+
+    if singles:
+        single_updated, single_failed = _transition_concurrently(singles, target_status, current)
+        updated.extend(single_updated)
+        statuses.update(single_updated)
+        failed.update(single_failed)
+
+    return {
+        "updated": [k for k in keys if k in updated],
+        "failed": {k: failed[k] for k in keys if k in failed},
+        "pending": [k for k in keys if k in pending],
+        "statuses": {k: statuses[k] for k in keys if k in updated},
+    }
+
+
+def _run_bulk_transition(groups: dict, current: dict) -> tuple:
+    """
+    Submit one bulk transition task and wait for it.
+
+    Args:
+        groups: Transition ID -> issue keys to move with it
+        current: Issue key -> issue with its id, to map task results back
+
+    Returns:
+        (updated keys, { failed key: reason })
+    """
+    jira = get_jira_client()
+    body = {
+        "bulkTransitionInputs": [
+            {"selectedIssueIdsOrKeys": group, "transitionId": transition_id}
+            for transition_id, group in groups.items()
+        ],
+        # Relay sends its own notifications
+        "sendBulkNotification": False,
+    }
+
+    def _submit():
+        path = "rest/api/3/bulk/issues/transition"
+        response = jira.request(method="POST", path=path, json=body)
+        return response.json() if hasattr(response, 'json') else response
+
+    # Not retried after an ambiguous failure: a second task could race the first
+    task_id = _retry_with_backoff(_submit, idempotent=False)["taskId"]
+    logger.info(f"Submitted Jira bulk transition task {task_id} for {sum(map(len, groups.values()))} issues")
+
+    task = _wait_for_bulk_task(task_id)
+
+    processed = {str(issue_id) for issue_id in task.get("processedAccessibleIssues") or []}
+    errors = {str(issue_id): msgs for issue_id, msgs in (task.get("failedAccessibleIssues") or {}).items()}
+    finished = task.get("status") in _BULK_DONE_STATUSES
+
+    updated, failed = [], {}
+    for key in (k for group in groups.values() for k in group):
+        issue_id = str(current[key]["id"])
+        if issue_id in processed:
+            updated.append(key)
+        elif issue_id in errors:
+            failed[key] = "; ".join(errors[issue_id]) or "Transition failed"
+        elif finished:
+            failed[key] = "Issue could not be transitioned"
+        else:
+            failed[key] = _BULK_UNFINISHED
+    return updated, failed
+
+
+def _wait_for_bulk_task(task_id: str) -> dict:
+    """
+    Poll a Jira bulk task until it finishes or the wait runs out.
+
+    Returns:
+        The last task status read (may still be running)
+    """
+    jira = get_jira_client()
+    wait = deadline.clamp(BULK_TIMEOUT_SECONDS, reserve=deadline.MIN_ATTEMPT_SECONDS)
+    give_up_at = time.monotonic() + wait
+    interval = BULK_POLL_INTERVAL_SECONDS
+
+    def _poll():
+        response = jira.request(method="GET", path=f"rest/api/3/bulk/queue/{task_id}")
+        return response.json() if hasattr(response, 'json') else response
+
+    while True:
+        task = _retry_with_backoff(_poll)
+        if task.get("status") in _BULK_DONE_STATUSES:
+            return task
+        if time.monotonic() + interval >= give_up_at:
+            logger.warning(
+                f"Jira bulk task {task_id} still {task.get('status')} "
+                f"({task.get('progressPercent', 0)}%) after {wait:.0f}s"
+            )
+            return task
+        time.sleep(interval)
+        interval = min(interval * 2, BULK_POLL_MAX_INTERVAL_SECONDS)
+
 
-    _retry_with_backoff(_transition)
+def _transition_concurrently(issue_keys: list, target_status: str, current: dict) -> tuple:
+    """
+    Transition issues one by one, concurrently.
 
-    # Invalidate cache when status changes
-    _invalidate_cache()
+    Returns:
+        ({ updated key: new status }, { failed key: reason })
+    """
+    futures = {
+        # Run in copies of this context so the request deadline applies there too
+        key: _transition_executor.submit(
+            contextvars.copy_context().run, transition_issue, key, target_status, current.get(key)
+        )
+        for key in issue_keys
+    }
 
-    return {"key": issue_key, "status": target_status}
+    updated, failed = {}, {}
+    for key, future in futures.items():
+        try:
+            updated[key] = future.result()["status"]
+        except Exception as e:
+            failed[key] = str(e)
+    return updated, failed
 
 
 def add_comment(issue_key: str, comment_text: str, user_email: str) -> dict:
@@ -559,15 +2815,29 @@ def add_comment(issue_key: str, comment_text: str, user_email: str) -> dict:
     """
     jira = get_jira_client()
 
-    # Add attribution to the comment
-    formatted_comment = f"{comment_text}\n\n_— Posted via Relay by {user_email}_"
+    formatted_comment = _format_comment(comment_text, user_email)
 
     logger.info(f"Adding comment to {issue_key}")
 
     def _add_comment():
         return jira.issue_add_comment(issue_key, formatted_comment)
 
-    result = _retry_with_backoff(_add_comment)
+    # Allow for clock skew between us and Jira
+    posted_after = datetime.now(timezone.utc) - timedelta(minutes=1)
+
+    def _find_comment():
+        # The comment already exists if the failed attempt went through
+        for comment in reversed(jira.issue_get_comments(issue_key).get("comments", [])):
+            created = _parse_jira_timestamp(comment.get("created"))
+            if comment.get("body") == formatted_comment and created and created >= posted_after:
+                return comment
+        return None
+
+    result = _retry_with_backoff(_add_comment, idempotent=False, recover=_find_comment)
+
+    # The cached detail no longer has this comment
+    JIRA_CACHE.delete(_detail_cache_key(issue_key))
+    _index_mirror_comment(issue_key, formatted_comment)
 
     return {
         "id": result.get("id"),
@@ -576,6 +2846,19 @@ def add_comment(issue_key: str, comment_text: str, user_email: str) -> dict:
     }
 
 
+def _parse_jira_timestamp(value: Optional[str]) -> Optional[datetime]:
+    """Parse a Jira timestamp such as 2024-01-31T12:00:00.000+0000."""
+    try:
+        return datetime.strptime(value, "%Y-%m-%dT%H:%M:%S.%f%z")
+    except (TypeError, ValueError):
+        return None
+
+
+def _format_comment(comment_text: str, user_email: str) -> str:
+    """Add Relay attribution to a comment body."""
+    return f"{comment_text}\n\n_— Posted via Relay by {user_email}_"
+
+
 def upload_attachment(issue_key: str, filename: str, file_content: bytes) -> dict:
     """
     Upload an attachment to an issue.
@@ -595,7 +2878,12 @@ def upload_attachment(issue_key: str, filename: str, file_content: bytes) -> dic
     def _upload():
         return jira.add_attachment(issue_key, filename=filename, file=file_content)
 
-    result = _retry_with_backoff(_upload)
+    # No cheap way to tell whether an interrupted upload landed, so it is
+    # only retried when Jira certainly did not receive it
+    result = _retry_with_backoff(_upload, idempotent=False)
+
+    # The cached detail no longer has this attachment
+    JIRA_CACHE.delete(_detail_cache_key(issue_key))
 
     # Result is a list of attachments
     if result and len(result) > 0:
@@ -629,8 +2917,9 @@ def check_user_can_edit(issue_key: str, user_email: str, user_role: str) -> bool
     if user_role in ["sqa", "admin"]:
         return True
 
-    # Regular users can only edit their own issues
-    issue = get_issue(issue_key)
+    # Regular users can only edit their own issues; the light projection has
+    # the reporter (get_issue raises the usual error for a missing issue)
+    issue = get_issue_brief(issue_key) or get_issue(issue_key)
     reporter_email = issue.get("reporter", {}).get("email")
 
     return reporter_email and reporter_email.lower() == user_email.lower()
@@ -646,7 +2935,15 @@ def get_issues_updated_since(timestamp: str) -> list:
     Returns:
         List of updated issues (key, summary, status, priority, updated)
     """
-    jira = get_jira_client()
+    jql = _updated_since_jql(timestamp)
+
+    logger.info(f"Fetching issues updated since {timestamp}")
+
+    return list(iter_issues(jql, fields=UPDATED_FIELDS, transform=_transform_updated_issue))
+
+
+def _updated_since_jql(timestamp: str) -> str:
+    """Build the get_issues_updated_since JQL query."""
     project_key = get_project_key()
 
     # Convert timestamp to Jira format
@@ -656,37 +2953,21 @@ def get_issues_updated_since(timestamp: str) -> list:
     except ValueError:
         jira_timestamp = timestamp
 
-    jql = (
+    return (
         f"project = '{project_key}' "
         f"AND (labels = 'relay-app' OR description ~ 'Relay App') "
         f"AND updated >= '{jira_timestamp}' "
         f"ORDER BY updated DESC"
     )
 
-    logger.info(f"Fetching issues updated since {jira_timestamp}")
-
-    def _fetch():
-        # Migrate to new /search/jql endpoint
-        path = "rest/api/3/search/jql"
-        params = {
-            "jql": jql,
-            "maxResults": 100,
-            "fields": "key,summary,status,priority,updated",
-        }
-        response = jira.request(method="GET", path=path, params=params)
-        return response.json() if hasattr(response, 'json') else response
-
-    result = _retry_with_backoff(_fetch)
-
-    issues = []
-    for issue in result.get("issues", []):
-        fields = issue.get("fields", {})
-        issues.append({
-            "key": issue.get("key"),
-            "summary": fields.get("summary"),
-            "status": fields.get("status", {}).get("name") if fields.get("status") else None,
-            "priority": fields.get("priority", {}).get("name") if fields.get("priority") else None,
-            "updated": fields.get("updated"),
-        })
 
-    return issues
+def _transform_updated_issue(issue: dict) -> dict:
+    """Transform a Jira search result into the updated-issues format."""
+    fields = issue.get("fields", {})
+    return {
+        "key": issue.get("key"),
+        "summary": fields.get("summary"),
+        "status": fields.get("status", {}).get("name") if fields.get("status") else None,
+        "priority": fields.get("priority", {}).get("name") if fields.get("priority") else None,
+        "updated": fields.get("updated"),
+    }
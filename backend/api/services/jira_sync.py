@@ -0,0 +1,300 @@
+"""Incremental sync of Relay issues from Jira into the local issue mirror.
+
+- Backfill: walks every Relay issue in key order and upserts it in batches.
+  Progress is saved after each batch, so an interrupted backfill resumes
+  after the last stored key instead of starting over.
+- Incremental sync: reads the issues updated since a persisted watermark,
+  oldest first, minus an overlap window that absorbs clock skew and Jira's
+  search index lag. The watermark advances after every batch.
+- Reconcile: compares the mirror with the keys Jira still returns and
+  replaces issues that were deleted or moved out of the project with
+  tombstones. It runs periodically, and sooner when Jira reports fewer
+  issues than the mirror holds.
+- Recount: rebuilds the issue counters behind the stats summary from the
+  mirror, correcting any drift in their incremental updates.
+
+Run it with sync_worker.py. Only one worker should run at a time.
+"""
+
+import os
+import json
+import math
+import time
+import logging
+from typing import Iterator, Optional
+
+import requests
+
+from . import issue_mirror
+from .jira_service import (
+    SEARCH_MAX_PAGE_SIZE,
+    _build_issues_jql,
+    _count_jql,
+    _is_relay_issue,
+    _retry_with_backoff,
+    count_issues,
+    get_jira_client,
+    iter_issues,
+)
+
+logger = logging.getLogger(__name__)
+
+# Seconds between incremental syncs
+SYNC_INTERVAL_SECONDS = float(os.getenv("JIRA_SYNC_INTERVAL", "60"))
+# Issues updated this long before the watermark are read again
+SYNC_OVERLAP_SECONDS = float(os.getenv("JIRA_SYNC_OVERLAP_SECONDS", "300"))
+# Issues per Jira page and per database transaction
+SYNC_BATCH_SIZE = max(1, min(int(os.getenv("JIRA_SYNC_BATCH_SIZE", "100")), SEARCH_MAX_PAGE_SIZE))
+# Seconds between checks for deleted or moved issues
+RECONCILE_INTERVAL_SECONDS = float(os.getenv("JIRA_SYNC_RECONCILE_SECONDS", "21600"))
+# Seconds between full recounts of the issue counters
+RECOUNT_INTERVAL_SECONDS = float(os.getenv("JIRA_COUNTERS_RECOUNT_SECONDS", "3600"))
+# Missing issues looked up one by one to tell deleted from moved
+_CLASSIFY_LIMIT = 50
+
+# sync_state rows
+WATERMARK_STATE = "issues_mirror.watermark"
+BACKFILL_STATE = "issues_mirror.backfill"
+RECONCILED_STATE = "issues_mirror.reconciled_at"
+
+
+def _relay_jql(condition: Optional[str] = None, order_by: str = "key ASC") -> str:
+    """Build a JQL query for every Relay issue, optionally narrowed by a condition."""
+    jql = _count_jql(_build_issues_jql({}))
+    if condition:
+        jql += f" AND {condition}"
+    return f"{jql} ORDER BY {order_by}"
+
+
+def _batches(jql: str, fields: str = issue_mirror.MIRROR_FIELDS) -> Iterator[list]:
+    """Walk a JQL query and yield raw issues in lists of SYNC_BATCH_SIZE."""
+    batch = []
+    for issue in iter_issues(jql, fields, page_size=SYNC_BATCH_SIZE, transform=lambda issue: issue):
+        batch.append(issue)
+        if len(batch) >= SYNC_BATCH_SIZE:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _get_float_state(name: str) -> Optional[float]:
+    value = issue_mirror.get_sync_state(name)
+    return float(value) if value else None
+
+
+def get_watermark() -> Optional[float]:
+    """Epoch `updated` time up to which the mirror has every change, or None."""
+    return _get_float_state(WATERMARK_STATE)
+
+
+def _advance_watermark(value: float) -> None:
+    """Move the watermark forward (never back)."""
+    current = get_watermark()
+    if current is None or value > current:
+        issue_mirror.set_sync_state(WATERMARK_STATE, str(value))
+
+
+def _load_backfill() -> Optional[dict]:
+    value = issue_mirror.get_sync_state(BACKFILL_STATE)
+    return json.loads(value) if value else None
+
+
+def _save_backfill(state: dict) -> None:
+    issue_mirror.set_sync_state(BACKFILL_STATE, json.dumps(state))
+
+
+def needs_backfill() -> bool:
+    """Check whether the mirror was never fully loaded or a backfill was interrupted."""
+    state = _load_backfill()
+    return get_watermark() is None or (state is not None and not state.get("complete"))
+
+
+# =============================================================================
+# BACKFILL
+# =============================================================================
+
+def run_backfill(restart: bool = False) -> dict:
+    """
+    Load every Relay issue into the mirror, resuming an interrupted run.
+
+    Args:
+        restart: Start over even if an earlier backfill was interrupted
+
+    Returns:
+        Dict with loaded (issues written by this and earlier attempts of
+        the same backfill), removed (issues tombstoned) and resumed
+    """
+    state = _load_backfill()
+    resumed = bool(state) and not state.get("complete") and not restart
+    if not resumed:
+        state = {"startedAt": time.time(), "afterKey": None, "loaded": 0, "complete": False}
+        _save_backfill(state)
+    else:
+        logger.info(f"Resuming issue mirror backfill after {state['afterKey']}")
+
+    after_key = state.get("afterKey")
+    condition = f'key > "{after_key}"' if after_key else None
+
+    for batch in _batches(_relay_jql(condition, "key ASC")):
+        state["loaded"] += issue_mirror.upsert_issues(batch)
+        state["afterKey"] = batch[-1]["key"]
+        _save_backfill(state)
+        logger.info(f"Issue mirror backfill: {state['loaded']} issues, up to {state['afterKey']}")
+
+    # Rows the walk did not rewrite belong to issues no longer in Relay
+    started_at = state["startedAt"]
+    gone = issue_mirror.keys_synced_before(started_at)
+    removed = issue_mirror.tombstone_issues(_classify_missing(gone)) if gone else 0
+
+    # Changes made while the walk ran are picked up by the next sync
+    _advance_watermark(started_at)
+    issue_mirror.set_sync_state(RECONCILED_STATE, str(started_at))
+    issue_mirror.mark_synced(started_at)
+
+    state["complete"] = True
+    _save_backfill(state)
+    logger.info(f"Issue mirror backfill complete: {state['loaded']} issues, {removed} removed")
+    return {"loaded": state["loaded"], "removed": removed, "resumed": resumed}
+
+
+# =============================================================================
+# INCREMENTAL SYNC
+# =============================================================================
+
+def sync_updates() -> dict:
+    """
+    Upsert the issues updated since the watermark.
+
+    Returns:
+        Dict with updated (issues written) and watermark (new epoch value)
+
+    Raises:
+        ValueError: If the mirror needs a backfill first
+    """
+    watermark = get_watermark()
+    if watermark is None:
+        raise ValueError("Issue mirror has no watermark; run a backfill first")
+
+    started_at = time.time()
+    # JQL compares dates in the Jira user's time zone; a relative window
+    # ("-15m") is measured on Jira's clock and avoids the conversion
+    minutes = max(1, math.ceil((started_at - watermark + SYNC_OVERLAP_SECONDS) / 60))
+    jql = _relay_jql(f'updated >= "-{minutes}m"', "updated ASC")
+
+    updated = 0
+    for batch in _batches(jql):
+        updated += issue_mirror.upsert_issues(batch)
+        stamps = [issue_mirror.parse_timestamp(i.get("fields", {}).get("updated")) for i in batch]
+        newest = max((s for s in stamps if s is not None), default=None)
+        if newest is not None:
+            _advance_watermark(min(newest, started_at))
+
+    # A completed walk has seen every change made before it started
+    _advance_watermark(started_at)
+    issue_mirror.mark_synced(started_at)
+    if updated:
+        logger.info(f"Issue mirror sync: {updated} issues updated in the last {minutes} minutes")
+    return {"updated": updated, "watermark": started_at}
+
+
+# =============================================================================
+# RECONCILE - Tombstones for deleted and moved issues
+# =============================================================================
+
+def _classify_missing(issue_keys: list) -> dict:
+    """
+    Work out why issues are no longer returned by the Relay query.
+
+    Only issues confirmed gone are returned. Issues that Jira still has
+    under the same key and that still belong to Relay (e.g. the search
+    index had not caught up with them), issues whose lookup failed, and
+    issues past the first _CLASSIFY_LIMIT are left out, so they are not
+    tombstoned; the next reconcile looks at them again.
+
+    Returns:
+        Issue key -> "deleted" (gone or not visible), "moved" (Jira
+        redirects the key to another issue key) or "unlabeled" (still
+        there but no longer a Relay issue)
+    """
+    jira = get_jira_client()
+    reasons = {}
+
+    for key in issue_keys[:_CLASSIFY_LIMIT]:
+        try:
+            issue = _retry_with_backoff(
+                lambda key=key: jira.issue(key, fields="project,labels,description")
+            )
+        except requests.exceptions.HTTPError as e:
+            status = getattr(e.response, "status_code", None)
+            if status == 404:
+                reasons[key] = "deleted"
+            else:
+                logger.warning(f"Could not check missing issue {key}: {e}")
+            continue
+        if (issue.get("key") or "").upper() != key.upper():
+            reasons[key] = "moved"
+        elif not _is_relay_issue(issue):
+            reasons[key] = "unlabeled"
+
+    if len(issue_keys) > _CLASSIFY_LIMIT:
+        logger.info(f"{len(issue_keys) - _CLASSIFY_LIMIT} missing issues left for the next reconcile")
+    return reasons
+
+
+def reconcile() -> dict:
+    """
+    Tombstone mirrored issues that Jira no longer returns for Relay.
+
+    Returns:
+        Dict with checked (issues Jira returned) and removed (tombstoned)
+    """
+    started_at = time.time()
+    seen = set()
+    for batch in _batches(_relay_jql(order_by="key ASC"), fields="key"):
+        seen.update(issue["key"].upper() for issue in batch)
+
+    # Rows written after the walk started may be newer than it
+    gone = [key for key in issue_mirror.keys_synced_before(started_at) if key not in seen]
+    removed = issue_mirror.tombstone_issues(_classify_missing(gone), started_at) if gone else 0
+
+    issue_mirror.set_sync_state(RECONCILED_STATE, str(started_at))
+    if removed:
+        logger.info(f"Issue mirror reconcile: {removed} issues tombstoned")
+    return {"checked": len(seen), "removed": removed}
+
+
+def _reconcile_due() -> bool:
+    """Check whether it is time to look for deleted or moved issues."""
+    reconciled_at = _get_float_state(RECONCILED_STATE)
+    if reconciled_at is None or time.time() - reconciled_at >= RECONCILE_INTERVAL_SECONDS:
+        return True
+    # Fewer issues in Jira than in the mirror means some were removed
+    return count_issues(_relay_jql()) < issue_mirror.count_issues()
+
+
+def _recount_due() -> bool:
+    """Check whether it is time to rebuild the issue counters."""
+    recounted_at = _get_float_state(issue_mirror.RECOUNTED_STATE)
+    return recounted_at is None or time.time() - recounted_at >= RECOUNT_INTERVAL_SECONDS
+
+
+def run_cycle() -> dict:
+    """
+    Run one sync worker cycle: a backfill if one is needed, otherwise an
+    incremental sync followed by a reconcile when due, then a recount of
+    the issue counters when due.
+
+    Returns:
+        Dict with the results of the steps that ran
+    """
+    if needs_backfill():
+        result = {"backfill": run_backfill()}
+    else:
+        result = {"sync": sync_updates()}
+        if _reconcile_due():
+            result["reconcile"] = reconcile()
+
+    if _recount_due():
+        result["recount"] = issue_mirror.recount_counters()
+    return result
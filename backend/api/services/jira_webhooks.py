@@ -0,0 +1,303 @@
+"""Jira webhook processing for Relay.
+
+Applies jira:issue_created, jira:issue_updated, jira:issue_deleted and
+comment_created/updated/deleted events straight to JIRA_CACHE and the
+local issue mirror, using only the data in the payload (no calls back to
+Jira).
+
+Processing is idempotent and tolerates out-of-order delivery:
+
+- a delivery already processed (same X-Atlassian-Webhook-Identifier, or
+  the same body) is skipped
+- an issue event older than the last one applied to that issue is skipped
+- the mirror never replaces a row with an older copy, and never brings
+  back an issue deleted after the event was sent; an event older than the
+  mirror row or the cached list row changes nothing
+
+Processed deliveries and per-issue event times are kept in the database
+(webhook_deliveries, webhook_issue_events), so they hold across workers,
+restarts and cache evictions.
+"""
+
+import os
+import json
+import time
+import hmac
+import hashlib
+import logging
+import threading
+from typing import Optional
+
+from . import issue_mirror
+from ..utils.database import get_connection
+from .jira_service import (
+    JIRA_CACHE,
+    _brief_cache_key,
+    _detail_cache_key,
+    _invalidate_for_new_issue,
+    _invalidate_issue,
+    _is_relay_issue,
+    _transform_list_issue,
+    get_project_key,
+)
+
+logger = logging.getLogger(__name__)
+
+# Shared secret configured on the Jira webhook
+WEBHOOK_SECRET = os.getenv("JIRA_WEBHOOK_SECRET", "")
+# How long processed deliveries are remembered
+WEBHOOK_MEMORY_SECONDS = int(os.getenv("JIRA_WEBHOOK_MEMORY_SECONDS", "86400"))
+# Optional JSON Lines file that received payloads are appended to, for replay
+WEBHOOK_RECORD_PATH = os.getenv("JIRA_WEBHOOK_RECORD_PATH", "")
+_record_lock = threading.Lock()
+
+ISSUE_EVENTS = ("jira:issue_created", "jira:issue_updated", "jira:issue_deleted")
+COMMENT_EVENTS = ("comment_created", "comment_updated", "comment_deleted")
+
+# X-Hub-Signature methods Jira may use
+_SIGNATURE_ALGORITHMS = {"sha256": hashlib.sha256, "sha1": hashlib.sha1}
+
+# Changelog field names -> list row fields used by _invalidate_issue
+_CHANGELOG_FIELDS = {
+    "summary": "summary",
+    "status": "status",
+    "priority": "priority",
+    "issuetype": "type",
+    "description": "description",
+    "labels": "labels",
+    "reporter": "reporter",
+    "assignee": "assignee",
+}
+
+
+# Header carrying the secret itself, for webhook senders that cannot sign
+TOKEN_HEADER = "X-Relay-Webhook-Secret"
+
+
+class WebhookAuthError(Exception):
+    """Raised when a webhook request does not carry the shared secret."""
+
+
+def verify_request(body: bytes, signature: Optional[str], token: Optional[str]) -> None:
+    """
+    Check a webhook request against JIRA_WEBHOOK_SECRET.
+
+    Accepts either an HMAC signature of the body (Jira's X-Hub-Signature
+    header, "sha256=<hex>") or the secret itself in the TOKEN_HEADER
+    header, for webhook senders that cannot sign. The secret is never read
+    from the URL, which ends up in access logs.
+
+    Raises:
+        WebhookAuthError: If no secret is configured or neither check passes
+    """
+    if not WEBHOOK_SECRET:
+        raise WebhookAuthError("Jira webhooks are not configured")
+
+    if signature:
+        method, _, digest = signature.partition("=")
+        algorithm = _SIGNATURE_ALGORITHMS.get(method.lower())
+        if algorithm is not None:
+            expected = hmac.new(WEBHOOK_SECRET.encode(), body, algorithm).hexdigest()
+            if hmac.compare_digest(expected, digest):
+                return
+
+    if token and hmac.compare_digest(token.encode(), WEBHOOK_SECRET.encode()):
+        return
+
+    raise WebhookAuthError("Invalid webhook signature")
+
+
+def sign(body: bytes, secret: str = "") -> str:
+    """X-Hub-Signature value for a body, as Jira computes it."""
+    digest = hmac.new((secret or WEBHOOK_SECRET).encode(), body, hashlib.sha256).hexdigest()
+    return f"sha256={digest}"
+
+
+def record_delivery(headers: dict, body: bytes) -> None:
+    """Append a received webhook to JIRA_WEBHOOK_RECORD_PATH for later replay."""
+    if not WEBHOOK_RECORD_PATH:
+        return
+    try:
+        record = {"headers": headers, "body": json.loads(body or b"null")}
+    except ValueError:
+        return
+    with _record_lock, open(WEBHOOK_RECORD_PATH, "a") as f:
+        f.write(json.dumps(record) + "\n")
+
+
+def _event_time(payload: dict) -> float:
+    """Epoch seconds the event happened, from its timestamp or the issue's `updated`."""
+    if payload.get("timestamp"):
+        return float(payload["timestamp"]) / 1000
+    fields = (payload.get("issue") or {}).get("fields") or {}
+    return issue_mirror.parse_timestamp(fields.get("updated")) or time.time()
+
+
+def _list_changes(payload: dict, row: dict) -> dict:
+    """New values of the list row fields an issue_updated event changed."""
+    fields = (payload.get("issue") or {}).get("fields") or {}
+    values = {
+        "summary": row.get("summary"),
+        "status": row.get("status"),
+        "priority": row.get("priority"),
+        "type": row.get("type"),
+        "description": issue_mirror.plain_text(fields.get("description")),
+        "labels": fields.get("labels") or [],
+        "reporter": (row.get("reporter") or {}).get("email"),
+        "assignee": (row.get("assignee") or {}).get("email"),
+    }
+    changes = {}
+    for item in (payload.get("changelog") or {}).get("items", []):
+        name = _CHANGELOG_FIELDS.get((item.get("field") or "").lower())
+        if name:
+            changes[name] = values[name]
+    return changes
+
+
+def _already_processed(delivery_id: str) -> bool:
+    """Check whether a delivery was processed within WEBHOOK_MEMORY_SECONDS."""
+    row = get_connection().execute(
+        "SELECT 1 FROM webhook_deliveries WHERE delivery_id = ? AND processed_at >= ?",
+        (delivery_id, time.time() - WEBHOOK_MEMORY_SECONDS),
+    ).fetchone()
+    return row is not None
+
+
+def _mark_processed(delivery_id: str) -> None:
+    """Record a processed delivery, forgetting those Jira no longer retries."""
+    now = time.time()
+    conn = get_connection()
+    conn.execute(
+        "INSERT OR REPLACE INTO webhook_deliveries (delivery_id, processed_at) VALUES (?, ?)",
+        (delivery_id, now),
+    )
+    conn.execute("DELETE FROM webhook_deliveries WHERE processed_at < ?", (now - WEBHOOK_MEMORY_SECONDS,))
+    conn.commit()
+
+
+def _claim_issue_event(issue_key: str, event_time: float) -> bool:
+    """
+    Record an event as the latest applied to an issue.
+
+    Returns:
+        False (and records nothing) if a later event was already applied
+    """
+    conn = get_connection()
+    cursor = conn.execute(
+        "INSERT INTO webhook_issue_events (issue_key, event_time) VALUES (?, ?) "
+        "ON CONFLICT(issue_key) DO UPDATE SET event_time = excluded.event_time "
+        "WHERE excluded.event_time >= webhook_issue_events.event_time",
+        (issue_key, event_time),
+    )
+    conn.commit()
+    return cursor.rowcount > 0
+
+
+def _cached_row_is_newer(issue_key: str, row: dict) -> bool:
+    """Check whether the cached list row of an issue is newer than row."""
+    cached = JIRA_CACHE.get(_brief_cache_key(issue_key))
+    cached_ts = issue_mirror.parse_timestamp((cached or {}).get("updated"))
+    row_ts = issue_mirror.parse_timestamp(row.get("updated"))
+    return cached_ts is not None and row_ts is not None and cached_ts > row_ts
+
+
+def handle_event(payload: dict, delivery_id: Optional[str] = None) -> dict:
+    """
+    Apply one Jira webhook event to the caches and the issue mirror.
+
+    Args:
+        payload: The webhook JSON body
+        delivery_id: Unique id of the delivery (retries of a delivery share it)
+
+    Returns:
+        Dict with status ("applied", "duplicate", "stale", "ignored" or
+        "removed"), event and issue key
+    """
+    event = payload.get("webhookEvent") or ""
+    issue = payload.get("issue") or {}
+    issue_key = (issue.get("key") or "").upper()
+    result = {"event": event, "key": issue_key or None}
+
+    if event not in ISSUE_EVENTS + COMMENT_EVENTS or not issue_key:
+        return {**result, "status": "ignored"}
+
+    if delivery_id and _already_processed(delivery_id):
+        return {**result, "status": "duplicate"}
+
+    if event in COMMENT_EVENTS:
+        status = _apply_comment_event(event, issue_key, payload)
+    else:
+        status = _apply_issue_event(event, issue_key, issue, payload)
+
+    if delivery_id:
+        _mark_processed(delivery_id)
+    logger.info(f"Webhook {event} for {issue_key}: {status}")
+    return {**result, "status": status}
+
+
+def _apply_issue_event(event: str, issue_key: str, issue: dict, payload: dict) -> str:
+    """Apply an issue created/updated/deleted event."""
+    event_time = _event_time(payload)
+
+    tombstoned_at = issue_mirror.tombstoned_at(issue_key) if issue_mirror.MIRROR_READS else None
+    if event != "jira:issue_deleted" and tombstoned_at is not None and event_time < tombstoned_at:
+        return "stale"
+    # Skip events older than one already applied to this issue
+    if not _claim_issue_event(issue_key, event_time):
+        return "stale"
+
+    # Webhooks arrive in bursts; list views are refetched when next read
+    # rather than warmed after every event
+    if event == "jira:issue_deleted":
+        if issue_mirror.MIRROR_READS:
+            issue_mirror.tombstone_issues({issue_key: "deleted"}, event_time)
+        _invalidate_issue(issue_key, sync_mirror=False, warm=False)
+        return "applied"
+
+    if not _is_relay_issue(issue):
+        # Moved to another project or no longer marked as a Relay issue
+        if issue_mirror.MIRROR_READS:
+            project = ((issue.get("fields") or {}).get("project") or {}).get("key")
+            moved = project and project.upper() != get_project_key().upper()
+            issue_mirror.tombstone_issues({issue_key: "moved" if moved else "unlabeled"}, event_time)
+        _invalidate_issue(issue_key, sync_mirror=False, warm=False)
+        return "removed"
+
+    row = _transform_list_issue(issue)
+    # The mirror row or cached row may already come from a newer read of the issue
+    if issue_mirror.MIRROR_READS and not issue_mirror.upsert_issues([issue]):
+        return "stale"
+    if _cached_row_is_newer(issue_key, row):
+        return "stale"
+    if event == "jira:issue_created":
+        fields = issue.get("fields") or {}
+        _invalidate_for_new_issue({
+            "status": row.get("status"),
+            "type": row.get("type"),
+            "priority": row.get("priority"),
+            "reporter": (row.get("reporter") or {}).get("email"),
+            "summary": row.get("summary"),
+            "description": issue_mirror.plain_text(fields.get("description")),
+            "labels": fields.get("labels") or [],
+        }, warm=False)
+    else:
+        _invalidate_issue(issue_key, _list_changes(payload, row), sync_mirror=False, warm=False)
+
+    # The payload holds the whole issue, so its list row is known without a fetch
+    JIRA_CACHE.set(_brief_cache_key(issue_key), row)
+    return "applied"
+
+
+def _apply_comment_event(event: str, issue_key: str, payload: dict) -> str:
+    """Apply a comment created/updated/deleted event."""
+    # The cached detail carries the comments
+    JIRA_CACHE.delete(_detail_cache_key(issue_key))
+
+    # Edits and deletions reach the search index with the next sync, which
+    # sees the issue's new `updated` time
+    comment = payload.get("comment") or {}
+    if event == "comment_created" and issue_mirror.MIRROR_READS:
+        text = issue_mirror.plain_text(comment.get("body"))
+        if text:
+            issue_mirror.add_comment_text(issue_key, text)
+    return "applied"
@@ -0,0 +1,150 @@
+"""Retry classification and delays for upstream API calls.
+
+Sorts failures into three kinds:
+
+- transient: the upstream did not process the request (connection refused,
+  connect timeout, 429, 503), so any call can be retried safely
+- ambiguous: the request may have been processed (read timeout, dropped
+  connection, 500/502/504), so only idempotent calls are retried blindly;
+  writes must first check whether they already took effect
+- permanent: retrying cannot help (other 4xx, local errors)
+
+Delays use full jitter so workers do not retry in lockstep, and honor the
+upstream's Retry-After header when it sends one.
+"""
+
+import time
+import random
+from typing import Optional
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+import requests
+from urllib3.exceptions import ConnectTimeoutError, MaxRetryError, NewConnectionError
+
+from .circuit_breaker import CircuitOpenError
+
+TRANSIENT = "transient"
+AMBIGUOUS = "ambiguous"
+PERMANENT = "permanent"
+
+# The upstream rejected these without doing any work
+_REJECTED_STATUSES = {429, 503}
+# The upstream (or a gateway in front of it) may have done the work
+_AMBIGUOUS_STATUSES = {500, 502, 504}
+
+
+def _status_code(error: Exception) -> Optional[int]:
+    response = getattr(error, "response", None)
+    return getattr(response, "status_code", None)
+
+
+def _failed_to_connect(error: Exception) -> bool:
+    """
+    Check a requests ConnectionError happened while connecting.
+
+    requests wraps refused connections and DNS failures as
+    ConnectionError(MaxRetryError(reason=NewConnectionError)); nothing was
+    sent in that case, unlike a connection dropped while reading.
+    """
+    reason = error.args[0] if error.args else None
+    if isinstance(reason, MaxRetryError):
+        reason = reason.reason
+    return isinstance(reason, (NewConnectionError, ConnectTimeoutError))
+
+
+def classify_error(error: Exception) -> str:
+    """
+    Classify a failed call as TRANSIENT, AMBIGUOUS or PERMANENT.
+
+    Args:
+        error: Exception raised by the call
+
+    Returns:
+        One of TRANSIENT, AMBIGUOUS, PERMANENT
+    """
+    if isinstance(error, CircuitOpenError):
+        return PERMANENT
+
+    # Never connected, so nothing was sent
+    if isinstance(error, requests.exceptions.ConnectTimeout):
+        return TRANSIENT
+    if isinstance(error, requests.exceptions.ConnectionError) and _failed_to_connect(error):
+        return TRANSIENT
+
+    # Sent (or possibly sent) but no complete response
+    if isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout)):
+        return AMBIGUOUS
+
+    if isinstance(error, requests.exceptions.HTTPError):
+        status = _status_code(error)
+        if status is None or status in _AMBIGUOUS_STATUSES:
+            return AMBIGUOUS
+        if status in _REJECTED_STATUSES:
+            return TRANSIENT
+
+    return PERMANENT
+
+
+def retry_after_seconds(error: Exception) -> Optional[float]:
+    """Read the Retry-After header of a failed response, in seconds."""
+    response = getattr(error, "response", None)
+    value = response.headers.get("Retry-After") if response is not None else None
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def retry_delay(
+    error: Exception,
+    attempt: int,
+    base_delay: float = 1.0,
+    max_delay: float = 10.0,
+) -> float:
+    """
+    Seconds to wait before retrying a failed call.
+
+    Uses Retry-After when present (plus a little jitter), otherwise full
+    jitter: a random delay between 0 and the exponential backoff.
+
+    Args:
+        error: Exception raised by the failed attempt
+        attempt: Zero-based number of the failed attempt
+        base_delay: Backoff for the first retry
+        max_delay: Upper bound for the exponential backoff
+    """
+    retry_after = retry_after_seconds(error)
+    if retry_after is not None:
+        return retry_after + random.uniform(0, base_delay)
+    return random.uniform(0, min(max_delay, base_delay * (2 ** attempt)))
+
+
+class RetryBudget:
+    """
+    Total time allowed for one call including all its retries.
+
+    Args:
+        seconds: Time budget, starting now
+    """
+
+    def __init__(self, seconds: float):
+        self.deadline = time.monotonic() + seconds
+
+    def remaining(self) -> float:
+        return max(0.0, self.deadline - time.monotonic())
+
+    def allows(self, delay: float) -> bool:
+        """Check a retry after `delay` seconds would still start in budget."""
+        return delay < self.remaining()
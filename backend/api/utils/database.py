@@ -243,6 +243,22 @@ def log_activity(user_id: str, action: str, jira_issue_key: str = None, metadata
     conn.commit()
 
 
+def get_recently_active_emails(days: int = 7, limit: int = 10) -> list:
+    """Get emails of the users with the most recent activity."""
+    conn = get_connection()
+    results = conn.execute(
+        """SELECT ur.email FROM activity_log al
+           JOIN user_roles ur ON al.user_id = ur.user_id
+           WHERE al.created_at >= datetime('now', ?)
+           GROUP BY ur.email
+           ORDER BY MAX(al.created_at) DESC
+           LIMIT ?""",
+        (f"-{days} days", limit)
+    ).fetchall()
+
+    return [r[0] for r in results]
+
+
 # ============================================
 # Email Whitelist Functions
 # ============================================
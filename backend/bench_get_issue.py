@@ -0,0 +1,104 @@
+"""
+Benchmark issue detail latency against the local Jira stand-in.
+
+Compares the original detail fetch (every field plus the full changelog, then
+a separate comments request) with the current `_fetch_issue_detail`,
+bypassing the cache so every iteration hits the stand-in. Prints p50/p95
+latency, Jira requests and response bytes per call.
+
+Usage:
+    python bench_get_issue.py --iterations 200 --latency-ms 80
+"""
+
+import os
+import sys
+import time
+import argparse
+import statistics
+
+# Add parent directory to path so we can import api
+parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if parent_dir not in sys.path:
+    sys.path.append(parent_dir)
+backend_dir = os.path.dirname(os.path.abspath(__file__))
+if backend_dir not in sys.path:
+    sys.path.append(backend_dir)
+
+from jira_standin import JiraStandIn
+
+
+def percentile(samples: list, pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def run(label: str, func, keys: list, iterations: int, standin: JiraStandIn) -> dict:
+    # One untimed pass to open pooled connections and learn changelog lengths
+    for key in keys:
+        func(key)
+    standin.reset_counters()
+
+    samples = []
+    for i in range(iterations):
+        started = time.perf_counter()
+        func(keys[i % len(keys)])
+        samples.append((time.perf_counter() - started) * 1000)
+
+    result = {
+        "label": label,
+        "p50": percentile(samples, 50),
+        "p95": percentile(samples, 95),
+        "mean": statistics.mean(samples),
+        "requests": sum(standin.requests.values()) / iterations,
+        "kb": standin.bytes_sent / iterations / 1024,
+    }
+    print(
+        f"{label:<12} p50 {result['p50']:7.1f}ms  p95 {result['p95']:7.1f}ms  "
+        f"mean {result['mean']:7.1f}ms  {result['requests']:.1f} Jira requests/call  "
+        f"{result['kb']:.1f} KB/call"
+    )
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark get_issue against a Jira stand-in")
+    parser.add_argument("--iterations", type=int, default=100)
+    parser.add_argument("--latency-ms", type=float, default=80)
+    parser.add_argument("--issues", type=int, default=50)
+    parser.add_argument("--histories", type=int, default=200, help="Changelog entries per issue")
+    args = parser.parse_args()
+
+    standin = JiraStandIn(issues=args.issues, histories=args.histories, latency_ms=args.latency_ms)
+    url = standin.start()
+    os.environ.update({
+        "JIRA_URL": url,
+        "JIRA_EMAIL": "bench@example.com",
+        "JIRA_API_TOKEN": "bench",
+        "JIRA_PROJECT_KEY": standin.project,
+    })
+
+    from api.services import jira_service
+
+    def sequential(issue_key):
+        # Original detail fetch: all fields and changelog, then comments
+        jira = jira_service.get_jira_client()
+        jira_service._retry_with_backoff(lambda: jira.issue(issue_key, expand="changelog"))
+        jira_service._retry_with_backoff(lambda: jira.issue_get_comments(issue_key))
+
+    keys = list(standin.issues)
+    print(f"Jira stand-in at {url}, {args.latency_ms:.0f}ms latency, {args.iterations} iterations\n")
+    try:
+        before = run("sequential", sequential, keys, args.iterations, standin)
+        after = run("current", jira_service._fetch_issue_detail, keys, args.iterations, standin)
+    finally:
+        standin.stop()
+
+    print(
+        f"\np50 {before['p50'] / after['p50']:.2f}x faster, "
+        f"p95 {before['p95'] / after['p95']:.2f}x faster"
+    )
+
+
+if __name__ == "__main__":
+    main()
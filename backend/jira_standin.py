@@ -0,0 +1,536 @@
+"""
+Local Jira Cloud stand-in for benchmarks and manual testing.
+
+Serves an in-memory project over the subset of the Jira REST API that the
+backend uses, with a fixed per-request latency to approximate a real Jira
+round trip. Point JIRA_URL at it to run the backend without Jira Cloud.
+
+Usage:
+    python jira_standin.py --port 8765 --latency-ms 80 --issues 200
+"""
+
+import re
+import json
+import time
+import random
+import argparse
+import threading
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+from urllib.parse import urlparse, parse_qs
+
+STATUSES = ["Open", "To Do", "In Progress", "Done"]
+PRIORITIES = ["Highest", "High", "Medium", "Low", "Lowest"]
+ISSUE_TYPES = ["Bug", "Task", "Story"]
+TRANSITIONS = [
+    {"id": "11", "name": "To Do", "to": {"name": "To Do"}},
+    {"id": "21", "name": "In Progress", "to": {"name": "In Progress"}},
+    {"id": "31", "name": "Done", "to": {"name": "Done"}},
+    {"id": "41", "name": "Cancel", "to": {"name": "Cancelled"}},
+]
+
+
+def _timestamp(dt: datetime) -> str:
+    return dt.strftime("%Y-%m-%dT%H:%M:%S.000+0000")
+
+
+def _key_number(key: str) -> int:
+    return int(key.rsplit("-", 1)[1])
+
+
+def _user(i: int) -> dict:
+    return {
+        "accountId": f"acc-{i}",
+        "emailAddress": f"user{i}@example.com",
+        "displayName": f"User {i}",
+        "avatarUrls": {"48x48": f"https://avatar.example.com/{i}.png"},
+    }
+
+
+class JiraStandIn:
+    """
+    In-memory Jira project served over HTTP on a background thread.
+
+    Args:
+        issues: Number of issues to generate
+        comments: Comments per issue
+        histories: Changelog entries per issue
+        latency_ms: Delay added to every request
+        project: Project key
+    """
+
+    def __init__(
+        self,
+        issues: int = 50,
+        comments: int = 5,
+        histories: int = 20,
+        latency_ms: float = 50,
+        project: str = "RELAY",
+    ):
+        self.project = project
+        self.latency = latency_ms / 1000.0
+        self.lock = threading.Lock()
+        self.requests: dict = {}
+        self.bytes_sent = 0
+        self.faults: dict = {}
+        self.page_tokens: dict = {}  # { opaque nextPageToken: row offset }
+        self.bulk_enabled = True  # False answers the bulk endpoints with 404
+        self.bulk_tasks: dict = {}
+        self.issues: dict = {}
+        self._server = None
+        self._thread = None
+
+        rng = random.Random(42)
+        base = datetime.now(timezone.utc) - timedelta(days=30)
+        for n in range(1, issues + 1):
+            created = base + timedelta(minutes=n)
+            self.issues[f"{project}-{n}"] = {
+                "id": str(10000 + n),
+                "key": f"{project}-{n}",
+                "fields": {
+                    "summary": f"Issue {n}",
+                    "description": f"Description of issue {n}",
+                    "status": {"name": rng.choice(STATUSES)},
+                    "priority": {"name": rng.choice(PRIORITIES)},
+                    "issuetype": {"name": rng.choice(ISSUE_TYPES)},
+                    "reporter": _user(n % 7),
+                    "assignee": _user(n % 3) if n % 2 else None,
+                    "labels": ["relay"],
+                    "created": _timestamp(created),
+                    "updated": _timestamp(created + timedelta(hours=1)),
+                    "attachment": [],
+                    "comment": {
+                        "comments": [
+                            {
+                                "id": str(n * 100 + c),
+                                "author": _user(c),
+                                "body": f"Comment {c} on issue {n}",
+                                "created": _timestamp(created + timedelta(minutes=c)),
+                                "updated": _timestamp(created + timedelta(minutes=c)),
+                            }
+                            for c in range(comments)
+                        ],
+                    },
+                },
+                "changelog": {
+                    "histories": [
+                        {
+                            "id": str(n * 1000 + h),
+                            "author": _user(h),
+                            "created": _timestamp(created + timedelta(minutes=h)),
+                            "items": [{"field": "status", "fromString": "Open", "toString": "To Do"}],
+                        }
+                        for h in range(histories)
+                    ],
+                },
+            }
+
+    # ---- Server lifecycle ----
+
+    def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Start serving in a background thread and return the base URL."""
+        standin = self
+
+        class Handler(_Handler):
+            pass
+
+        Handler.standin = standin
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return f"http://{host}:{self._server.server_address[1]}"
+
+    def stop(self) -> None:
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def count(self, route: str) -> None:
+        with self.lock:
+            self.requests[route] = self.requests.get(route, 0) + 1
+
+    def inject_fault(
+        self,
+        route: str,
+        status: int,
+        times: int = 1,
+        apply: bool = False,
+        headers: Optional[dict] = None,
+    ) -> None:
+        """
+        Make the next requests to a route fail.
+
+        Args:
+            route: Route as counted in `requests`, e.g. "POST issue/comment"
+            status: HTTP status to answer with
+            times: Number of requests to fail
+            apply: Process the request first, like a gateway timing out after
+                the upstream did the work
+            headers: Extra response headers, e.g. {"Retry-After": "1"}
+        """
+        with self.lock:
+            self.faults.setdefault(route, []).extend(
+                [{"status": status, "apply": apply, "headers": headers or {}}] * times
+            )
+
+    def take_fault(self, route: str) -> Optional[dict]:
+        with self.lock:
+            pending = self.faults.get(route)
+            return pending.pop(0) if pending else None
+
+    def reset_counters(self) -> None:
+        with self.lock:
+            self.requests.clear()
+            self.bytes_sent = 0
+
+    def record_change(self, issue: dict, field: str, old, new) -> None:
+        """Update an issue field and append the change to its changelog."""
+        now = datetime.now(timezone.utc)
+        with self.lock:
+            histories = issue["changelog"]["histories"]
+            histories.append({
+                "id": str(int(issue["id"]) * 1000 + len(histories)),
+                "author": _user(0),
+                "created": _timestamp(now),
+                "items": [{"field": field, "fromString": old, "toString": new}],
+            })
+            issue["fields"]["updated"] = _timestamp(now)
+
+    # ---- Payload helpers ----
+
+    def issue_payload(self, key: str, fields: str = "*all", expand: str = "") -> dict:
+        issue = self.issues[key]
+        wanted = [f.strip() for f in (fields or "*all").split(",") if f.strip()]
+        if "*all" in wanted or "*navigable" in wanted:
+            out_fields = dict(issue["fields"])
+        else:
+            out_fields = {f: issue["fields"].get(f) for f in wanted}
+        if "comment" in out_fields:
+            comments = issue["fields"]["comment"]["comments"]
+            out_fields["comment"] = {
+                "comments": comments,
+                "maxResults": len(comments),
+                "total": len(comments),
+                "startAt": 0,
+            }
+        payload = {"id": issue["id"], "key": key, "fields": out_fields}
+        if "changelog" in (expand or ""):
+            histories = issue["changelog"]["histories"]
+            payload["changelog"] = {
+                "startAt": 0,
+                "maxResults": len(histories),
+                "total": len(histories),
+                "histories": histories,
+            }
+        return payload
+
+    def create(self, fields: dict) -> dict:
+        """Create an issue from create_issue fields."""
+        with self.lock:
+            n = len(self.issues) + 1
+            key = f"{self.project}-{n}"
+            now = _timestamp(datetime.now(timezone.utc))
+            self.issues[key] = {
+                "id": str(10000 + n),
+                "key": key,
+                "fields": {
+                    "summary": fields.get("summary"),
+                    "description": fields.get("description"),
+                    "status": {"name": "Open"},
+                    "priority": fields.get("priority"),
+                    "issuetype": fields.get("issuetype"),
+                    "reporter": _user(0),
+                    "assignee": None,
+                    "labels": fields.get("labels", []),
+                    "created": now,
+                    "updated": now,
+                    "attachment": [],
+                    "comment": {"comments": []},
+                },
+                "changelog": {"histories": []},
+            }
+        return {"id": str(10000 + n), "key": key, "self": f"/rest/api/2/issue/{10000 + n}"}
+
+    def page_token(self, offset: int) -> str:
+        """Issue an opaque search cursor for a row offset."""
+        token = f"{random.getrandbits(64):016x}"
+        with self.lock:
+            self.page_tokens[token] = offset
+        return token
+
+    def apply_transition(self, issue: dict, transition_id: str) -> Optional[str]:
+        """Apply a transition to an issue. Returns an error message if it is invalid."""
+        with self.lock:
+            current = issue["fields"]["status"]["name"]
+            # Like Jira, an issue has no transition to its own status
+            match = next(
+                (t for t in TRANSITIONS if t["id"] == str(transition_id) and t["to"]["name"] != current),
+                None,
+            )
+            if match is None:
+                return "Invalid transition"
+            issue["fields"]["status"] = {"name": match["to"]["name"]}
+        self.record_change(issue, "status", current, match["to"]["name"])
+        return None
+
+    def submit_bulk_transition(self, inputs: list) -> str:
+        """Queue a bulk transition task and run it on a background thread."""
+        with self.lock:
+            task_id = str(20000 + len(self.bulk_tasks))
+            task = {
+                "taskId": task_id,
+                "status": "ENQUEUED",
+                "progressPercent": 0,
+                "processedAccessibleIssues": [],
+                "failedAccessibleIssues": {},
+                "invalidOrInaccessibleIssueCount": 0,
+                "totalIssueCount": sum(len(i.get("selectedIssueIdsOrKeys", [])) for i in inputs),
+            }
+            self.bulk_tasks[task_id] = task
+
+        def _run():
+            time.sleep(self.latency * 2)
+            task["status"] = "RUNNING"
+            done = 0
+            for group in inputs:
+                for key in group.get("selectedIssueIdsOrKeys", []):
+                    issue = self.issues.get(key) or next(
+                        (i for i in self.issues.values() if i["id"] == str(key)), None
+                    )
+                    done += 1
+                    if issue is None:
+                        task["invalidOrInaccessibleIssueCount"] += 1
+                        continue
+                    error = self.apply_transition(issue, group.get("transitionId"))
+                    if error:
+                        task["failedAccessibleIssues"][issue["id"]] = [error]
+                    else:
+                        task["processedAccessibleIssues"].append(int(issue["id"]))
+                    task["progressPercent"] = int(100 * done / max(1, task["totalIssueCount"]))
+            time.sleep(self.latency)
+            task["status"] = "COMPLETE"
+
+        threading.Thread(target=_run, daemon=True).start()
+        return task_id
+
+    def unknown_keys(self, jql: str) -> list:
+        """Keys named in a `key in (...)` clause that do not exist."""
+        match = re.search(r"key\s+in\s*\(([^)]*)\)", jql or "", re.IGNORECASE)
+        if not match:
+            return []
+        named = [k.strip().strip('"') for k in match.group(1).split(",")]
+        return [k for k in named if k not in self.issues]
+
+    def search(self, jql: str) -> list:
+        keys = list(self.issues)
+        match = re.search(r"key\s+in\s*\(([^)]*)\)", jql or "", re.IGNORECASE)
+        if match:
+            wanted = {k.strip().strip('"') for k in match.group(1).split(",")}
+            keys = [k for k in keys if k in wanted]
+        # Correlation label lookups (the only label filter that is honored)
+        for label in re.findall(r'labels\s*=\s*"(relay-req-[^"]+)"', jql or ""):
+            keys = [k for k in keys if label in self.issues[k]["fields"].get("labels", [])]
+        # Relative update windows, e.g. updated >= "-15m"
+        match = re.search(r'updated\s*>=\s*"-(\d+)m"', jql or "")
+        if match:
+            since = _timestamp(datetime.now(timezone.utc) - timedelta(minutes=int(match.group(1))))
+            keys = [k for k in keys if self.issues[k]["fields"]["updated"] >= since]
+        # Key ranges within the project, e.g. key > "RELAY-120"
+        match = re.search(r'key\s*>\s*"?[A-Z]+-(\d+)"?', jql or "")
+        if match:
+            keys = [k for k in keys if _key_number(k) > int(match.group(1))]
+
+        order = re.search(r"ORDER BY\s+(\w+)(?:\s+(ASC|DESC))?", jql or "", re.IGNORECASE)
+        if order:
+            field, direction = order.group(1).lower(), (order.group(2) or "ASC").upper()
+        else:
+            field, direction = "created", "DESC"
+        if field == "key":
+            sort_key = _key_number
+        else:
+            sort_key = lambda k: self.issues[k]["fields"].get(field) or ""
+        return sorted(keys, key=sort_key, reverse=direction == "DESC")
+
+
+class _Handler(BaseHTTPRequestHandler):
+    standin: JiraStandIn = None
+    protocol_version = "HTTP/1.1"
+    # Send each response in one segment so delayed ACKs do not add latency
+    disable_nagle_algorithm = True
+    wbufsize = -1
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status: int, body=None) -> None:
+        fault, self._fault = getattr(self, "_fault", None), None
+        if fault:
+            status, body = fault["status"], {"errorMessages": [f"Injected {fault['status']}"]}
+        data = json.dumps(body).encode() if body is not None else b""
+        self.send_response(status)
+        for name, value in (fault or {}).get("headers", {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+        with self.standin.lock:
+            self.standin.bytes_sent += len(data)
+
+    def _read_body(self) -> dict:
+        length = int(self.headers.get("Content-Length") or 0)
+        return json.loads(self.rfile.read(length) or b"{}") if length else {}
+
+    def _dispatch(self, method: str) -> None:
+        standin = self.standin
+        # Always drain the body so the keep-alive connection stays in sync
+        body = self._read_body()
+        time.sleep(standin.latency)
+
+        url = urlparse(self.path)
+        query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+        path = re.sub(r"^/rest/api/[23]/", "", url.path)
+        route_path = re.sub(r"^issue/[A-Z]+-[0-9]+", "issue", path)
+        route_path = re.sub(r"^bulk/queue/[0-9]+", "bulk/queue", route_path)
+        route = f"{method} {route_path}"
+        standin.count(route)
+
+        self._fault = standin.take_fault(route)
+        if self._fault and not self._fault["apply"]:
+            return self._send(self._fault["status"])
+
+        if path == "issue" and method == "POST":
+            return self._send(201, standin.create(body.get("fields", {})))
+
+        match = re.fullmatch(r"issue/([A-Z]+-\d+)(?:/(comment|transitions|changelog))?", path)
+        if match:
+            key, sub = match.groups()
+            if key not in standin.issues:
+                return self._send(404, {"errorMessages": ["Issue does not exist"]})
+            issue = standin.issues[key]
+            if sub == "comment":
+                comments = issue["fields"]["comment"]["comments"]
+                if method == "POST":
+                    now = _timestamp(datetime.now(timezone.utc))
+                    comment = {
+                        "id": str(int(issue["id"]) * 100 + len(comments)),
+                        "author": _user(0),
+                        "body": body.get("body"),
+                        "created": now,
+                        "updated": now,
+                    }
+                    with standin.lock:
+                        comments.append(comment)
+                        issue["fields"]["updated"] = now
+                    return self._send(201, comment)
+                return self._send(200, {
+                    "comments": comments, "total": len(comments),
+                    "startAt": 0, "maxResults": len(comments),
+                })
+            if sub == "changelog":
+                histories = issue["changelog"]["histories"]
+                start = int(query.get("startAt") or 0)
+                limit = int(query.get("maxResults") or 100)
+                values = histories[start:start + limit]
+                return self._send(200, {
+                    "values": values, "startAt": start, "maxResults": limit,
+                    "total": len(histories), "isLast": start + len(values) >= len(histories),
+                })
+            if sub == "transitions":
+                # Like Jira, an issue has no transition to its own status
+                current = issue["fields"]["status"]["name"]
+                available = [t for t in TRANSITIONS if t["to"]["name"] != current]
+                if method == "POST":
+                    error = standin.apply_transition(issue, body.get("transition", {}).get("id"))
+                    if error:
+                        return self._send(400, {"errorMessages": [error]})
+                    return self._send(204)
+                return self._send(200, {"transitions": available})
+            if method == "PUT":
+                for name, value in body.get("fields", {}).items():
+                    old = issue["fields"].get(name)
+                    issue["fields"][name] = value
+                    standin.record_change(issue, name, str(old), str(value))
+                for op in body.get("update", {}).get("labels", []):
+                    labels = issue["fields"].setdefault("labels", [])
+                    if "add" in op and op["add"] not in labels:
+                        labels.append(op["add"])
+                    if "remove" in op and op["remove"] in labels:
+                        labels.remove(op["remove"])
+                return self._send(204)
+            return self._send(200, standin.issue_payload(
+                key, query.get("fields", "*all"), query.get("expand", "")
+            ))
+
+        if path == "search/jql":
+            # Like Jira Cloud: cursor pagination only, no startAt and no total
+            unknown = standin.unknown_keys(query.get("jql", ""))
+            if unknown:
+                return self._send(400, {"errorMessages": [
+                    f"An issue with key '{unknown[0]}' does not exist for field 'key'."
+                ]})
+            keys = standin.search(query.get("jql", ""))
+            token = query.get("nextPageToken")
+            start = standin.page_tokens.get(token) if token else 0
+            if start is None:
+                return self._send(400, {"errorMessages": ["Invalid nextPageToken"]})
+            limit = min(int(query.get("maxResults") or 50), 100)
+            page = keys[start:start + limit]
+            body = {
+                "issues": [standin.issue_payload(k, query.get("fields", "*navigable")) for k in page],
+                "isLast": start + limit >= len(keys),
+            }
+            if start + limit < len(keys):
+                body["nextPageToken"] = standin.page_token(start + limit)
+            return self._send(200, body)
+
+        if path.startswith("bulk/") and not standin.bulk_enabled:
+            return self._send(404, {"errorMessages": ["Not found"]})
+        if path == "bulk/issues/transition" and method == "POST":
+            task_id = standin.submit_bulk_transition(body.get("bulkTransitionInputs", []))
+            return self._send(201, {"taskId": task_id})
+        match = re.fullmatch(r"bulk/queue/(\d+)", path)
+        if match:
+            task = standin.bulk_tasks.get(match.group(1))
+            if task is None:
+                return self._send(404, {"errorMessages": ["Task not found"]})
+            return self._send(200, dict(task))
+
+        if path == "search/approximate-count" and method == "POST":
+            return self._send(200, {"count": len(standin.search(body.get("jql", "")))})
+
+        return self._send(404, {"errorMessages": [f"No stand-in route for {method} {url.path}"]})
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def do_PUT(self):
+        self._dispatch("PUT")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a local Jira Cloud stand-in")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--issues", type=int, default=200)
+    parser.add_argument("--latency-ms", type=float, default=80)
+    args = parser.parse_args()
+
+    standin = JiraStandIn(issues=args.issues, latency_ms=args.latency_ms)
+    url = standin.start(port=args.port)
+    print(f"Jira stand-in serving {args.issues} issues at {url} ({args.latency_ms:.0f}ms latency)")
+    print("Set JIRA_URL to this address to point the backend at it. Ctrl+C to stop.")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        standin.stop()
+
+
+if __name__ == "__main__":
+    main()
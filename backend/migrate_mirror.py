@@ -0,0 +1,55 @@
+import os
+import sys
+from dotenv import load_dotenv
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from api.utils.database import get_connection, init_database
+
+
+def migrate():
+    # Load .env from backend folder
+    env_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.env')
+    load_dotenv(dotenv_path=env_path)
+
+    # Imported after load_dotenv so the Jira settings are picked up
+    from api.services.issue_mirror import recount_counters, refresh_tools
+    from api.services.jira_sync import run_backfill
+
+    print("⌛ Connecting to Turso and creating the issue mirror tables...")
+    conn = get_connection()
+    try:
+        # Mirrors created before facet counts lack the tools column
+        conn.execute("ALTER TABLE issues_mirror ADD COLUMN tools TEXT DEFAULT '[]'")
+        conn.commit()
+        added_tools = True
+    except Exception:
+        # No mirror yet, or the column already exists
+        added_tools = False
+    init_database()
+
+    # Stored tool matches also go stale when the matching rules change
+    refreshed = refresh_tools()
+    if added_tools:
+        print(f"✅ Added 'tools' column ({refreshed} issues updated).")
+    elif refreshed:
+        print(f"✅ Updated the tools of {refreshed} issues.")
+
+    print("🔍 Copying Relay issues from Jira...")
+    try:
+        result = run_backfill()
+    except Exception as e:
+        print(f"❌ Error loading issues (run again to resume): {e}")
+        return
+
+    # Counters start from the loaded rows; later writes keep them current
+    recount = recount_counters()
+    print(f"📊 Dashboard counters rebuilt from {recount['issues']} issues.")
+
+    print(f"✨ Issue mirror ready with {result['loaded']} issues.")
+    print("ℹ️ Run sync_worker.py to keep it current, and set JIRA_MIRROR_READS=true to serve lists from it.")
+
+
+if __name__ == "__main__":
+    migrate()
@@ -0,0 +1,227 @@
+"""
+Local Redis stand-in for testing the redis cache backend.
+
+Speaks enough of the Redis protocol (RESP2) for RedisCache: strings with
+millisecond expiry, sets, key expiry and SCAN. Data lives in memory and is
+lost on exit. Point JIRA_CACHE_URL at it to run the backend with
+JIRA_CACHE_BACKEND=redis without a Redis server.
+
+Usage:
+    python redis_standin.py --port 6380
+"""
+
+import time
+import fnmatch
+import argparse
+import threading
+from socketserver import StreamRequestHandler, ThreadingTCPServer
+from typing import Optional
+
+
+class RedisStandIn:
+    """
+    In-memory Redis-protocol server running on a background thread.
+
+    Args:
+        password: Require AUTH with this password (None accepts any client)
+    """
+
+    def __init__(self, password: Optional[str] = None):
+        self.password = password
+        self.lock = threading.Lock()
+        self.data: dict = {}  # { key: bytes or set }
+        self.expires: dict = {}  # { key: epoch seconds }
+        self.commands: dict = {}
+        self._server = None
+        self._thread = None
+
+    # ---- Server lifecycle ----
+
+    def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Start serving in a background thread and return a redis:// URL."""
+        standin = self
+
+        class Handler(_Handler):
+            pass
+
+        Handler.standin = standin
+        ThreadingTCPServer.allow_reuse_address = True
+        self._server = ThreadingTCPServer((host, port), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        auth = f":{self.password}@" if self.password else ""
+        return f"redis://{auth}{host}:{self._server.server_address[1]}"
+
+    def stop(self) -> None:
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    # ---- Keyspace ----
+
+    def _live(self, key: str):
+        """Value of a key, dropping it first if it has expired (lock held)."""
+        expires_at = self.expires.get(key)
+        if expires_at is not None and expires_at <= time.time():
+            self.data.pop(key, None)
+            self.expires.pop(key, None)
+        return self.data.get(key)
+
+    def execute(self, args: list):
+        """Run one command and return its reply (an Exception for errors)."""
+        name = args[0].decode().upper()
+        params = args[1:]
+        with self.lock:
+            self.commands[name] = self.commands.get(name, 0) + 1
+            handler = getattr(self, f"_cmd_{name.lower()}", None)
+            if handler is None:
+                return Exception(f"ERR unknown command '{name}'")
+            return handler(params)
+
+    def _cmd_ping(self, params):
+        return "PONG"
+
+    def _cmd_auth(self, params):
+        if self.password is not None and params[-1].decode() != self.password:
+            return Exception("WRONGPASS invalid username-password pair")
+        return "OK"
+
+    def _cmd_select(self, params):
+        return "OK"
+
+    def _cmd_get(self, params):
+        value = self._live(params[0].decode())
+        if isinstance(value, set):
+            return Exception("WRONGTYPE Operation against a key holding the wrong kind of value")
+        return value
+
+    def _cmd_mget(self, params):
+        values = [self._live(p.decode()) for p in params]
+        return [v if isinstance(v, bytes) else None for v in values]
+
+    def _cmd_set(self, params):
+        key = params[0].decode()
+        self.data[key] = params[1]
+        self.expires.pop(key, None)
+        options = [p.decode().upper() for p in params[2:]]
+        if "PX" in options:
+            self.expires[key] = time.time() + int(options[options.index("PX") + 1]) / 1000
+        elif "EX" in options:
+            self.expires[key] = time.time() + int(options[options.index("EX") + 1])
+        return "OK"
+
+    def _cmd_del(self, params):
+        removed = 0
+        for p in params:
+            key = p.decode()
+            if self._live(key) is not None:
+                removed += 1
+            self.data.pop(key, None)
+            self.expires.pop(key, None)
+        return removed
+
+    def _cmd_expire(self, params):
+        key = params[0].decode()
+        if self._live(key) is None:
+            return 0
+        self.expires[key] = time.time() + int(params[1])
+        return 1
+
+    def _cmd_pttl(self, params):
+        key = params[0].decode()
+        if self._live(key) is None:
+            return -2
+        if key not in self.expires:
+            return -1
+        return max(0, int((self.expires[key] - time.time()) * 1000))
+
+    def _cmd_sadd(self, params):
+        key = params[0].decode()
+        members = self._live(key)
+        if members is None:
+            members = self.data[key] = set()
+        added = len(set(params[1:]) - members)
+        members.update(params[1:])
+        return added
+
+    def _cmd_srem(self, params):
+        key = params[0].decode()
+        members = self._live(key) or set()
+        removed = len(members & set(params[1:]))
+        members.difference_update(params[1:])
+        if not members:
+            self.data.pop(key, None)
+            self.expires.pop(key, None)
+        return removed
+
+    def _cmd_smembers(self, params):
+        return sorted(self._live(params[0].decode()) or ())
+
+    def _cmd_scan(self, params):
+        # One pass returns every match, with cursor 0 to end the iteration
+        options = [p.decode() for p in params[1:]]
+        pattern = options[options.index("MATCH") + 1] if "MATCH" in options else "*"
+        keys = [k for k in list(self.data) if self._live(k) is not None and fnmatch.fnmatchcase(k, pattern)]
+        return [b"0", [k.encode() for k in keys]]
+
+
+class _Handler(StreamRequestHandler):
+    standin: RedisStandIn = None
+
+    def _read_command(self) -> Optional[list]:
+        line = self.rfile.readline()
+        if not line:
+            return None
+        if not line.startswith(b"*"):
+            return line.split()
+        args = []
+        for _ in range(int(line[1:-2])):
+            length = int(self.rfile.readline()[1:-2])
+            args.append(self.rfile.read(length + 2)[:-2])
+        return args
+
+    def _encode(self, reply) -> bytes:
+        if reply is None:
+            return b"$-1\r\n"
+        if isinstance(reply, Exception):
+            return b"-%s\r\n" % str(reply).encode()
+        if isinstance(reply, str):
+            return b"+%s\r\n" % reply.encode()
+        if isinstance(reply, int):
+            return b":%d\r\n" % reply
+        if isinstance(reply, bytes):
+            return b"$%d\r\n%s\r\n" % (len(reply), reply)
+        return b"*%d\r\n" % len(reply) + b"".join(self._encode(r) for r in reply)
+
+    def handle(self):
+        while True:
+            try:
+                args = self._read_command()
+            except (OSError, ValueError):
+                return
+            if not args:
+                return
+            self.wfile.write(self._encode(self.standin.execute(args)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a local Redis stand-in")
+    parser.add_argument("--port", type=int, default=6380)
+    parser.add_argument("--password", help="require AUTH with this password")
+    args = parser.parse_args()
+
+    standin = RedisStandIn(password=args.password)
+    url = standin.start(port=args.port)
+    print(f"Redis stand-in listening at {url}")
+    print("Set JIRA_CACHE_BACKEND=redis and JIRA_CACHE_URL to this address. Ctrl+C to stop.")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        standin.stop()
+
+
+if __name__ == "__main__":
+    main()
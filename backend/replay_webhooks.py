@@ -0,0 +1,125 @@
+"""
+Replay recorded Jira webhook payloads through /api/webhooks/jira.
+
+Reads JSON Lines written with JIRA_WEBHOOK_RECORD_PATH (one
+{"headers": {...}, "body": {...}} record per line; a bare payload per line
+also works) and posts each one, signed with JIRA_WEBHOOK_SECRET. By default
+the payloads go through the Flask app in-process, so the caches and issue
+mirror of this environment are updated; --url sends them to a running API.
+
+--shuffle and --repeat deliver events out of order and more than once,
+which must leave the same final state as an in-order replay.
+
+Usage:
+    python replay_webhooks.py webhooks.jsonl
+    python replay_webhooks.py webhooks.jsonl --shuffle --repeat 2
+    python replay_webhooks.py webhooks.jsonl --url http://localhost:5001
+"""
+
+import os
+import sys
+import json
+import random
+import argparse
+from collections import Counter
+
+from dotenv import load_dotenv
+
+# Add the current directory to sys.path so 'api' can be found
+sys.path.append(os.path.abspath(os.path.dirname(__file__)))
+load_dotenv(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".env"))
+
+from api.services.jira_webhooks import sign
+
+WEBHOOK_PATH = "/api/webhooks/jira"
+
+
+def load_records(path: str) -> list:
+    """Read {"headers", "body"} records from a JSON Lines file."""
+    records = []
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            record = json.loads(line)
+            if "body" not in record:
+                record = {"headers": {}, "body": record}
+            records.append(record)
+    return records
+
+
+def _http_sender(url: str):
+    import requests
+
+    def send(body: bytes, headers: dict):
+        response = requests.post(url.rstrip("/") + WEBHOOK_PATH, data=body, headers=headers, timeout=30)
+        return response.status_code, response.json()
+
+    return send
+
+
+def _app_sender():
+    from api.index import app
+
+    client = app.test_client()
+
+    def send(body: bytes, headers: dict):
+        response = client.post(WEBHOOK_PATH, data=body, headers=headers)
+        return response.status_code, response.get_json()
+
+    return send
+
+
+def replay(records: list, send, shuffle: bool = False, repeat: int = 1, seed=None) -> Counter:
+    """
+    Post recorded webhooks and count the outcomes.
+
+    Args:
+        records: Records from load_records
+        send: Callable (body, headers) -> (status_code, json)
+        shuffle: Deliver the records in random order
+        repeat: Deliver every record this many times
+        seed: Random seed for shuffle, for a reproducible order
+
+    Returns:
+        Counter of result statuses ("applied", "duplicate", "stale", ...,
+        or "http <code>" for rejected requests)
+    """
+    deliveries = [record for record in records for _ in range(max(1, repeat))]
+    if shuffle:
+        random.Random(seed).shuffle(deliveries)
+
+    outcomes = Counter()
+    for record in deliveries:
+        body = json.dumps(record["body"]).encode()
+        headers = {**record.get("headers", {}), "Content-Type": "application/json", "X-Hub-Signature": sign(body)}
+        status_code, result = send(body, headers)
+        outcomes[(result or {}).get("status") if status_code == 200 else f"http {status_code}"] += 1
+    return outcomes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("path", help="JSON Lines file of recorded webhooks")
+    parser.add_argument("--url", help="base URL of a running API (default: in-process)")
+    parser.add_argument("--shuffle", action="store_true", help="deliver in random order")
+    parser.add_argument("--repeat", type=int, default=1, help="deliver every payload this many times")
+    parser.add_argument("--seed", type=int, help="random seed for --shuffle")
+    args = parser.parse_args()
+
+    if not os.getenv("JIRA_WEBHOOK_SECRET"):
+        print("❌ JIRA_WEBHOOK_SECRET must be set to sign the payloads")
+        sys.exit(1)
+
+    records = load_records(args.path)
+    send = _http_sender(args.url) if args.url else _app_sender()
+    outcomes = replay(records, send, shuffle=args.shuffle, repeat=args.repeat, seed=args.seed)
+
+    print(f"✨ Replayed {sum(outcomes.values())} deliveries of {len(records)} payloads:")
+    for status, count in sorted(outcomes.items()):
+        print(f"   {status}: {count}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Sync worker that keeps the local issue mirror up to date with Jira.
+
+Runs alongside the API (it serves no requests). The first run backfills
+the mirror; after that each cycle reads the issues updated since the last
+one, and periodically tombstones issues that were deleted or moved out of
+the project. Run a single instance.
+
+Usage:
+    python sync_worker.py                      # sync every JIRA_SYNC_INTERVAL seconds
+    python sync_worker.py --once               # run one cycle and exit
+    python sync_worker.py --backfill           # full backfill, resuming an interrupted one
+    python sync_worker.py --backfill --restart # full backfill from the start
+"""
+
+import os
+import sys
+import time
+import logging
+import argparse
+
+from dotenv import load_dotenv
+
+# Add the current directory to sys.path so 'api' can be found
+sys.path.append(os.path.abspath(os.path.dirname(__file__)))
+load_dotenv(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".env"))
+
+from api.services.circuit_breaker import CircuitOpenError
+from api.services.jira_sync import SYNC_INTERVAL_SECONDS, run_backfill, run_cycle
+
+logger = logging.getLogger("sync_worker")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--once", action="store_true", help="run one cycle and exit")
+    parser.add_argument("--backfill", action="store_true", help="run a full backfill and exit")
+    parser.add_argument("--restart", action="store_true", help="with --backfill, ignore saved progress")
+    parser.add_argument("--interval", type=float, default=SYNC_INTERVAL_SECONDS, help="seconds between cycles")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+
+    if args.backfill:
+        result = run_backfill(restart=args.restart)
+        logger.info(f"Backfill finished: {result}")
+        return
+
+    while True:
+        delay = args.interval
+        try:
+            result = run_cycle()
+            logger.info(f"Sync cycle finished: {result}")
+        except CircuitOpenError as e:
+            # Jira is down; wait for the breaker to allow a probe
+            delay = max(delay, e.retry_after)
+            logger.warning(f"Sync cycle skipped: {e}")
+        except Exception:
+            logger.exception("Sync cycle failed")
+
+        if args.once:
+            return
+        time.sleep(delay)
+
+
+if __name__ == "__main__":
+    main()
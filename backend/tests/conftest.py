@@ -0,0 +1,82 @@
+"""Shared pytest setup for the Relay backend tests."""
+
+import os
+import sys
+import tempfile
+
+import pytest
+
+# Make the 'api' package importable when pytest runs from any directory
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+# Settings read at import time; set before any test imports the app
+_TEST_DIR = tempfile.mkdtemp(prefix="relay-tests-")
+os.environ.update({
+    "TURSO_DATABASE_URL": f"file:{os.path.join(_TEST_DIR, 'relay.db')}",
+    "JIRA_PROJECT_KEY": "RELAY",
+    "JIRA_CACHE_BACKEND": "memory",
+    "JIRA_CACHE_WARM_ON_START": "false",
+})
+os.environ.pop("TURSO_AUTH_TOKEN", None)
+
+
+@pytest.fixture(scope="session")
+def jira():
+    """A Jira stand-in the Jira clients of this process talk to."""
+    from jira_standin import JiraStandIn
+    from api.services import jira_service
+
+    standin = JiraStandIn(issues=120, comments=1, histories=2, latency_ms=0)
+    url = standin.start()
+    os.environ.update({"JIRA_URL": url, "JIRA_EMAIL": "tests@example.com", "JIRA_API_TOKEN": "token"})
+    jira_service._jira_local.__dict__.pop("client", None)
+    yield standin
+    standin.stop()
+
+
+@pytest.fixture
+def jira_cache():
+    """The shared Jira cache, emptied before and after the test."""
+    from api.services.jira_service import JIRA_CACHE, JIRA_BREAKER
+
+    JIRA_CACHE.clear()
+    JIRA_BREAKER.reset()
+    yield JIRA_CACHE
+    JIRA_CACHE.clear()
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """Flask test client signed in as the development admin."""
+    from api.index import app
+
+    monkeypatch.setenv("DEV_BYPASS_AUTH", "true")
+    test_client = app.test_client()
+    test_client.environ_base["HTTP_X_DEV_BYPASS"] = "true"
+    return test_client
+
+
+@pytest.fixture(scope="session")
+def database():
+    """The test database with the schema applied, closed after the session."""
+    from api.utils import database as db
+
+    db.init_database()
+    yield db.get_connection()
+    # Left to garbage collection at exit, the connection can hang the interpreter
+    db._connection.close()
+    db._connection = None
+
+
+@pytest.fixture
+def mirror(database):
+    """The issue mirror and webhook tables in the test database, emptied before the test."""
+    conn = database
+    tables = (
+        "issues_mirror", "issues_fts", "issues_tombstones", "issue_counters", "sync_state",
+        "webhook_deliveries", "webhook_issue_events",
+    )
+    for table in tables:
+        conn.execute(f"DELETE FROM {table}")
+    conn.commit()
+    return conn
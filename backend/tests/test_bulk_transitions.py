@@ -0,0 +1,53 @@
+"""Bulk status changes through Jira's bulk transition task."""
+
+import time
+import threading
+
+from api.services import jira_service
+from api.services.jira_service import get_issues_bulk, transition_issues_bulk
+
+
+def _keys_not_in(status: str, count: int = 3) -> list:
+    issues = get_issues_bulk([f"RELAY-{n}" for n in range(40, 60)], skip_cache=True)["issues"]
+    return [k for k, issue in issues.items() if issue["status"] != status][:count]
+
+
+def test_updated_issues_carry_the_status_as_spelled_by_jira(jira, jira_cache):
+    keys = _keys_not_in("In Progress")
+    result = transition_issues_bulk(keys, "in progress")
+    assert result["updated"] == keys
+    assert set(result["statuses"].values()) == {"In Progress"}
+    assert jira_service.transition_issue(keys[0], "to do")["status"] == "To Do"
+
+
+def test_unfinished_issues_are_pending_and_dropped_from_the_cache(jira, jira_cache, monkeypatch):
+    keys = _keys_not_in("Done")
+    monkeypatch.setattr(jira_service, "_wait_for_bulk_task", lambda task_id: {"status": "RUNNING"})
+    current = get_issues_bulk(keys)["issues"]
+    assert all(jira_service._cached_brief(k) for k in keys)
+
+    result = transition_issues_bulk(keys, "Done", current=current)
+    assert result["pending"] == keys
+    assert result["updated"] == [] and result["failed"] == {}
+    assert not any(jira_service._cached_brief(k) for k in keys)
+
+
+def test_bulk_read_accepts_non_string_keys(jira, jira_cache):
+    result = get_issues_bulk([123, None, " relay-3 "])
+    assert sorted(result["issues"]) == ["RELAY-3"]
+    assert result["missing"] == ["123"]
+
+
+def test_single_transition_fallback_stays_off_the_read_pool(jira, jira_cache, monkeypatch):
+    threads = []
+
+    def transition(issue_key, target_status, current=None):
+        threads.append(threading.current_thread().name)
+        return {"key": issue_key, "status": target_status}
+
+    monkeypatch.setattr(jira_service, "_bulk_unavailable_until", time.time() + 60)
+    monkeypatch.setattr(jira_service, "transition_issue", transition)
+    keys = _keys_not_in("Done")
+    result = transition_issues_bulk(keys, "Done")
+    assert result["updated"] == keys
+    assert threads and all(name.startswith("jira-transition") for name in threads)
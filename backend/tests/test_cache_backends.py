@@ -0,0 +1,113 @@
+"""Behaviour shared by every Jira cache store (memory, SQLite, Redis stand-in)."""
+
+import time
+
+import pytest
+
+from api.services.jira_cache import CacheBackend, TTLCache
+from api.services.cache_backends import RedisCache, SQLiteCache
+from redis_standin import RedisStandIn
+
+
+@pytest.fixture(scope="module")
+def redis_url():
+    standin = RedisStandIn(password="secret")
+    url = standin.start()
+    yield url
+    standin.stop()
+
+
+@pytest.fixture(params=["memory", "sqlite", "redis"])
+def cache(request, tmp_path):
+    options = {"ttl_seconds": 60, "sweep_interval": 0}
+    if request.param == "memory":
+        store = TTLCache(**options)
+    elif request.param == "sqlite":
+        store = SQLiteCache(path=str(tmp_path / "cache.db"), **options)
+    else:
+        store = RedisCache(request.getfixturevalue("redis_url"), prefix=f"test:{time.time_ns()}:", **options)
+    yield store
+    store.clear()
+
+
+def test_backend_interface_is_abstract():
+    with pytest.raises(TypeError):
+        CacheBackend()
+
+
+def test_set_get_delete(cache):
+    cache.set("a", {"issues": [1, 2]})
+    assert cache.get("a") == {"issues": [1, 2]}
+    assert "a" in cache
+    assert cache.delete("a") is True
+    assert cache.get("a") is None
+    assert cache.delete("a") is False
+
+
+def test_expired_entry_is_readable_only_while_stale(cache):
+    cache.set("a", "old", ttl_seconds=0.05, stale_seconds=60)
+    time.sleep(0.1)
+    assert cache.get("a") is None
+    data, age = cache.get_stale("a")
+    assert data == "old" and age > 0
+
+
+def test_tags(cache):
+    cache.set("page1", [1], tags=["issue:A", "issue:B"], meta={"status": "Open"})
+    cache.set("page2", [2], tags=["issue:B"])
+    assert sorted(key for key, _, _ in cache.entries_for_tag("issue:B")) == ["page1", "page2"]
+    assert cache.entries_for_tag("issue:A") == [("page1", [1], {"status": "Open"})]
+
+    assert cache.invalidate_tag("issue:B") == 2
+    assert cache.get("page1") is None and cache.get("page2") is None
+
+
+def test_patch_keeps_tags(cache):
+    cache.set("page", [1], tags=["issue:A"])
+    assert cache.patch("page", lambda rows: rows + [2]) is True
+    assert cache.get("page") == [1, 2]
+    assert [key for key, _, _ in cache.entries_for_tag("issue:A")] == ["page"]
+    assert cache.patch("missing", lambda rows: rows) is False
+
+
+def test_clear(cache):
+    cache.set("a", 1)
+    cache.set("b", 2, tags=["t"])
+    assert cache.clear() == 2
+    assert cache.keys() == []
+
+
+def test_sqlite_corrupt_value_is_a_miss(tmp_path):
+    cache = SQLiteCache(path=str(tmp_path / "cache.db"), sweep_interval=0)
+    cache.set("a", 1)
+    cache._conn().execute("UPDATE cache_entries SET value = ? WHERE key = 'a'", (b"not zlib",))
+    assert cache.get("a") is None
+
+
+def test_sqlite_reads_refresh_lru_position_sparingly(tmp_path):
+    cache = SQLiteCache(path=str(tmp_path / "cache.db"), sweep_interval=0)
+    cache.set("a", 1)
+    accessed = cache._conn().execute("SELECT accessed_at FROM cache_entries").fetchone()[0]
+    cache.get("a")
+    assert cache._conn().execute("SELECT accessed_at FROM cache_entries").fetchone()[0] == accessed
+
+    cache._conn().execute("UPDATE cache_entries SET accessed_at = accessed_at - 3600")
+    cache.get("a")
+    assert cache._conn().execute("SELECT accessed_at FROM cache_entries").fetchone()[0] > accessed - 1
+
+
+def test_sqlite_evicts_least_recently_used(tmp_path):
+    cache = SQLiteCache(path=str(tmp_path / "cache.db"), max_entries=2, sweep_interval=0)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache._conn().execute("UPDATE cache_entries SET accessed_at = 0 WHERE key = 'a'")
+    cache.set("c", 3)
+    assert sorted(cache.keys()) == ["b", "c"]
+
+
+def test_redis_unreachable_server_is_a_miss():
+    cache = RedisCache("redis://127.0.0.1:1", sweep_interval=0)
+    assert cache.get("a") is None
+    cache.set("a", 1)
+    assert cache.stats()["backend"] == "redis"
+
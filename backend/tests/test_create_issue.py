@@ -0,0 +1,41 @@
+"""Issue creation and its correlation label."""
+
+import pytest
+
+from api.services.jira_service import CORRELATION_LABEL_PREFIX, create_issue
+
+
+@pytest.fixture(autouse=True)
+def _drop_created_issues(jira):
+    """Keep the shared stand-in at its seeded issues for later tests."""
+    seeded = set(jira.issues)
+    yield
+    with jira.lock:
+        for key in set(jira.issues) - seeded:
+            del jira.issues[key]
+
+
+def _create():
+    return create_issue(
+        summary="Export button does nothing",
+        details="Clicking export on the report page has no effect.",
+        issue_type="Bug",
+        priority="Medium",
+        user_email="reporter@example.com",
+        browser="Firefox 131",
+        os_info="Linux",
+    )
+
+
+def test_created_issue_keeps_no_correlation_label(jira, jira_cache, mirror):
+    key = _create()["key"]
+    assert jira.issues[key]["fields"]["labels"] == ["relay-app"]
+
+
+def test_retried_create_finds_the_issue_and_drops_its_label(jira, jira_cache, mirror):
+    created = len(jira.issues)
+    # The gateway times out after Jira already created the issue
+    jira.inject_fault("POST issue", 504, apply=True)
+    key = _create()["key"]
+    assert len(jira.issues) == created + 1
+    assert not any(l.startswith(CORRELATION_LABEL_PREFIX) for l in jira.issues[key]["fields"]["labels"])
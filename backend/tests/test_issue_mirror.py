@@ -0,0 +1,112 @@
+"""Issue list queries, facet counts and counters answered from the mirror."""
+
+import pytest
+
+from api.services import issue_mirror, jira_service
+from api.services.issue_mirror import issue_tools, query_facets, query_issues, upsert_issues
+from api.services.jira_service import get_issue_facets, normalize_filters
+
+
+def _issue(number: int, summary: str, labels=(), status="To Do", priority="Medium", issue_type="Bug"):
+    day = f"2024-01-{number:02d}T12:00:00.000+0000"
+    return {
+        "id": str(10000 + number),
+        "key": f"RELAY-{number}",
+        "fields": {
+            "summary": summary,
+            "description": f"Details of {summary}",
+            "labels": list(labels),
+            "status": {"name": status},
+            "priority": {"name": priority},
+            "issuetype": {"name": issue_type},
+            "reporter": {"emailAddress": "sqa@example.com", "displayName": "SQA"},
+            "created": day,
+            "updated": day,
+        },
+    }
+
+
+@pytest.fixture
+def issues(mirror):
+    upsert_issues([
+        _issue(1, "AI suggestions are wrong", status="To Do", priority="High"),
+        _issue(2, "Email digest is late", status="Done"),
+        _issue(3, "Crash on login", labels=["ai"], issue_type="Task"),
+        _issue(4, "Mobile App freezes on the menu", status="In Progress"),
+        _issue(5, "Mobile: the app freezes", issue_type="Story"),
+        _issue(6, "Export to the new Reportsheet"),
+        _issue(7, "Menu card pricing", labels=["Pricing"]),
+    ])
+
+
+@pytest.mark.parametrize("labels, summary, expected", [
+    ([], "AI review", ["AI"]),
+    ([], "Email digest", []),
+    (["ai"], "Crash", ["AI"]),
+    ([], "mobile APP freezes", ["Mobile App"]),
+    ([], "Mobile: the app", []),
+    ([], "Reportsheet export", []),
+    ([], "Métadata missing", ["Metadata"]),
+])
+def test_tools_match_labels_and_whole_words(labels, summary, expected):
+    assert issue_tools(labels, summary) == expected
+
+
+def _keys(result: dict) -> list:
+    return sorted(issue["key"] for issue in result["issues"])
+
+
+def test_query_filters_by_tool_as_words(issues):
+    assert _keys(query_issues(normalize_filters(tool="AI"))) == ["RELAY-1", "RELAY-3"]
+    assert _keys(query_issues(normalize_filters(tool="mobile app"))) == ["RELAY-4"]
+    assert query_issues(normalize_filters(tool="Reports"))["total"] == 0
+
+
+def test_tools_outside_the_stored_list_match_the_same_way(issues):
+    assert _keys(query_issues(normalize_filters(tool="pricing"))) == ["RELAY-7"]
+    assert _keys(query_issues(normalize_filters(tool="digest"))) == ["RELAY-2"]
+    assert query_issues(normalize_filters(tool="dig"))["total"] == 0
+
+
+def test_query_orders_newest_first_and_pages(issues):
+    first = query_issues(normalize_filters(), page=1, limit=5)
+    assert [i["key"] for i in first["issues"]] == [f"RELAY-{n}" for n in (7, 6, 5, 4, 3)]
+    assert first["total"] == 7 and first["totalPages"] == 2
+    assert len(query_issues(normalize_filters(), page=2, limit=5)["issues"]) == 2
+
+
+def test_search_is_ranked_and_highlighted(issues):
+    result = query_issues(normalize_filters(search="freez"))
+    assert _keys(result) == ["RELAY-4", "RELAY-5"]
+    assert "<mark>" in result["issues"][0]["snippet"]
+
+
+def test_facets_count_each_value_under_the_other_filters(issues):
+    result = query_facets(normalize_filters(status="To Do", tool="pricing"))
+    assert result["total"] == 1
+    assert result["facets"]["tool"]["pricing"] == 1
+    assert result["facets"]["tool"]["AI"] == 2
+    assert result["facets"]["status"] == {"To Do": 1}
+    assert result["facets"]["type"] == {"Bug": 1}
+
+
+def test_facet_counts_are_cached_until_a_write_changes_them(issues, jira_cache, monkeypatch):
+    monkeypatch.setattr(issue_mirror, "is_ready", lambda: True)
+    assert get_issue_facets(status="To Do")["facets"]["status"]["Done"] == 1
+
+    # A mirror change alone does not reach the cached counts
+    issue_mirror.patch_issue("RELAY-3", {"status": "Done"})
+    assert get_issue_facets(status="To Do")["facets"]["status"]["Done"] == 1
+
+    jira_service._invalidate_issue("RELAY-3", {"status": "Done"}, sync_mirror=False, warm=False)
+    assert get_issue_facets(status="To Do")["facets"]["status"]["Done"] == 2
+
+
+def test_counters_follow_writes_and_recounts(issues):
+    summary = issue_mirror.counter_summary()
+    assert summary["total"] == 7
+    assert summary["byStatus"]["Done"] == 1
+
+    issue_mirror.patch_issue("RELAY-1", {"status": "Done"})
+    assert issue_mirror.counter_summary()["byStatus"]["Done"] == 2
+    assert issue_mirror.recount_counters()["drift"] == 0
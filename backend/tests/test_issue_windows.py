@@ -0,0 +1,110 @@
+"""Issue list pages served from cached result windows."""
+
+from concurrent.futures import Future
+
+import pytest
+
+from api.services import jira_service
+from api.services.jira_service import _page_from_window, fetch_issues
+
+
+def _window(total, rows, exact, start=0):
+    window = {"segments": [[start, [{"key": f"RELAY-{i}"} for i in range(start, start + rows)]]]}
+    if total is not None:
+        window["total"] = total
+    window["totalExact"] = exact
+    return window
+
+
+def _keys(page):
+    return [issue["key"] for issue in page["issues"]]
+
+
+def test_exact_total_cuts_the_last_page():
+    page = _page_from_window(_window(45, 45, exact=True), 40, 10, 5)
+    assert _keys(page) == [f"RELAY-{i}" for i in range(40, 45)]
+    assert page["total"] == 45 and page["totalPages"] == 5
+
+
+def test_page_past_an_exact_total_is_empty():
+    page = _page_from_window(_window(45, 45, exact=True), 50, 10, 6)
+    assert page["issues"] == [] and page["total"] == 45
+
+
+@pytest.mark.parametrize("total", [None, 0, 30])
+def test_missing_or_approximate_total_never_hides_rows(total):
+    page = _page_from_window(_window(total, 60, exact=False), 40, 20, 3)
+    assert _keys(page) == [f"RELAY-{i}" for i in range(40, 60)]
+    assert page["total"] >= 60
+
+
+def test_rows_past_an_approximate_total_are_fetched():
+    assert _page_from_window(_window(30, 30, exact=False), 30, 10, 4) is None
+
+
+def test_missing_rows_are_fetched():
+    assert _page_from_window(_window(100, 20, exact=True, start=20), 0, 20, 1) is None
+
+
+def test_pages_come_from_jira_without_a_search_total(jira, jira_cache):
+    first = fetch_issues(page=1, limit=20)
+    assert len(first["issues"]) == 20
+    assert first["total"] == 120 and first["totalPages"] == 6
+
+    last = fetch_issues(page=6, limit=20)
+    assert len(last["issues"]) == 20
+    assert fetch_issues(page=7, limit=20)["issues"] == []
+
+
+def test_lagging_approximate_count_keeps_later_pages(jira, jira_cache, monkeypatch):
+    monkeypatch.setattr(jira_service, "count_issues", lambda jql: 10)
+    first = fetch_issues(page=1, limit=20)
+    assert len(first["issues"]) == 20
+
+    second = fetch_issues(page=2, limit=20)
+    assert len(second["issues"]) == 20
+    assert second["total"] >= 40
+
+
+def test_failed_count_still_serves_rows(jira, jira_cache, monkeypatch):
+    def fail(jql):
+        raise RuntimeError("count unavailable")
+
+    monkeypatch.setattr(jira_service, "count_issues", fail)
+    page = fetch_issues(page=2, limit=20)
+    assert len(page["issues"]) == 20
+    assert page["total"] > 40
+
+
+def test_cached_window_serves_pages_without_jira(jira, jira_cache):
+    fetch_issues(page=1, limit=50)
+    before = dict(jira.requests)
+    assert len(fetch_issues(page=2, limit=20)["issues"]) == 20
+    assert jira.requests == before
+
+
+def test_deep_page_past_the_walk_limit_is_refused(jira, jira_cache, client, monkeypatch):
+    monkeypatch.setattr(jira_service, "SEARCH_MAX_SKIP_PAGES", 1)
+    with pytest.raises(jira_service.SearchDepthExceeded):
+        fetch_issues(page=6, limit=20)
+
+    response = client.get("/api/issues?page=6&limit=20")
+    assert response.status_code == 416
+    assert response.get_json()["lastReachablePage"] == 3
+
+    # Paging forward learns the tokens that bring the deep page in reach
+    assert len(fetch_issues(page=3, limit=20)["issues"]) == 20
+    assert len(fetch_issues(page=6, limit=20)["issues"]) == 20
+
+
+def test_count_is_cancelled_once_the_last_page_is_read(jira, jira_cache, monkeypatch):
+    pending = Future()
+
+    class Executor:
+        def submit(self, *args):
+            return pending
+
+    monkeypatch.setattr(jira_service, "_detail_executor", Executor())
+    page = fetch_issues(page=3, limit=50)
+    assert page["total"] == 120
+    assert pending.cancelled()
@@ -0,0 +1,23 @@
+"""Mirror reconciliation against the Jira stand-in."""
+
+from api.services.jira_sync import _CLASSIFY_LIMIT, _classify_missing
+
+
+def test_issues_still_in_relay_are_not_tombstoned(jira, jira_cache, monkeypatch):
+    monkeypatch.setitem(jira.issues["RELAY-5"]["fields"], "labels", ["relay-app"])
+    monkeypatch.setitem(jira.issues["RELAY-7"]["fields"], "description", "Reported via: Relay App")
+
+    reasons = _classify_missing(["RELAY-5", "RELAY-6", "RELAY-7", "RELAY-9999"])
+    assert reasons == {"RELAY-6": "unlabeled", "RELAY-9999": "deleted"}
+
+
+def test_issues_that_could_not_be_checked_are_not_tombstoned(jira, jira_cache):
+    # Jira keeps answering 503 through every retry
+    jira.inject_fault("GET issue", 503, times=3, headers={"Retry-After": "0"})
+    assert _classify_missing(["RELAY-9999"]) == {}
+
+
+def test_issues_past_the_lookup_limit_are_left_for_the_next_run(jira, jira_cache):
+    keys = [f"RELAY-{n}" for n in range(9000, 9000 + _CLASSIFY_LIMIT + 10)]
+    reasons = _classify_missing(keys)
+    assert reasons == {key: "deleted" for key in keys[:_CLASSIFY_LIMIT]}
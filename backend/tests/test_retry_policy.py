@@ -0,0 +1,81 @@
+"""Retry classification of upstream failures."""
+
+import pytest
+import requests
+from urllib3.exceptions import MaxRetryError, NameResolutionError, NewConnectionError, ProtocolError
+
+from api.services.circuit_breaker import CircuitOpenError
+from api.services.retry_policy import (
+    AMBIGUOUS,
+    PERMANENT,
+    TRANSIENT,
+    classify_error,
+    retry_after_seconds,
+    retry_delay,
+)
+
+
+def _requests_http_error(status: int, headers: dict = None) -> requests.exceptions.HTTPError:
+    response = requests.Response()
+    response.status_code = status
+    response.headers.update(headers or {})
+    return requests.exceptions.HTTPError(response=response)
+
+
+def _connection_error(reason: Exception) -> requests.exceptions.ConnectionError:
+    return requests.exceptions.ConnectionError(MaxRetryError(None, "/rest/api/3/issue", reason))
+
+
+def test_refused_connection_is_transient():
+    try:
+        requests.get("http://127.0.0.1:1", timeout=1)
+    except requests.exceptions.ConnectionError as e:
+        assert classify_error(e) == TRANSIENT
+
+
+@pytest.mark.parametrize("error", [
+    _connection_error(NewConnectionError(None, "Connection refused")),
+    _connection_error(NameResolutionError("jira.example.com", None, "Name or service not known")),
+    requests.exceptions.ConnectTimeout(),
+    _requests_http_error(429),
+    _requests_http_error(503),
+])
+def test_never_processed_is_transient(error):
+    assert classify_error(error) == TRANSIENT
+
+
+@pytest.mark.parametrize("error", [
+    _connection_error(ProtocolError("Connection aborted.")),
+    requests.exceptions.ConnectionError("Connection reset by peer"),
+    requests.exceptions.ReadTimeout(),
+    _requests_http_error(500),
+    _requests_http_error(502),
+])
+def test_maybe_processed_is_ambiguous(error):
+    assert classify_error(error) == AMBIGUOUS
+
+
+@pytest.mark.parametrize("error", [
+    _requests_http_error(400),
+    _requests_http_error(404),
+    CircuitOpenError("Jira", 5),
+    ValueError("bad input"),
+])
+def test_other_failures_are_permanent(error):
+    assert classify_error(error) == PERMANENT
+
+
+def test_retry_after_is_honored():
+    error = _requests_http_error(429, {"Retry-After": "7"})
+    assert retry_after_seconds(error) == 7
+    assert 7 <= retry_delay(error, attempt=0, base_delay=1) <= 8
+
+
+def test_http_date_retry_after():
+    error = _requests_http_error(503, {"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"})
+    assert retry_after_seconds(error) == 0
+
+
+def test_backoff_without_retry_after_is_capped():
+    error = _requests_http_error(503)
+    assert all(0 <= retry_delay(error, attempt=10, base_delay=1, max_delay=3) <= 3 for _ in range(50))
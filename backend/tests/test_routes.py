@@ -0,0 +1,76 @@
+"""Route error handling shared through the app's error handlers."""
+
+import pytest
+
+from api.routes import issues as issue_routes
+from api.routes import stats as stats_routes
+from api.services.circuit_breaker import CircuitOpenError
+from api.services.deadline import DeadlineExceeded
+
+
+def _raise(error):
+    def fail(*args, **kwargs):
+        raise error
+    return fail
+
+
+@pytest.mark.parametrize("module, name, path", [
+    (issue_routes, "fetch_issues", "/api/issues"),
+    (issue_routes, "get_issue", "/api/issues/RELAY-1"),
+    (stats_routes, "get_stats_summary", "/api/stats/summary"),
+])
+def test_open_circuit_is_a_503(client, monkeypatch, module, name, path):
+    monkeypatch.setattr(module, name, _raise(CircuitOpenError("Jira", 4.2)))
+    response = client.get(path)
+    assert response.status_code == 503
+    assert response.get_json()["retryAfter"] == 5
+
+
+@pytest.mark.parametrize("module, name, path", [
+    (issue_routes, "fetch_issues", "/api/issues"),
+    (stats_routes, "get_stats_summary", "/api/stats/summary"),
+])
+def test_deadline_is_a_504(client, monkeypatch, module, name, path):
+    monkeypatch.setattr(module, name, _raise(DeadlineExceeded("Jira search", 9)))
+    response = client.get(path)
+    assert response.status_code == 504
+    assert "9s request deadline" in response.get_json()["error"]
+
+
+def test_other_errors_keep_their_route_message(client, monkeypatch):
+    monkeypatch.setattr(issue_routes, "fetch_issues", _raise(RuntimeError("boom")))
+    response = client.get("/api/issues")
+    assert response.status_code == 500
+    assert response.get_json()["error"] == "Failed to fetch issues: boom"
+
+
+def test_bulk_status_reports_non_string_keys_as_failed(jira, jira_cache, client):
+    response = client.post("/api/issues/bulk/status", json={"issue_keys": [123, None], "status": "Done"})
+    assert response.status_code == 200
+    assert response.get_json()["updated"] == 0
+
+
+def test_facets_need_the_issue_mirror(client, mirror, jira_cache, monkeypatch):
+    from api.services import issue_mirror
+
+    response = client.get("/api/issues/facets?status=Done")
+    assert response.status_code == 204
+    assert response.data == b""
+
+    monkeypatch.setattr(issue_mirror, "is_ready", lambda: True)
+    response = client.get("/api/issues/facets?status=Done")
+    assert response.status_code == 200
+    assert response.get_json()["total"] == 0
+
+
+def test_stats_need_the_issue_counters(client, mirror, monkeypatch):
+    from api.services import issue_mirror
+
+    response = client.get("/api/stats/summary")
+    assert response.status_code == 204
+    assert response.data == b""
+
+    monkeypatch.setattr(issue_mirror, "counters_ready", lambda: True)
+    response = client.get("/api/stats/summary")
+    assert response.status_code == 200
+    assert response.get_json()["total"] == 0
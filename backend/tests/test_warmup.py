@@ -0,0 +1,38 @@
+"""Cache warm-up starts with the first request, never at import."""
+
+import importlib
+
+import pytest
+
+from api.services import jira_service
+
+
+@pytest.fixture
+def warmups(monkeypatch):
+    calls = []
+    monkeypatch.setattr(jira_service, "schedule_cache_warmup", lambda: calls.append(1))
+    yield calls
+    monkeypatch.delenv("JIRA_CACHE_WARM_ON_START", raising=False)
+    import api.index
+    importlib.reload(api.index)
+
+
+def _load_app():
+    import api.index
+    return importlib.reload(api.index).app
+
+
+def test_warmup_is_off_by_default(monkeypatch, warmups):
+    monkeypatch.delenv("JIRA_CACHE_WARM_ON_START", raising=False)
+    _load_app().test_client().get("/api/health")
+    assert warmups == []
+
+
+def test_warmup_waits_for_first_request(monkeypatch, warmups):
+    monkeypatch.setenv("JIRA_CACHE_WARM_ON_START", "true")
+    client = _load_app().test_client()
+    assert warmups == []
+
+    client.get("/api/health")
+    client.get("/api/health")
+    assert warmups == [1]
@@ -0,0 +1,115 @@
+"""Jira webhook ordering and de-duplication, replayed through the app."""
+
+import json
+
+import pytest
+
+from api.services import issue_mirror, jira_service, jira_webhooks
+from api.services.jira_service import JIRA_CACHE, _brief_cache_key, fetch_issues
+from api.services.jira_webhooks import TOKEN_HEADER
+from replay_webhooks import WEBHOOK_PATH, replay
+
+
+@pytest.fixture
+def send(client, mirror, jira_cache, monkeypatch):
+    monkeypatch.setattr(jira_webhooks, "WEBHOOK_SECRET", "webhook-secret")
+
+    def send(body: bytes, headers: dict):
+        response = client.post(WEBHOOK_PATH, data=body, headers=headers)
+        return response.status_code, response.get_json()
+
+    return send
+
+
+def _updated(delivery: str, version: int, key: str = "RELAY-500", field: str = "summary", **fields) -> dict:
+    """An issue_updated delivery whose issue was last changed at minute `version`."""
+    updated = f"2024-02-01T12:{version:02d}:00.000+0000"
+    body = {
+        "webhookEvent": "jira:issue_updated",
+        "timestamp": int(issue_mirror.parse_timestamp(updated) * 1000),
+        "issue": {
+            "id": "20500",
+            "key": key,
+            "fields": {
+                "summary": f"Version {version}",
+                "description": "Reported via Relay App",
+                "labels": ["relay-app"],
+                "status": {"name": "To Do"},
+                "priority": {"name": "Medium"},
+                "issuetype": {"name": "Bug"},
+                "created": "2024-02-01T12:00:00.000+0000",
+                "updated": updated,
+                **fields,
+            },
+        },
+        "changelog": {"items": [{"field": field}]},
+    }
+    return {"headers": {"X-Atlassian-Webhook-Identifier": delivery}, "body": body}
+
+
+def _mirrored_summary(key: str = "RELAY-500"):
+    row = issue_mirror.get_connection().execute(
+        "SELECT summary FROM issues_mirror WHERE issue_key = ?", (key,)
+    ).fetchone()
+    return row[0] if row else None
+
+
+def test_secret_is_accepted_in_a_header_but_not_the_url(client, send):
+    body = json.dumps(_updated("delivery-1", 1)["body"]).encode()
+    headers = {"Content-Type": "application/json"}
+
+    response = client.post(f"{WEBHOOK_PATH}?secret=webhook-secret", data=body, headers=headers)
+    assert response.status_code == 401
+
+    response = client.post(WEBHOOK_PATH, data=body, headers={**headers, TOKEN_HEADER: "webhook-secret"})
+    assert response.status_code == 200 and response.get_json()["status"] == "applied"
+
+
+def test_shuffled_and_repeated_deliveries_end_at_the_latest_event(send, monkeypatch):
+    monkeypatch.setattr(issue_mirror, "MIRROR_READS", True)
+    records = [_updated(f"delivery-{v}", v) for v in range(1, 6)]
+
+    outcomes = replay(records, send, shuffle=True, repeat=3, seed=7)
+    assert outcomes["duplicate"] == 10
+    assert outcomes["applied"] + outcomes["stale"] == 5
+    assert _mirrored_summary() == "Version 5"
+    assert JIRA_CACHE.get(_brief_cache_key("RELAY-500"))["summary"] == "Version 5"
+
+
+def test_dedup_and_ordering_survive_a_cache_clear(send):
+    assert replay([_updated("delivery-2", 2)], send) == {"applied": 1}
+    JIRA_CACHE.clear()
+
+    assert replay([_updated("delivery-2", 2)], send) == {"duplicate": 1}
+    assert replay([_updated("delivery-1", 1)], send) == {"stale": 1}
+
+
+def test_stale_event_leaves_the_newer_cached_row(send):
+    assert replay([_updated("delivery-1", 1)], send) == {"applied": 1}
+    # A later read of the issue (not a webhook) cached a newer row
+    newer = {**JIRA_CACHE.get(_brief_cache_key("RELAY-500")), "summary": "Read from Jira",
+             "updated": "2024-02-01T12:30:00.000+0000"}
+    JIRA_CACHE.set(_brief_cache_key("RELAY-500"), newer)
+
+    assert replay([_updated("delivery-2", 2)], send) == {"stale": 1}
+    assert JIRA_CACHE.get(_brief_cache_key("RELAY-500"))["summary"] == "Read from Jira"
+
+
+def test_webhooks_do_not_schedule_a_warm_up(jira, send, monkeypatch):
+    warmups = []
+    monkeypatch.setattr(jira_service, "schedule_cache_warmup", lambda *a: warmups.append(a))
+    issue = fetch_issues(page=1, limit=5)["issues"][0]
+    fetch_issues(status=issue["status"], page=1, limit=5)
+    pages = len(JIRA_CACHE.entries_for_tag(jira_service.LIST_CACHE_TAG))
+
+    status = "Done" if issue["status"] != "Done" else "To Do"
+    record = _updated("delivery-1", 1, key=issue["key"], field="status", status={"name": status})
+    assert replay([record], send) == {"applied": 1}
+    assert len(JIRA_CACHE.entries_for_tag(jira_service.LIST_CACHE_TAG)) < pages
+    assert warmups == []
+
+
+def test_no_warm_up_while_the_mirror_serves_lists(monkeypatch):
+    monkeypatch.setattr(issue_mirror, "is_ready", lambda: True)
+    jira_service.schedule_cache_warmup(delay=0)
+    assert jira_service._warmup_state["running"] is False
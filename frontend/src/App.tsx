@@ -15,7 +15,7 @@ import { IssueDetailPage } from "./pages/IssueDetail";
 import { ProfilePage } from "./pages/Profile";
 import { AdminSettingsPage } from "./pages/AdminSettings";
 import { WhitelistManagementPage } from "./pages/WhitelistManagement";
-import { CreateIssueModal, DashboardIssueList } from "./components/issues";
+import { CreateIssueModal, DashboardIssueList, DashboardStats } from "./components/issues";
 import { Radio, Bug, ListTodo, BookOpen, XCircle } from "lucide-react";
 import { checkHealth } from "./lib/api";
 
@@ -164,8 +164,13 @@ function Dashboard({ onNavigate }: { onNavigate: (path: string) => void }) {
           </button>
         </div>
 
-        {/* Recent Issues Widget */}
+        {/* Issue Totals (hidden until the server's counters are ready) */}
         <div className="mt-12 w-full max-w-3xl">
+          <DashboardStats />
+        </div>
+
+        {/* Recent Issues Widget */}
+        <div className="mt-6 w-full max-w-3xl">
           <div className="bg-white dark:bg-gray-800 rounded-xl border border-gray-200 dark:border-gray-700 p-6">
             <div className="flex items-center justify-between mb-4">
               <h2 className="text-lg font-semibold text-gray-900 dark:text-gray-100">
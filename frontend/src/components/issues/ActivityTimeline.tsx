@@ -1,8 +1,11 @@
-import { ArrowRight, User, History } from 'lucide-react';
+import { ArrowRight, User, History, Loader2 } from 'lucide-react';
 import type { IssueHistoryItem } from '../../types';
 
 interface ActivityTimelineProps {
   history: IssueHistoryItem[];
+  hasMore?: boolean;
+  isLoadingMore?: boolean;
+  onLoadMore?: () => void;
 }
 
 function formatRelativeTime(dateString: string): string {
@@ -105,7 +108,12 @@ function ActivityItem({ item }: { item: IssueHistoryItem }) {
   );
 }
 
-export function ActivityTimeline({ history }: ActivityTimelineProps) {
+export function ActivityTimeline({
+  history,
+  hasMore = false,
+  isLoadingMore = false,
+  onLoadMore,
+}: ActivityTimelineProps) {
   if (history.length === 0) {
     return (
       <div className="text-center py-8">
@@ -129,6 +137,19 @@ export function ActivityTimeline({ history }: ActivityTimelineProps) {
       {sortedHistory.map((item) => (
         <ActivityItem key={item.id} item={item} />
       ))}
+
+      {hasMore && onLoadMore && (
+        <div className="pt-4 text-center">
+          <button
+            onClick={onLoadMore}
+            disabled={isLoadingMore}
+            className="inline-flex items-center gap-2 px-3 py-1.5 text-sm font-medium text-gray-600 dark:text-gray-300 hover:text-relay-orange disabled:opacity-50 transition-colors"
+          >
+            {isLoadingMore && <Loader2 className="w-4 h-4 animate-spin" />}
+            Load older activity
+          </button>
+        </div>
+      )}
     </div>
   );
 }
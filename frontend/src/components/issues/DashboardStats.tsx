@@ -0,0 +1,50 @@
+import { useState, useEffect } from 'react';
+import { fetchStatsSummary } from '../../lib/api';
+import type { StatsSummary } from '../../types';
+
+// Statuses shown next to the total, when the summary has them
+const SHOWN_STATUSES = ['Open', 'To Do', 'In Progress', 'In Review', 'Done'];
+
+export function DashboardStats() {
+  const [summary, setSummary] = useState<StatsSummary | null>(null);
+
+  useEffect(() => {
+    async function loadSummary() {
+      try {
+        // null while the server's counters are not ready; nothing is shown
+        setSummary(await fetchStatsSummary());
+      } catch {
+        setSummary(null);
+      }
+    }
+
+    loadSummary();
+  }, []);
+
+  if (!summary) {
+    return null;
+  }
+
+  const tiles = [
+    { label: 'Total', count: summary.total },
+    ...SHOWN_STATUSES
+      .filter((status) => summary.byStatus[status] !== undefined)
+      .map((status) => ({ label: status, count: summary.byStatus[status] })),
+  ];
+
+  return (
+    <div className="grid grid-cols-2 sm:grid-cols-3 md:grid-cols-6 gap-3">
+      {tiles.map((tile) => (
+        <div
+          key={tile.label}
+          className="p-3 rounded-lg bg-gray-50 dark:bg-gray-800/50 text-center"
+        >
+          <div className="text-2xl font-semibold text-gray-900 dark:text-gray-100">
+            {tile.count}
+          </div>
+          <div className="text-xs text-gray-500 dark:text-gray-400">{tile.label}</div>
+        </div>
+      ))}
+    </div>
+  );
+}
@@ -1,6 +1,12 @@
 import { useState, useRef, useEffect } from "react";
 import { ChevronDown, X, Filter } from "lucide-react";
-import type { IssueType, IssuePriority, IssueStatus, Tool } from "../../types";
+import type {
+  IssueFacets,
+  IssueType,
+  IssuePriority,
+  IssueStatus,
+  Tool,
+} from "../../types";
 
 // Tool options for filtering by project/label
 const TOOL_OPTIONS: Tool[] = [
@@ -24,6 +30,8 @@ interface FilterBarProps {
   onTypeChange: (types: IssueType[]) => void;
   onToolChange?: (tools: Tool[]) => void;
   onClearAll: () => void;
+  // Issue counts per option, shown next to each option when available
+  facets?: IssueFacets["facets"];
 }
 
 // Jira workflow statuses
@@ -116,12 +124,26 @@ const toolColors: Record<Tool, string> = {
     "bg-emerald-100 text-emerald-700 dark:bg-emerald-900/40 dark:text-emerald-300",
 };
 
+// Count for an option (Jira's status names differ in case from the options)
+function optionCount(
+  counts: Record<string, number> | undefined,
+  option: string
+): number | undefined {
+  if (!counts) return undefined;
+  const key = option.toLowerCase();
+  return Object.entries(counts).reduce(
+    (sum, [value, count]) => (value.toLowerCase() === key ? sum + count : sum),
+    0
+  );
+}
+
 interface MultiSelectDropdownProps<T extends string> {
   label: string;
   options: T[];
   selected: T[];
   onChange: (selected: T[]) => void;
   colorMap?: Record<T, string>;
+  counts?: Record<string, number>;
 }
 
 function MultiSelectDropdown<T extends string>({
@@ -130,6 +152,7 @@ function MultiSelectDropdown<T extends string>({
   selected,
   onChange,
   colorMap,
+  counts,
 }: MultiSelectDropdownProps<T>) {
   const [isOpen, setIsOpen] = useState(false);
   const dropdownRef = useRef<HTMLDivElement>(null);
@@ -219,6 +242,11 @@ function MultiSelectDropdown<T extends string>({
               >
                 {option}
               </span>
+              {counts && (
+                <span className="ml-auto text-xs text-gray-400 dark:text-gray-500">
+                  {optionCount(counts, option)}
+                </span>
+              )}
             </button>
           ))}
         </div>
@@ -237,6 +265,7 @@ export function FilterBar({
   onTypeChange,
   onToolChange,
   onClearAll,
+  facets,
 }: FilterBarProps) {
   const totalFilters =
     selectedStatuses.length +
@@ -260,6 +289,7 @@ export function FilterBar({
           selected={selectedStatuses}
           onChange={onStatusChange}
           colorMap={statusColors}
+          counts={facets?.status}
         />
 
         <MultiSelectDropdown
@@ -268,6 +298,7 @@ export function FilterBar({
           selected={selectedPriorities}
           onChange={onPriorityChange}
           colorMap={priorityColors}
+          counts={facets?.priority}
         />
 
         <MultiSelectDropdown
@@ -276,6 +307,7 @@ export function FilterBar({
           selected={selectedTypes}
           onChange={onTypeChange}
           colorMap={typeColors}
+          counts={facets?.type}
         />
 
         {onToolChange && (
@@ -285,6 +317,7 @@ export function FilterBar({
             selected={selectedTools}
             onChange={onToolChange}
             colorMap={toolColors}
+            counts={facets?.tool}
           />
         )}
       </div>
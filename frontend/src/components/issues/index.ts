@@ -10,3 +10,4 @@ export { PriorityDropdown } from './PriorityDropdown';
 export { CreateIssueModal } from './CreateIssueModal';
 export { BulkActionBar } from './BulkActionBar';
 export { DashboardIssueList } from './DashboardIssueList';
+export { DashboardStats } from './DashboardStats';
@@ -62,6 +62,11 @@ class ApiClient {
       );
     }
 
+    // No Content: the endpoint has nothing to return (e.g. facets without the mirror)
+    if (response.status === 204) {
+      return null as T;
+    }
+
     return response.json();
   }
 
@@ -99,7 +104,13 @@ export async function checkHealth(): Promise<{ status: string }> {
 }
 
 // Issues API
-import type { Issue, IssueFilters } from "../types";
+import type {
+  Issue,
+  IssueFacets,
+  IssueFilters,
+  IssueHistoryItem,
+  StatsSummary,
+} from "../types";
 
 export interface IssuesResponse {
   issues: Issue[];
@@ -108,9 +119,9 @@ export interface IssuesResponse {
   totalPages: number;
 }
 
-export async function fetchIssues(
-  filters: IssueFilters = {}
-): Promise<IssuesResponse> {
+function filterParams(
+  filters: IssueFilters
+): Record<string, string | number | undefined> {
   const params: Record<string, string | number | undefined> = {
     page: filters.page,
     limit: filters.limit,
@@ -134,13 +145,48 @@ export async function fetchIssues(
     params.reporter = filters.reporter;
   }
 
-  return api.get<IssuesResponse>("/api/issues", params);
+  return params;
+}
+
+export async function fetchIssues(
+  filters: IssueFilters = {}
+): Promise<IssuesResponse> {
+  return api.get<IssuesResponse>("/api/issues", filterParams(filters));
+}
+
+// Resolves to null when the server has no counts to offer (no issue mirror)
+export async function fetchIssueFacets(
+  filters: IssueFilters = {}
+): Promise<IssueFacets | null> {
+  return api.get<IssueFacets | null>("/api/issues/facets", filterParams(filters));
+}
+
+// Resolves to null while the server's issue counters are not ready
+export async function fetchStatsSummary(): Promise<StatsSummary | null> {
+  return api.get<StatsSummary | null>("/api/stats/summary");
 }
 
 export async function fetchIssue(key: string): Promise<Issue> {
   return api.get<Issue>(`/api/issues/${key}`);
 }
 
+export interface IssueHistoryResponse {
+  history: IssueHistoryItem[];
+  startAt: number;
+  total: number;
+}
+
+export async function fetchIssueHistory(
+  key: string,
+  before?: number,
+  limit?: number
+): Promise<IssueHistoryResponse> {
+  return api.get<IssueHistoryResponse>(`/api/issues/${key}/history`, {
+    before,
+    limit,
+  });
+}
+
 export interface CreateIssueData {
   summary: string;
   details: string;
@@ -197,8 +243,8 @@ import type { IssueStatus } from "../types";
 export async function bulkUpdateIssueStatus(
   issueKeys: string[],
   status: IssueStatus
-): Promise<{ updated: number; failed: string[] }> {
-  return api.post<{ updated: number; failed: string[] }>(
+): Promise<{ updated: number; failed: string[]; pending: string[] }> {
+  return api.post<{ updated: number; failed: string[]; pending: string[] }>(
     "/api/issues/bulk/status",
     {
       issue_keys: issueKeys,
@@ -14,9 +14,9 @@ import {
 } from 'lucide-react';
 import ReactMarkdown from 'react-markdown';
 import { MainLayout, showToast } from '../components';
-import { fetchIssue, updateIssue, addComment } from '../lib/api';
+import { fetchIssue, fetchIssueHistory, updateIssue, addComment } from '../lib/api';
 import { useAuth } from '../hooks/useAuth';
-import type { Issue, IssueType, IssuePriority, IssueStatus } from '../types';
+import type { Issue, IssueHistoryItem, IssueType, IssuePriority, IssueStatus } from '../types';
 
 // Components
 import { CommentList } from '../components/issues/CommentList';
@@ -81,6 +81,15 @@ function formatRelativeTime(dateString: string): string {
   return date.toLocaleDateString();
 }
 
+// Combine history entries from several loads, dropping duplicates
+function mergeHistory(
+  current: IssueHistoryItem[],
+  incoming: IssueHistoryItem[]
+): IssueHistoryItem[] {
+  const seen = new Set(current.map((item) => item.id));
+  return [...current, ...incoming.filter((item) => !seen.has(item.id))];
+}
+
 function LoadingSkeleton() {
   return (
     <div className="animate-pulse space-y-6">
@@ -103,6 +112,12 @@ export function IssueDetailPage({ issueKey, onBack }: IssueDetailPageProps) {
   const [isRefreshing, setIsRefreshing] = useState(false);
   const [activeTab, setActiveTab] = useState<'comments' | 'activity'>('comments');
 
+  // The issue only carries its newest history entries. Entries from every
+  // load are kept here so refreshes never drop older activity already shown.
+  const [history, setHistory] = useState<IssueHistoryItem[]>([]);
+  const [historyStartAt, setHistoryStartAt] = useState<number | null>(null);
+  const [isLoadingHistory, setIsLoadingHistory] = useState(false);
+
   const canEdit = hasRole(['admin', 'sqa']);
   const isReporter = issue?.reporter?.email?.toLowerCase() === user?.email?.toLowerCase();
 
@@ -127,6 +142,41 @@ export function IssueDetailPage({ issueKey, onBack }: IssueDetailPageProps) {
     loadIssue();
   }, [loadIssue]);
 
+  useEffect(() => {
+    setHistory([]);
+    setHistoryStartAt(null);
+  }, [issueKey]);
+
+  useEffect(() => {
+    if (!issue) return;
+    setHistory((current) => mergeHistory(current, issue.history || []));
+    setHistoryStartAt((current) =>
+      current === null
+        ? issue.historyStartAt ?? 0
+        : Math.min(current, issue.historyStartAt ?? 0)
+    );
+  }, [issue]);
+
+  // Load the page of history just before the oldest entry shown
+  const handleLoadOlderHistory = async () => {
+    if (!historyStartAt) return;
+
+    setIsLoadingHistory(true);
+    try {
+      const page = await fetchIssueHistory(issueKey, historyStartAt);
+      setHistory((current) => mergeHistory(current, page.history));
+      setHistoryStartAt(page.startAt);
+    } catch (err) {
+      showToast({
+        type: 'error',
+        title: 'Failed to load activity',
+        message: err instanceof Error ? err.message : 'Failed to load older activity',
+      });
+    } finally {
+      setIsLoadingHistory(false);
+    }
+  };
+
   // Auto-refresh every 30 seconds when tab is active
   useEffect(() => {
     let interval: ReturnType<typeof setInterval> | null = null;
@@ -389,7 +439,7 @@ export function IssueDetailPage({ issueKey, onBack }: IssueDetailPageProps) {
                       : 'text-gray-500 hover:text-gray-700 dark:hover:text-gray-300'
                   }`}
                 >
-                  Activity ({issue.history?.length || 0})
+                  Activity ({issue.historyTotal ?? issue.history?.length ?? 0})
                 </button>
               </div>
 
@@ -401,7 +451,12 @@ export function IssueDetailPage({ issueKey, onBack }: IssueDetailPageProps) {
                     <CommentList comments={issue.comments || []} />
                   </div>
                 ) : (
-                  <ActivityTimeline history={issue.history || []} />
+                  <ActivityTimeline
+                    history={history}
+                    hasMore={!!historyStartAt}
+                    isLoadingMore={isLoadingHistory}
+                    onLoadMore={handleLoadOlderHistory}
+                  />
                 )}
               </div>
             </div>
@@ -11,12 +11,14 @@ import {
 } from "../components/issues";
 import {
   fetchIssues,
+  fetchIssueFacets,
   bulkUpdateIssueStatus,
   type IssuesResponse,
 } from "../lib/api";
 import { useAuth } from "../hooks/useAuth";
 import type {
   Issue,
+  IssueFacets,
   IssueType,
   IssuePriority,
   IssueStatus,
@@ -113,6 +115,7 @@ export function IssuesPage() {
 
   // Last updated timestamp
   const [lastUpdated, setLastUpdated] = useState<Date | null>(null);
+  const [facets, setFacets] = useState<IssueFacets["facets"] | undefined>();
 
   // Fetch issues
   const loadIssues = useCallback(async () => {
@@ -155,6 +158,35 @@ export function IssuesPage() {
     loadIssues();
   }, [loadIssues]);
 
+  // Option counts for the filter dropdowns (not needed per page)
+  useEffect(() => {
+    let cancelled = false;
+    fetchIssueFacets({
+      status: selectedStatuses.length > 0 ? selectedStatuses : undefined,
+      priority: selectedPriorities.length > 0 ? selectedPriorities : undefined,
+      type: selectedTypes.length > 0 ? selectedTypes : undefined,
+      tool: selectedTools.length > 0 ? selectedTools : undefined,
+      search: searchQuery || undefined,
+    })
+      .then((response) => {
+        // No counts available: FilterBar shows the options without them
+        if (!cancelled) setFacets(response?.facets);
+      })
+      .catch(() => {
+        // Counts are optional; the filters work without them
+        if (!cancelled) setFacets(undefined);
+      });
+    return () => {
+      cancelled = true;
+    };
+  }, [
+    selectedStatuses,
+    selectedPriorities,
+    selectedTypes,
+    selectedTools,
+    searchQuery,
+  ]);
+
   // Update URL when filters change
   useEffect(() => {
     updateUrlFilters({
@@ -277,6 +309,12 @@ export function IssuesPage() {
             title: "Partial update",
             message: `${result.updated} updated, ${result.failed.length} failed`,
           });
+        } else if (result.pending.length > 0) {
+          showToast({
+            type: "info",
+            title: "Bulk update in progress",
+            message: `${result.updated} updated, ${result.pending.length} still processing in Jira`,
+          });
         } else {
           showToast({
             type: "success",
@@ -386,6 +424,7 @@ export function IssuesPage() {
             selectedTools={selectedTools}
             onToolChange={handleToolChange}
             onClearAll={handleClearAll}
+            facets={facets}
           />
         </div>
 
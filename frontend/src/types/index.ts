@@ -60,6 +60,12 @@ export interface Issue {
   attachments?: Attachment[];
   comments?: IssueComment[];
   history?: IssueHistoryItem[];
+  // Offset of the first entry in `history` and the total number of entries;
+  // older entries are loaded on demand with fetchIssueHistory
+  historyStartAt?: number;
+  historyTotal?: number;
+  // Best matching text of a search result, HTML-escaped with matches in <mark>
+  snippet?: string;
 }
 
 export interface IssueHistoryItem {
@@ -117,6 +123,28 @@ export interface IssueFilters {
   limit?: number;
 }
 
+// Issue counts per filter option; each facet ignores its own selection
+export interface IssueFacets {
+  total: number;
+  facets: {
+    status: Record<string, number>;
+    priority: Record<string, number>;
+    type: Record<string, number>;
+    tool: Record<string, number>;
+  };
+}
+
+// Dashboard totals from /api/stats/summary
+export interface StatsSummary {
+  total: number;
+  byStatus: Record<string, number>;
+  byPriority: Record<string, number>;
+  byType: Record<string, number>;
+  byStatusAndType: Record<string, Record<string, number>>;
+  byStatusAndPriority: Record<string, Record<string, number>>;
+  byPriorityAndType: Record<string, Record<string, number>>;
+}
+
 // Whitelist types
 export interface WhitelistEmail {
   id: number;